@@ -6,6 +6,9 @@ from .logtools import *
 from .utils import *
 from .indexlist import IndexList
 from .snapshotlist import SnapshotList
+from .fieldstatscache import FieldStatsCache
+from .indexsnapshot import IndexSnapshot
+from .nodetopology import NodeTopology
 from .actions import *
 from .cli import *
 from .repomgrcli import *
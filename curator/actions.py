@@ -1,9 +1,15 @@
 import logging
 import re
+import threading
 import time
+from collections import deque, OrderedDict
 from copy import deepcopy
 from datetime import datetime
+from multiprocessing.pool import ThreadPool
+from six.moves.queue import Empty, Queue
 from curator import exceptions, utils
+from curator.defaults import settings
+from curator.nodetopology import NodeTopology
 
 class Alias(object):
     def __init__(self, name=None, extra_settings={}, **kwargs):
@@ -29,6 +35,10 @@ class Alias(object):
         #: The Elasticsearch Client object derived from `ilo`
         self.client  = None
         #: Instance variable.
+        #: The :class:`curator.indexlist.IndexList` objects passed to `add` and
+        #: `remove`, whose alias maps are updated by `do_action`.
+        self.index_lists = []
+        #: Instance variable.
         #: Any extra things to add to the alias, like filters, or routing.
         self.extra_settings = extra_settings
         self.loggit  = logging.getLogger('curator.actions.alias')
@@ -47,6 +57,8 @@ class Alias(object):
         utils.verify_index_list(ilo)
         if not self.client:
             self.client = ilo.client
+        if ilo not in self.index_lists:
+            self.index_lists.append(ilo)
         self.name = utils.parse_datemath(self.client, self.name)
         try:
             ilo.empty_list_check()
@@ -81,6 +93,8 @@ class Alias(object):
         utils.verify_index_list(ilo)
         if not self.client:
             self.client = ilo.client
+        if ilo not in self.index_lists:
+            self.index_lists.append(ilo)
         self.name = utils.parse_datemath(self.client, self.name)
         try:
             ilo.empty_list_check()
@@ -96,24 +110,22 @@ class Alias(object):
             else:
                 # Re-raise the exceptions.NoIndices so it will behave as before
                 raise exceptions.NoIndices('No indices to remove from alias')
-        aliases = self.client.indices.get_alias()
+        ilo.load_aliases()
+        members = ilo.alias_indices.get(self.name, set())
         for index in ilo.working_list():
-            if index in aliases:
+            # Only remove if the index is associated with the alias
+            if index in members:
                 self.loggit.debug(
-                    'Index {0} in get_aliases output'.format(index))
-                # Only remove if the index is associated with the alias
-                if self.name in aliases[index]['aliases']:
-                    self.loggit.debug(
-                        'Removing index {0} from alias '
-                        '{1}'.format(index, self.name)
-                    )
-                    self.actions.append(
-                        { 'remove' : { 'index' : index, 'alias': self.name } })
-                else:
-                    self.loggit.debug(
-                        'Can not remove: Index {0} is not associated with alias'
-                        ' {1}'.format(index, self.name)
-                    )
+                    'Removing index {0} from alias '
+                    '{1}'.format(index, self.name)
+                )
+                self.actions.append(
+                    { 'remove' : { 'index' : index, 'alias': self.name } })
+            else:
+                self.loggit.debug(
+                    'Can not remove: Index {0} is not associated with alias'
+                    ' {1}'.format(index, self.name)
+                )
 
     def body(self):
         """
@@ -158,6 +170,8 @@ class Alias(object):
         self.loggit.info('Alias actions: {0}'.format(self.body()))
         try:
             self.client.indices.update_aliases(body=self.body())
+            for ilo in self.index_lists:
+                ilo.apply_alias_actions(self.actions)
         except Exception as e:
             utils.report_failure(e)
 
@@ -177,7 +191,7 @@ class Allocation(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `False`)
         :type wait_for_completion: bool
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
 
@@ -209,7 +223,7 @@ class Allocation(object):
         #: Internal reference to `wait_for_completion`
         self.wfc        = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -235,31 +249,34 @@ class Allocation(object):
         self.index_list.empty_list_check()
 
         self.loggit.info('Updating index setting {0}'.format(self.body))
-        try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                self.client.indices.put_settings(
-                    index=utils.to_csv(l), body=self.body
+        def allocate(l):
+            self.client.indices.put_settings(
+                index=utils.to_csv(l), body=self.body
+            )
+            self.index_list.refresh_settings(l)
+            if self.wfc:
+                self.loggit.debug(
+                    'Waiting for shards to complete relocation for indices:'
+                    ' {0}'.format(utils.to_csv(l))
                 )
-                if self.wfc:
-                    self.loggit.debug(
-                        'Waiting for shards to complete relocation for indices:'
-                        ' {0}'.format(utils.to_csv(l))
-                    )
-                    utils.wait_for_it(
-                        self.client, 'allocation',
-                        wait_interval=self.wait_interval, max_wait=self.max_wait
-                    )
+                utils.wait_for_it(
+                    self.client, 'allocation',
+                    wait_interval=self.wait_interval, max_wait=self.max_wait
+                )
+        try:
+            utils.chunked_requests(self.index_list.indices, allocate)
         except Exception as e:
             utils.report_failure(e)
 
 class Close(object):
-    def __init__(self, ilo, delete_aliases=False):
+    def __init__(self, ilo, delete_aliases=False, max_concurrent_chunks=1):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
         :arg delete_aliases: If `True`, will delete any associated aliases
             before closing indices.
         :type delete_aliases: bool
+        :arg max_concurrent_chunks: The largest number of chunks of indices
+            closed at the same time.  Default: ``1``
         """
         utils.verify_index_list(ilo)
         #: Instance variable.
@@ -269,6 +286,9 @@ class Close(object):
         #: Internal reference to `delete_aliases`
         self.delete_aliases = delete_aliases
         #: Instance variable.
+        #: Internal reference to `max_concurrent_chunks`
+        self.max_concurrent_chunks = max_concurrent_chunks
+        #: Instance variable.
         #: The Elasticsearch Client object derived from `ilo`
         self.client     = ilo.client
         self.loggit     = logging.getLogger('curator.actions.close')
@@ -289,25 +309,31 @@ class Close(object):
         self.index_list.empty_list_check()
         self.loggit.info(
             'Closing selected indices: {0}'.format(self.index_list.indices))
+        def close(l):
+            if self.delete_aliases:
+                self.loggit.info(
+                    'Deleting aliases from indices before closing.')
+                self.loggit.debug('Deleting aliases from: {0}'.format(l))
+                try:
+                    self.client.indices.delete_alias(
+                        index=utils.to_csv(l), name='_all')
+                except Exception as e:
+                    self.loggit.warn(
+                        'Some indices may not have had aliases.  Exception:'
+                        ' {0}'.format(e)
+                    )
+                self.index_list.refresh_aliases()
+            self.client.indices.flush_synced(
+                index=utils.to_csv(l), ignore_unavailable=True)
+            self.client.indices.close(
+                index=utils.to_csv(l), ignore_unavailable=True)
+            self.index_list.mark_changed(l)
+            return len(l)
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                if self.delete_aliases:
-                    self.loggit.info(
-                        'Deleting aliases from indices before closing.')
-                    self.loggit.debug('Deleting aliases from: {0}'.format(l))
-                    try:
-                        self.client.indices.delete_alias(
-                            index=utils.to_csv(l), name='_all')
-                    except Exception as e:
-                        self.loggit.warn(
-                            'Some indices may not have had aliases.  Exception:'
-                            ' {0}'.format(e)
-                        )
-                self.client.indices.flush_synced(
-                    index=utils.to_csv(l), ignore_unavailable=True)
-                self.client.indices.close(
-                    index=utils.to_csv(l), ignore_unavailable=True)
+            closed = utils.chunked_requests(
+                self.index_list.indices, close, self.max_concurrent_chunks)
+            self.loggit.info('Closed {0} indices in {1} chunks'.format(
+                sum(closed), len(closed)))
         except Exception as e:
             utils.report_failure(e)
 
@@ -332,7 +358,7 @@ class ClusterRouting(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `False`)
         :type wait_for_completion: bool
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         """
@@ -345,7 +371,7 @@ class ClusterRouting(object):
         #: Internal reference to `wait_for_completion`
         self.wfc     = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -452,10 +478,12 @@ class CreateIndex(object):
             utils.report_failure(e)
 
 class DeleteIndices(object):
-    def __init__(self, ilo, master_timeout=30):
+    def __init__(self, ilo, master_timeout=30, max_concurrent_chunks=1):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
         :arg master_timeout: Number of seconds to wait for master node response
+        :arg max_concurrent_chunks: The largest number of chunks of indices
+            deleted at the same time.  Default: ``1``
         """
         utils.verify_index_list(ilo)
         if not isinstance(master_timeout, int):
@@ -472,6 +500,9 @@ class DeleteIndices(object):
         #: Instance variable.
         #: String value of `master_timeout` + 's', for seconds.
         self.master_timeout = str(master_timeout) + 's'
+        #: Instance variable.
+        #: Internal reference to `max_concurrent_chunks`
+        self.max_concurrent_chunks = max_concurrent_chunks
         self.loggit         = logging.getLogger('curator.actions.delete_indices')
         self.loggit.debug('master_timeout value: {0}'.format(
             self.master_timeout))
@@ -499,25 +530,35 @@ class DeleteIndices(object):
 
     def __chunk_loop(self, chunk_list):
         """
-        Loop through deletes 3 times to ensure they complete
+        Loop through deletes 3 times to ensure they complete, and return the
+        indices which could not be deleted.
         :arg chunk_list: A list of indices pre-chunked so it won't overload the
             URL size limit.
         """
         working_list = chunk_list
         for count in range(1, 4): # Try 3 times
+            if count > 1:
+                delay = settings.delete_retry_backoff() * 2 ** (count - 2)
+                self.loggit.info(
+                    'Waiting {0} seconds before trying again...'.format(delay))
+                time.sleep(delay)
             for i in working_list:
                 self.loggit.info("---deleting index {0}".format(i))
             self.client.indices.delete(
                 index=utils.to_csv(working_list), master_timeout=self.master_timeout)
-            result = [ i for i in working_list if i in utils.get_indices(self.client)]
+            existing = utils.existing_indices(self.client, working_list)
+            result = [ i for i in working_list if i in existing ]
+            self.index_list.mark_deleted(
+                [i for i in working_list if i not in result])
             if self._verify_result(result, count):
-                return
+                return []
             else:
                 working_list = result
         self.loggit.error(
             'Unable to delete the following indices after 3 attempts: '
             '{0}'.format(result)
         )
+        return result
 
     def do_dry_run(self):
         """
@@ -533,18 +574,32 @@ class DeleteIndices(object):
         self.loggit.info(
             'Deleting selected indices: {0}'.format(self.index_list.indices))
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                self.__chunk_loop(l)
+            failed = utils.chunked_requests(
+                self.index_list.indices, self.__chunk_loop,
+                self.max_concurrent_chunks
+            )
+            failed = [index for chunk in failed for index in chunk]
+            self.loggit.info('Deleted {0} of {1} indices'.format(
+                len(self.index_list.indices) - len(failed),
+                len(self.index_list.indices))
+            )
         except Exception as e:
             utils.report_failure(e)
 
 class ForceMerge(object):
-    def __init__(self, ilo, max_num_segments=None, delay=0):
+    def __init__(self, ilo, max_num_segments=None, delay=0,
+        max_merges_per_node=0, max_duration=0):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
         :arg max_num_segments: Number of segments per shard to forceMerge
         :arg delay: Number of seconds to delay between forceMerge operations
+        :arg max_merges_per_node: Largest number of forceMerges running at the
+            same time on each node holding primary shards of the indices.  The
+            default, ``0``, merges one index at a time, pausing `delay` seconds
+            after each.
+        :arg max_duration: Number of seconds after which no more forceMerges
+            are started.  Those already running are waited for.  The default,
+            ``0``, is no limit.
         """
         utils.verify_index_list(ilo)
         if not max_num_segments:
@@ -561,6 +616,12 @@ class ForceMerge(object):
         #: Instance variable.
         #: Internally accessible copy of `delay`
         self.delay = delay
+        #: Instance variable.
+        #: Internally accessible copy of `max_merges_per_node`
+        self.max_merges_per_node = max_merges_per_node
+        #: Instance variable.
+        #: Internally accessible copy of `max_duration`
+        self.max_duration = max_duration
         self.loggit = logging.getLogger('curator.actions.forcemerge')
 
     def do_dry_run(self):
@@ -571,6 +632,232 @@ class ForceMerge(object):
             self.index_list, 'forcemerge',
             max_num_segments=self.max_num_segments,
             delay=self.delay,
+            max_merges_per_node=self.max_merges_per_node,
+            max_duration=self.max_duration,
+        )
+
+    def _merge_benefit(self, index):
+        """
+        Estimate how worthwhile merging `index` is: the segments per shard copy
+        above `max_num_segments`, weighted up by the share of deleted docs
+        which the merge reclaims, and down by the index size, which the merge
+        time grows with.
+
+        :arg index: An index name
+        :rtype: float
+        """
+        info = self.index_list.index_info[index]
+        copies = max(
+            int(info['number_of_shards']) *
+            (1 + int(info['number_of_replicas'])), 1
+        )
+        excess = max(
+            float(info['segments']) / copies - self.max_num_segments, 0.0)
+        all_docs = info['docs'] + info['deleted_docs']
+        deleted_ratio = float(info['deleted_docs']) / all_docs if all_docs else 0
+        size_in_gb = float(info['size_in_bytes']) / 1024 ** 3
+        return excess * (1 + deleted_ratio) / (1 + size_in_gb)
+
+    def _by_benefit(self, indices):
+        """
+        Return `indices` ordered by :py:meth:`_merge_benefit`, highest first.
+        """
+        self.index_list.load_index_info(
+            'number_of_shards', 'number_of_replicas', 'segments',
+            'size_in_bytes', 'docs', 'deleted_docs'
+        )
+        benefit = dict((index, self._merge_benefit(index)) for index in indices)
+        ordered = sorted(indices, key=lambda index: -benefit[index])
+        self.loggit.debug(
+            'forceMerge order by expected benefit: {0}'.format(
+                ', '.join(
+                    '{0} ({1:.2f})'.format(index, benefit[index])
+                    for index in ordered
+                )
+            )
+        )
+        return ordered
+
+    def _out_of_time(self, started):
+        """
+        Return `True` if `max_duration` seconds have passed since `started`.
+        """
+        return (
+            self.max_duration > 0 and
+            time.time() - started >= self.max_duration
+        )
+
+    def _primary_nodes(self, indices):
+        """
+        Return the ids of the nodes holding primary shards of each of
+        `indices`, read from the routing table.  Indices with no assigned
+        primaries map to ``_unassigned``.
+
+        :arg indices: A list of index names
+        :rtype: dict
+        """
+        def routing(data):
+            return self.client.cluster.state(
+                metric='routing_table', index=utils.to_csv(data),
+                filter_path=settings.primary_routing_filter_path()
+            )
+        nodes = dict((index, set()) for index in indices)
+        for response in utils.chunked_requests(indices, routing):
+            tables = (response or {}).get('routing_table', {}).get('indices', {})
+            for index, table in tables.items():
+                if index not in nodes:
+                    continue
+                for copies in table.get('shards', {}).values():
+                    for copy in copies:
+                        if copy.get('primary') and copy.get('node'):
+                            nodes[index].add(copy['node'])
+        for index in indices:
+            if not nodes[index]:
+                nodes[index].add('_unassigned')
+        return nodes
+
+    def _merge_in_turn(self, indices, started):
+        """
+        forceMerge `indices` one at a time, pausing `delay` seconds after each,
+        and return those merged before `max_duration` ran out.
+        """
+        merged = []
+        for index_name in indices:
+            if self._out_of_time(started):
+                break
+            self.loggit.info(
+                'forceMerging index {0} to {1} segments per shard.  '
+                'Please wait...'.format(index_name, self.max_num_segments)
+            )
+            self.client.indices.forcemerge(index=index_name,
+                max_num_segments=self.max_num_segments)
+            self.index_list.mark_changed([index_name])
+            merged.append(index_name)
+            if self.delay > 0:
+                self.loggit.info(
+                    'Pausing for {0} seconds before continuing...'.format(
+                        self.delay)
+                )
+                time.sleep(self.delay)
+        return merged
+
+    def _merge_concurrently(self, indices, started):
+        """
+        forceMerge `indices` with up to `max_merges_per_node` merges running
+        on each node holding their primaries, and no more than
+        ``settings.forcemerge_max_threads()`` in all, starting them in the
+        order given, and return those merged before `max_duration` ran out.
+        Elasticsearch only answers a forceMerge when it is done, so each
+        running merge holds a thread, and a connection, waiting for its
+        response.
+        """
+        nodes = self._primary_nodes(indices)
+        # Indices whose primaries are on the same nodes wait in the same
+        # queue, so a scheduling pass only looks at the head of each queue.
+        queues = OrderedDict()
+        for index in indices:
+            queues.setdefault(frozenset(nodes[index]), deque()).append(index)
+        load = dict((node, 0) for held in queues for node in held)
+        threads = min(
+            len(indices), self.max_merges_per_node * len(load),
+            settings.forcemerge_max_threads()
+        )
+        pool = ThreadPool(threads)
+        finished = Queue()
+        running = set()
+        merged = []
+        failures = {}
+        self.loggit.info(
+            'forceMerging {0} indices with up to {1} merges per node on {2} '
+            'nodes, and up to {3} at once'.format(
+                len(indices), self.max_merges_per_node, len(load), threads)
+        )
+        try:
+            while queues or running:
+                if queues and self._out_of_time(started):
+                    queues.clear()
+                for held in list(queues):
+                    while queues[held] and len(running) < threads and all(
+                            load[node] < self.max_merges_per_node
+                            for node in held):
+                        index = queues[held].popleft()
+                        for node in held:
+                            load[node] += 1
+                        running.add(index)
+                        self._start_merge(index, pool, finished)
+                    if not queues[held]:
+                        del queues[held]
+                for index, error in self._finished_merges(finished):
+                    running.discard(index)
+                    for node in nodes[index]:
+                        load[node] -= 1
+                    self.index_list.mark_changed([index])
+                    if error is not None:
+                        self.loggit.error(
+                            'forceMerge of index {0} failed: {1}'.format(
+                                index, error)
+                        )
+                        failures[index] = error
+                    else:
+                        merged.append(index)
+        finally:
+            pool.close()
+            pool.join()
+        if failures:
+            raise exceptions.FailedExecution(
+                'forceMerge failed for {0} of {1} indices: {2}'.format(
+                    len(failures), len(indices), failures)
+            )
+        return merged
+
+    def _start_merge(self, index, pool, finished):
+        """
+        Start a forceMerge of `index` in `pool`, and put ``(index, error)``
+        in `finished` when it is done.
+        """
+        self.loggit.info(
+            'forceMerging index {0} to {1} segments per shard'.format(
+                index, self.max_num_segments)
+        )
+        def merge():
+            try:
+                self.client.indices.forcemerge(
+                    index=index, max_num_segments=self.max_num_segments)
+                finished.put((index, None))
+            except Exception as e:
+                finished.put((index, e))
+        pool.apply_async(merge)
+
+    def _finished_merges(self, finished):
+        """
+        Wait until at least one running merge is done, and return a list of
+        ``(index, error)`` for every merge which has finished.
+        """
+        done = [finished.get()]
+        while True:
+            try:
+                done.append(finished.get_nowait())
+            except Empty:
+                return done
+
+    def _report_throughput(self, indices, segments_before, elapsed):
+        """
+        Log how many indices were merged, and segments removed, per minute.
+        """
+        self.index_list.load_index_info('segments')
+        segments_after = sum(
+            int(self.index_list.index_info[index]['segments'])
+            for index in indices
+        )
+        minutes = max(elapsed, 0.001) / 60.0
+        self.loggit.info(
+            'forceMerged {0} indices in {1:.1f} seconds, reducing {2} '
+            'segments to {3}: {4:.1f} indices and {5:.0f} segments per '
+            'minute'.format(
+                len(indices), elapsed, segments_before, segments_after,
+                len(indices) / minutes,
+                (segments_before - segments_after) / minutes
+            )
         )
 
     def do_action(self):
@@ -582,22 +869,30 @@ class ForceMerge(object):
             max_num_segments=self.max_num_segments)
         self.index_list.empty_list_check()
         self.loggit.info('forceMerging selected indices')
+        indices = self._by_benefit(self.index_list.indices)
+        segments = dict(
+            (index, int(self.index_list.index_info[index]['segments']))
+            for index in indices
+        )
+        started = time.time()
         try:
-            for index_name in self.index_list.indices:
-                self.loggit.info(
-                    'forceMerging index {0} to {1} segments per shard.  '
-                    'Please wait...'.format(index_name, self.max_num_segments)
-                )
-                self.client.indices.forcemerge(index=index_name,
-                    max_num_segments=self.max_num_segments)
-                if self.delay > 0:
-                    self.loggit.info(
-                        'Pausing for {0} seconds before continuing...'.format(
-                            self.delay)
-                    )
-                    time.sleep(self.delay)
+            if self.max_merges_per_node > 0:
+                merged = self._merge_concurrently(indices, started)
+            else:
+                merged = self._merge_in_turn(indices, started)
         except Exception as e:
             utils.report_failure(e)
+        if len(merged) < len(indices):
+            self.loggit.warning(
+                'max_duration of {0} seconds reached.  {1} of {2} indices were '
+                'not forceMerged.'.format(
+                    self.max_duration, len(indices) - len(merged), len(indices))
+            )
+        if merged:
+            self._report_throughput(
+                merged, sum(segments[index] for index in merged),
+                time.time() - started
+            )
 
 class IndexSettings(object):
     def __init__(self, ilo, index_settings={}, ignore_unavailable=False,
@@ -670,6 +965,7 @@ class IndexSettings(object):
         # Detect if even one index is open.  Save all found to open_index_list.
         open_index_list = []
         open_indices = False
+        self.index_list.load_index_info('state')
         for idx in self.index_list.indices:
             if self.index_list.index_info[idx]['state'] == 'open':
                 open_index_list.append(idx)
@@ -711,23 +1007,26 @@ class IndexSettings(object):
             'Applying index settings to indices: '
             '{0}'.format(self.index_list.indices)
         )
+        def put_settings(l):
+            response = self.client.indices.put_settings(
+                index=utils.to_csv(l), body=self.body,
+                ignore_unavailable=self.ignore_unavailable,
+                preserve_existing=self.preserve_existing
+            )
+            self.loggit.debug('PUT SETTINGS RESPONSE: {0}'.format(response))
+            self.index_list.refresh_settings(l)
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                response = self.client.indices.put_settings(
-                    index=utils.to_csv(l), body=self.body,
-                    ignore_unavailable=self.ignore_unavailable,
-                    preserve_existing=self.preserve_existing
-                )
-                self.loggit.debug('PUT SETTINGS RESPONSE: {0}'.format(response))
+            utils.chunked_requests(self.index_list.indices, put_settings)
         except Exception as e:
             utils.report_failure(e)
 
 
 class Open(object):
-    def __init__(self, ilo):
+    def __init__(self, ilo, max_concurrent_chunks=1):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
+        :arg max_concurrent_chunks: The largest number of chunks of indices
+            opened at the same time.  Default: ``1``
         """
         utils.verify_index_list(ilo)
         #: Instance variable.
@@ -736,6 +1035,9 @@ class Open(object):
         #: Instance variable.
         #: Internal reference to `ilo`
         self.index_list = ilo
+        #: Instance variable.
+        #: Internal reference to `max_concurrent_chunks`
+        self.max_concurrent_chunks = max_concurrent_chunks
         self.loggit     = logging.getLogger('curator.actions.open')
 
     def do_dry_run(self):
@@ -751,10 +1053,17 @@ class Open(object):
         self.index_list.empty_list_check()
         self.loggit.info(
             'Opening selected indices: {0}'.format(self.index_list.indices))
+        def open_indices(l):
+            self.client.indices.open(index=utils.to_csv(l))
+            self.index_list.mark_changed(l)
+            return len(l)
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                self.client.indices.open(index=utils.to_csv(l))
+            opened = utils.chunked_requests(
+                self.index_list.indices, open_indices,
+                self.max_concurrent_chunks
+            )
+            self.loggit.info('Opened {0} indices in {1} chunks'.format(
+                sum(opened), len(opened)))
         except Exception as e:
             utils.report_failure(e)
 
@@ -767,7 +1076,7 @@ class Replicas(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `False`)
         :type wait_for_completion: bool
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         """
@@ -790,7 +1099,7 @@ class Replicas(object):
         #: Internal reference to `wait_for_completion`
         self.wfc        = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -818,20 +1127,21 @@ class Replicas(object):
             'Setting the replica count to {0} for indices: '
             '{1}'.format(self.count, self.index_list.indices)
         )
+        def set_replicas(l):
+            self.client.indices.put_settings(index=utils.to_csv(l),
+                body={'number_of_replicas' : self.count})
+            self.index_list.refresh_settings(l)
+            if self.wfc and self.count > 0:
+                self.loggit.debug(
+                    'Waiting for shards to complete replication for '
+                    'indices: {0}'.format(utils.to_csv(l))
+                )
+                utils.wait_for_it(
+                    self.client, 'replicas',
+                    wait_interval=self.wait_interval, max_wait=self.max_wait
+                )
         try:
-            index_lists = utils.chunk_index_list(self.index_list.indices)
-            for l in index_lists:
-                self.client.indices.put_settings(index=utils.to_csv(l),
-                    body={'number_of_replicas' : self.count})
-                if self.wfc and self.count > 0:
-                    self.loggit.debug(
-                        'Waiting for shards to complete replication for '
-                        'indices: {0}'.format(utils.to_csv(l))
-                    )
-                    utils.wait_for_it(
-                        self.client, 'replicas',
-                        wait_interval=self.wait_interval, max_wait=self.max_wait
-                    )
+            utils.chunked_requests(self.index_list.indices, set_replicas)
         except Exception as e:
             utils.report_failure(e)
 
@@ -1041,7 +1351,7 @@ class Reindex(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `True`)
         :type wait_for_completion: bool
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         :arg remote_url_prefix: `Optional` url prefix, if needed to reach the
@@ -1103,7 +1413,7 @@ class Reindex(object):
         #: Internal reference to `wait_for_completion`
         self.wfc = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -1399,7 +1709,7 @@ class Snapshot(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `True`)
         :type wait_for_completion: bool
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         :arg ignore_unavailable: Ignore unavailable shards/indices.
@@ -1444,7 +1754,7 @@ class Snapshot(object):
         #: Internally accessible copy of `wait_for_completion`
         self.wait_for_completion = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -1581,7 +1891,7 @@ class Restore(object):
         :type extra_settings: dict, representing the settings.
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  (default: `True`)
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         :type wait_for_completion: bool
@@ -1626,7 +1936,7 @@ class Restore(object):
             self.indices = slo.snapshot_info[self.name]['indices']
         self.wfc                 = wait_for_completion
         #: Instance variable
-        #: How many seconds to wait between checks for completion.
+        #: The longest time in seconds between checks for completion.
         self.wait_interval = wait_interval
         #: Instance variable.
         #: How long in seconds to `wait_for_completion` before returning with an
@@ -1696,7 +2006,7 @@ class Restore(object):
         This should only be done if ``wait_for_completion`` is `True`, and only
         after completing the restore.
         """
-        all_indices = utils.get_indices(self.client)
+        all_indices = set(utils.get_indices(self.client))
         found_count = 0
         missing = []
         for index in self.expected_output:
@@ -1782,7 +2092,8 @@ class Shrink(object):
                 delete_after=True, post_allocation={},
                 wait_for_active_shards=1, wait_for_rebalance=True,
                 extra_settings={}, wait_for_completion=True, wait_interval=9,
-                max_wait=-1):
+                max_wait=-1, max_shrinks_per_node=0,
+                shrink_placement='most_available'):
         """
         :arg ilo: A :class:`curator.indexlist.IndexList` object
         :arg shrink_node: The node name to use as the shrink target, or
@@ -1814,10 +2125,17 @@ class Shrink(object):
         :arg wait_for_completion: Wait (or not) for the operation
             to complete before returning.  You should not normally change this,
             ever. (default: `True`)
-        :arg wait_interval: How long in seconds to wait between checks for
+        :arg wait_interval: The longest time in seconds between checks for
             completion.
         :arg max_wait: Maximum number of seconds to `wait_for_completion`
         :type wait_for_completion: bool
+        :arg max_shrinks_per_node: Largest number of indices being moved to or
+            shrunk on each shrink node at the same time.  The default, ``0``,
+            shrinks one index at a time.
+        :arg shrink_placement: How a ``DETERMINISTIC`` shrink node is chosen:
+            ``most_available``, the node with the most free space, or
+            ``least_movement``, the node which already holds the most of the
+            index, with free space breaking ties.
         """
         self.loggit = logging.getLogger('curator.actions.shrink')
         utils.verify_index_list(ilo)
@@ -1845,14 +2163,46 @@ class Shrink(object):
         self.wait_for_rebalance = wait_for_rebalance
         #: Instance variable. Internal reference to `wait_for_completion`
         self.wfc              = wait_for_completion
-        #: Instance variable. How many seconds to wait between checks for completion.
+        #: Instance variable. The longest time in seconds to wait between checks for completion.
         self.wait_interval    = wait_interval
         #: Instance variable. How long in seconds to `wait_for_completion` before returning with an exception. A value of -1 means wait forever.
         self.max_wait         = max_wait
         #: Instance variable. Internal reference to `number_of_shards`
         self.number_of_shards = number_of_shards
+        #: Instance variable. Internal reference to `max_shrinks_per_node`
+        self.max_shrinks_per_node = max_shrinks_per_node
+        #: Instance variable. Internal reference to `shrink_placement`
+        self.shrink_placement = shrink_placement
+        #: Instance variable. For each index, the bytes of its primary
+        #: shards, the bytes of all its shard copies, and the bytes of its
+        #: primary shards which each node holds a copy of.  Filled by
+        #: :py:meth:`load_shard_placement`.
+        self.shard_bytes = {}
+        #: Instance variable. The indices whose pre-check data was read by
+        #: :py:meth:`load_pre_check_data`.
+        self.pre_checked = set()
+        #: Instance variable. The target index names of `pre_checked` indices
+        #: which already exist.
+        self.existing_targets = set()
+        #: Instance variable. Held while updating `index_list` or `reserved`
+        #: from the threads of a pipelined shrink.
+        self.lock = threading.RLock()
+        #: Instance variable. During a pipelined shrink, the bytes still to
+        #: arrive on each shrink node for the indices under way there.
+        self.reserved = {}
+        #: Instance variable. During a pipelined shrink, the node id and the
+        #: reserved bytes still to arrive of each index under way.
+        self.in_flight = {}
+        #: Instance variable. During a pipelined shrink, the
+        #: :class:`curator.utils.CompletionWaiter` every thread waits on for
+        #: its shards to move.
+        self.waiter = None
         self.wait_for_active_shards = wait_for_active_shards
         self.shrink_node_name = None
+        #: Instance variable.
+        #: The :class:`curator.nodetopology.NodeTopology` every node check
+        #: reads from.
+        self.topology = NodeTopology(self.client)
         self.body = {
             'settings': {
                 'index.number_of_shards' : number_of_shards,
@@ -1882,8 +2232,8 @@ class Shrink(object):
                 raise exceptions.ConfigurationError('Unable to apply extra settings "{0}" to shrink body. Exception: {1}'.format(extra_settings, e))
 
     def _data_node(self, node_id):
-        roles = utils.node_roles(self.client, node_id)
-        name = utils.node_id_to_name(self.client, node_id)
+        roles = self.topology.roles(node_id)
+        name = self.topology.name(node_id)
         if not 'data' in roles:
             self.loggit.info('Skipping node "{0}": non-data node'.format(name))
             return False
@@ -1907,7 +2257,7 @@ class Shrink(object):
         return '{0}{1}{2}'.format(self.shrink_prefix, name, self.shrink_suffix)
 
     def qualify_single_node(self):
-        node_id = utils.name_to_node_id(self.client, self.shrink_node)
+        node_id = self.topology.node_id(self.shrink_node)
         if node_id:
             self.shrink_node_id   = node_id
             self.shrink_node_name = self.shrink_node
@@ -1917,44 +2267,51 @@ class Shrink(object):
             raise exceptions.ConfigurationError('Node "{0}" listed for exclusion'.format(self.shrink_node))
         if not self._data_node(node_id):
             raise exceptions.ActionError('Node "{0}" is not usable as a shrink node'.format(self.shrink_node))
-        if not utils.single_data_path(self.client, node_id):
+        if not self.topology.single_data_path(node_id):
             raise exceptions.ActionError(
                 'Node "{0}" has multiple data paths and cannot be used '
                 'for shrink operations.'
                 .format(self.shrink_node)
             )
-        self.shrink_node_avail = (
-            self.client.nodes.stats()['nodes'][node_id]['fs']['total']['available_in_bytes']
-        )
+        self.shrink_node_avail = self.topology.available(node_id)
 
-    def most_available_node(self):
+    def _eligible_nodes(self):
         """
-        Determine which data node name has the most available free space, and
-        meets the other node filters settings.
-
-        :arg client: An :class:`elasticsearch.Elasticsearch` client object
+        Return the ids of the data nodes which pass the node filters and have
+        a single data path.
         """
-        mvn_avail = 0
-        # mvn_total = 0
-        mvn_name = None
-        mvn_id = None
-        nodes = self.client.nodes.stats()['nodes']
-        for node_id in nodes:
-            name = nodes[node_id]['name']
+        eligible = []
+        for node_id in self.topology.node_ids():
+            name = self.topology.name(node_id)
             if self._exclude_node(name):
                 self.loggit.debug('Node "{0}" excluded by node filters'.format(name))
                 continue
             if not self._data_node(node_id):
                 self.loggit.debug('Node "{0}" is not a data node'.format(name))
                 continue
-            if not utils.single_data_path(self.client, node_id):
+            if not self.topology.single_data_path(node_id):
                 self.loggit.info(
                     'Node "{0}" has multiple data paths and will not be used for '
                     'shrink operations.'.format(name))
                 continue
-            value = nodes[node_id]['fs']['total']['available_in_bytes']
+            eligible.append(node_id)
+        return eligible
+
+    def most_available_node(self):
+        """
+        Determine which data node name has the most available free space, and
+        meets the other node filters settings.
+
+        :arg client: An :class:`elasticsearch.Elasticsearch` client object
+        """
+        mvn_avail = 0
+        # mvn_total = 0
+        mvn_name = None
+        mvn_id = None
+        for node_id in self._eligible_nodes():
+            value = self.topology.available(node_id)
             if value > mvn_avail:
-                mvn_name  = name
+                mvn_name  = self.topology.name(node_id)
                 mvn_id    = node_id
                 mvn_avail = value
                 # mvn_total = nodes[node_id]['fs']['total']['total_in_bytes']
@@ -1963,18 +2320,129 @@ class Shrink(object):
         self.shrink_node_avail = mvn_avail
         # self.shrink_node_total = mvn_total
 
-    def route_index(self, idx, allocation_type, key, value):
+    def load_shard_placement(self, indices):
+        """
+        Read where the shard copies of `indices` are, and how large they are,
+        into `shard_bytes`, with one shard level stats request per chunk.
+
+        :arg indices: A list of index names
+        """
+        def shard_stats(data):
+            return self.client.indices.stats(
+                index=utils.to_csv(data), metric='store', level='shards',
+                filter_path=settings.shard_placement_filter_path()
+            )
+        for response in utils.chunked_requests(indices, shard_stats):
+            for idx, data in (response or {}).get('indices', {}).items():
+                placement = {'primary': 0, 'total': 0, 'held': {}}
+                for copies in data.get('shards', {}).values():
+                    size = 0
+                    for copy in copies:
+                        copy_size = copy['store']['size_in_bytes']
+                        placement['total'] += copy_size
+                        if copy['routing']['primary']:
+                            size = copy_size
+                    placement['primary'] += size
+                    # Any copy of a shard, primary or replica, saves moving it
+                    for node_id in set(
+                            copy['routing']['node'] for copy in copies
+                            if copy['routing'].get('node')):
+                        placement['held'][node_id] = (
+                            placement['held'].get(node_id, 0) + size)
+                self.shard_bytes[idx] = placement
+
+    def load_pre_check_data(self, indices):
+        """
+        Read what :py:meth:`pre_shrink_check` needs for all of `indices` at
+        once, rather than with several requests per index.  Shard counts,
+        sizes and primary doc counts come from `index_list`, which reads them
+        with one cluster state and one stats request per chunk.  Shard
+        placement is read by :py:meth:`load_shard_placement`, and the target
+        index names which already exist with one request per chunk.
+
+        :arg indices: A list of index names
+        """
+        self.index_list.load_index_info(
+            'number_of_shards', 'size_in_bytes', 'primary_docs')
+        self.load_shard_placement(indices)
+        targets = [self._shrink_target(idx) for idx in indices]
+        existing = set()
+        for found in utils.chunked_requests(
+                targets, lambda data: utils.existing_indices(self.client, data)):
+            existing.update(found)
+        self.existing_targets = existing
+        self.pre_checked = set(indices)
+
+    def _bytes_to_move(self, idx, node_id):
+        """
+        Return the estimated number of bytes of `idx` which must be copied to
+        the node `node_id` for it to hold a copy of every shard.
+        """
+        if idx not in self.shard_bytes:
+            self.load_shard_placement([idx])
+        placement = self.shard_bytes.get(
+            idx, {'primary': 0, 'total': 0, 'held': {}})
+        return placement['primary'] - placement['held'].get(node_id, 0)
+
+    def least_movement_node(self, idx):
+        """
+        Determine which data node, among those meeting the node filters
+        settings and with space for `idx`, already holds the most of `idx`,
+        with the most available free space breaking ties.
+
+        :arg idx: An index name
+        """
+        if idx not in self.shard_bytes:
+            self.load_shard_placement([idx])
+        placement = self.shard_bytes.get(
+            idx, {'primary': 0, 'total': 0, 'held': {}})
+        needed = self._space_needed(placement['total'])
+        best = None
+        best_key = None
+        for node_id in self._eligible_nodes():
+            avail = self.topology.available(node_id)
+            key = (avail > needed, placement['held'].get(node_id, 0), avail)
+            if best_key is None or key > best_key:
+                best = node_id
+                best_key = key
+        self.shrink_node_id = best
+        self.shrink_node_name = self.topology.name(best) if best else None
+        self.shrink_node_avail = self.topology.available(best) if best else 0
+
+    def route_index(self, idx, allocation_type, key, value,
+        wait_for_rebalance=None):
+        if wait_for_rebalance is None:
+            wait_for_rebalance = self.wait_for_rebalance
         bkey = 'index.routing.allocation.{0}.{1}'.format(allocation_type, key)
         routing = { bkey : value }
         try:
             self.client.indices.put_settings(index=idx, body=routing)
-            if self.wait_for_rebalance:
+            with self.lock:
+                self.index_list.refresh_settings([idx])
+            if wait_for_rebalance:
                 utils.wait_for_it(self.client, 'allocation', wait_interval=self.wait_interval, max_wait=self.max_wait)
             else:
-                utils.wait_for_it(self.client, 'relocate', index=idx, wait_interval=self.wait_interval, max_wait=self.max_wait)
+                self._wait_for_relocation(idx)
+            # Shards have moved, so free disk space has changed
+            self.topology.refresh()
         except Exception as e:
             utils.report_failure(e)
 
+    def _wait_for_relocation(self, idx):
+        """
+        Wait until every shard of `idx` is started.  In a pipelined shrink,
+        the threads share `waiter`, so one request checks every index moving.
+        """
+        if self.waiter is None:
+            utils.wait_for_it(self.client, 'relocate', index=idx, wait_interval=self.wait_interval, max_wait=self.max_wait)
+            return
+        self.waiter.add(idx, 'relocate', max_wait=self.max_wait, index=idx)
+        if not self.waiter.wait_for(idx):
+            raise exceptions.ActionTimeout(
+                'Action "relocate" failed to complete in the max_wait period '
+                'of {0} seconds'.format(self.max_wait)
+            )
+
     def __log_action(self, error_msg, dry_run=False):
         if not dry_run:
             raise exceptions.ActionError(error_msg)
@@ -1989,20 +2457,29 @@ class Shrink(object):
         unblock = { 'index.blocks.write': False }
         self.client.indices.put_settings(index=idx, body=unblock)
 
+    def _space_needed(self, size):
+        # Room for the shards moved to the shrink node, and the shrunk copy
+        return (size * 2) + (32 * 1024)
+
     def _check_space(self, idx, dry_run=False):
         # Disk watermark calculation is already baked into `available_in_bytes`
-        size = utils.index_size(self.client, idx)
-        padded = (size * 2) + (32 * 1024)
+        if idx in self.pre_checked:
+            size = self.index_list.index_info[idx]['size_in_bytes']
+        else:
+            size = utils.index_size(self.client, idx)
+        padded = self._space_needed(size)
         if padded < self.shrink_node_avail:
             self.loggit.debug('Sufficient space available for 2x the size of index "{0}".  Required: {1}, available: {2}'.format(idx, padded, self.shrink_node_avail))
         else:
             error_msg = ('Insufficient space available for 2x the size of index "{0}", shrinking will exceed space available. Required: {1}, available: {2}'.format(idx, padded, self.shrink_node_avail))
             self.__log_action(error_msg, dry_run)
 
-    def _check_node(self):
+    def _check_node(self, idx=None):
         if self.shrink_node != 'DETERMINISTIC':
             if not self.shrink_node_name:
                 self.qualify_single_node()
+        elif self.shrink_placement == 'least_movement' and idx is not None:
+            self.least_movement_node(idx)
         else:
             self.most_available_node()
         # At this point, we should have the three shrink-node identifying
@@ -2014,13 +2491,20 @@ class Shrink(object):
 
     def _check_target_exists(self, idx, dry_run=False):
         target = self._shrink_target(idx)
-        if self.client.indices.exists(target):
+        if idx in self.pre_checked:
+            exists = target in self.existing_targets
+        else:
+            exists = self.client.indices.exists(target)
+        if exists:
             error_msg = 'Target index "{0}" already exists'.format(target)
             self.__log_action(error_msg, dry_run)
 
     def _check_doc_count(self, idx, dry_run=False):
         max_docs = 2147483519
-        doc_count = self.client.indices.stats(idx)['indices'][idx]['primaries']['docs']['count']
+        if idx in self.pre_checked:
+            doc_count = self.index_list.index_info[idx]['primary_docs']
+        else:
+            doc_count = self.client.indices.stats(idx)['indices'][idx]['primaries']['docs']['count']
         if doc_count > (max_docs * self.number_of_shards):
             error_msg = ('Too many documents ({0}) to fit in {1} shard(s). Maximum number of docs per shard is {2}'.format(doc_count, self.number_of_shards, max_docs))
             self.__log_action(error_msg, dry_run)
@@ -2042,38 +2526,48 @@ class Shrink(object):
             )
             self.__log_action(error_msg, dry_run)
 
-    def _check_all_shards(self, idx):
+    def _check_all_shards(self, idx, node_id=None, node_name=None):
+        if node_id is None:
+            node_id = self.shrink_node_id
+            node_name = self.shrink_node_name
         shards = self.client.cluster.state(index=idx)['routing_table']['indices'][idx]['shards']
         found = []
         for shardnum in shards:
             for shard_idx in range(0, len(shards[shardnum])):
-                if shards[shardnum][shard_idx]['node'] == self.shrink_node_id:
+                if shards[shardnum][shard_idx]['node'] == node_id:
                     found.append({'shard': shardnum, 'primary': shards[shardnum][shard_idx]['primary']})
         if len(shards) != len(found):
-            self.loggit.debug('Found these shards on node "{0}": {1}'.format(self.shrink_node_name, found))
-            raise exceptions.ActionError('Unable to shrink index "{0}" as not all shards were found on the designated shrink node ({1}): {2}'.format(idx, self.shrink_node_name, found))
+            self.loggit.debug('Found these shards on node "{0}": {1}'.format(node_name, found))
+            raise exceptions.ActionError('Unable to shrink index "{0}" as not all shards were found on the designated shrink node ({1}): {2}'.format(idx, node_name, found))
 
-    def pre_shrink_check(self, idx, dry_run=False):
-        self.loggit.debug('BEGIN PRE_SHRINK_CHECK')
+    def _check_index(self, idx, dry_run=False):
         self.loggit.debug('Check that target exists')
         self._check_target_exists(idx, dry_run)
         self.loggit.debug('Check doc count constraints')
         self._check_doc_count(idx, dry_run)
         self.loggit.debug('Check shard count')
-        src_shards = int(self.client.indices.get(idx)[idx]['settings']['index']['number_of_shards'])
+        if idx in self.pre_checked:
+            src_shards = int(
+                self.index_list.index_info[idx]['number_of_shards'])
+        else:
+            src_shards = int(self.client.indices.get(idx)[idx]['settings']['index']['number_of_shards'])
         self._check_shard_count(idx, src_shards, dry_run)
         self.loggit.debug('Check shard factor')
         self._check_shard_factor(idx, src_shards, dry_run)
+
+    def pre_shrink_check(self, idx, dry_run=False):
+        self.loggit.debug('BEGIN PRE_SHRINK_CHECK')
+        self._check_index(idx, dry_run)
         self.loggit.debug('Check node availability')
-        self._check_node()
+        self._check_node(idx)
         self.loggit.debug('Check available disk space')
         self._check_space(idx, dry_run)
         self.loggit.debug('FINISH PRE_SHRINK_CHECK')
 
     def do_copy_aliases(self, source_idx, target_idx):
         alias_actions = []
-        aliases = self.client.indices.get_alias(index=source_idx)
-        for alias in aliases[source_idx]['aliases']:
+        self.index_list.load_aliases()
+        for alias in sorted(self.index_list.index_aliases.get(source_idx, [])):
             self.loggit.debug('alias: {0}'.format(alias))
             alias_actions.append(
                 {'remove': {'index': source_idx, 'alias': alias}})
@@ -2082,6 +2576,8 @@ class Shrink(object):
         if alias_actions:
             self.loggit.info('Copy alias actions: {0}'.format(alias_actions))
             self.client.indices.update_aliases({ 'actions' : alias_actions })
+            with self.lock:
+                self.index_list.apply_alias_actions(alias_actions)
 
     def do_dry_run(self):
         """
@@ -2090,27 +2586,263 @@ class Shrink(object):
         self.index_list.filter_closed()
         self.index_list.empty_list_check()
         try:
+            self.load_pre_check_data(self.index_list.indices)
             index_lists = utils.chunk_index_list(self.index_list.indices)
             for l in index_lists:
                 for idx in l: # Shrink can only be done one at a time...
                     target = self._shrink_target(idx)
                     self.pre_shrink_check(idx, dry_run=True)
-                    self.loggit.info('DRY-RUN: Moving shards to shrink node: "{0}"'.format(self.shrink_node_name))
+                    self.loggit.info('DRY-RUN: Moving shards to shrink node: "{0}". Estimated bytes to move: {1}'.format(self.shrink_node_name, self._bytes_to_move(idx, self.shrink_node_id)))
                     self.loggit.info('DRY-RUN: Shrinking index "{0}" to "{1}" with settings: {2}, wait_for_active_shards={3}'.format(idx, target, self.body, self.wait_for_active_shards))
                     if self.post_allocation:
                         self.loggit.info('DRY-RUN: Applying post-shrink allocation rule "{0}" to index "{1}"'.format('index.routing.allocation.{0}.{1}:{2}'.format(self.post_allocation['allocation_type'], self.post_allocation['key'], self.post_allocation['value']), target))
                     if self.copy_aliases:
-                        self.loggit.info('DRY-RUN: Copy source index aliases "{0}"'.format(self.client.indices.get_alias(idx)))
+                        self.index_list.load_aliases()
+                        self.loggit.info('DRY-RUN: Copy source index aliases "{0}"'.format(sorted(self.index_list.index_aliases.get(idx, []))))
                         #self.do_copy_aliases(idx, target)
                     if self.delete_after:
                         self.loggit.info('DRY-RUN: Deleting source index "{0}"'.format(idx))
         except Exception as e:
             utils.report_failure(e)
 
+    def _shrink_index(self, idx, node_id, node_name, pipelined=False):
+        """
+        Move the shards of `idx` to the shrink node, shrink it, and clean up.
+        A pipelined shrink waits for `idx` and its target index alone, rather
+        than for the whole cluster, as other indices are moving meanwhile.
+        """
+        target = self._shrink_target(idx)
+        wait_for_rebalance = False if pipelined else None
+        # Route the index to the shrink node
+        self.loggit.info(
+            'Moving shards to shrink node: "{0}". Estimated bytes to move: '
+            '{1}'.format(node_name, self._bytes_to_move(idx, node_id)))
+        self.route_index(idx, 'require', '_name', node_name, wait_for_rebalance)
+        # The moved shards are now counted in the node's free space
+        self._release(idx, self._bytes_to_move(idx, node_id))
+        # Ensure a copy of each shard is present
+        self._check_all_shards(idx, node_id, node_name)
+        # Block writes on index
+        self._block_writes(idx)
+        # Do final health check
+        if pipelined:
+            if not utils.relocate_check(self.client, idx):
+                raise exceptions.ActionError('Unable to proceed with shrink action. Not all shards of index "{0}" are started'.format(idx))
+        elif not utils.health_check(self.client, status='green'):
+            raise exceptions.ActionError('Unable to proceed with shrink action. Cluster health is not "green"')
+        # Do the shrink
+        self.loggit.info('Shrinking index "{0}" to "{1}" with settings: {2}, wait_for_active_shards={3}'.format(idx, target, self.body, self.wait_for_active_shards))
+        try:
+            self.client.indices.shrink(index=idx, target=target, body=self.body, wait_for_active_shards=self.wait_for_active_shards)
+            # Wait for it to complete
+            if self.wfc:
+                self.loggit.debug('Wait for shards to complete allocation for index: {0}'.format(target))
+                if self.wait_for_rebalance and not pipelined:
+                    utils.wait_for_it(self.client, 'shrink', wait_interval=self.wait_interval, max_wait=self.max_wait)
+                else:
+                    self._wait_for_relocation(target)
+        except Exception as e:
+            if self.client.indices.exists(index=target):
+                self.loggit.error('Deleting target index "{0}" due to failure to complete shrink'.format(target))
+                self.client.indices.delete(index=target)
+            raise exceptions.ActionError('Unable to shrink index "{0}" -- Error: {1}'.format(idx, e))
+        self.loggit.info('Index "{0}" successfully shrunk to "{1}"'.format(idx, target))
+        # Do post-shrink steps
+        # Unblock writes on index (just in case)
+        self._unblock_writes(idx)
+        ## Post-allocation, if enabled
+        if self.post_allocation:
+            self.loggit.info('Applying post-shrink allocation rule "{0}" to index "{1}"'.format('index.routing.allocation.{0}.{1}:{2}'.format(self.post_allocation['allocation_type'], self.post_allocation['key'], self.post_allocation['value']), target))
+            self.route_index(target, self.post_allocation['allocation_type'], self.post_allocation['key'], self.post_allocation['value'], wait_for_rebalance)
+        ## Copy aliases, if flagged
+        if self.copy_aliases:
+            self.loggit.info('Copy source index aliases "{0}"'.format(idx))
+            self.do_copy_aliases(idx, target)
+        ## Delete, if flagged
+        if self.delete_after:
+            self.loggit.info('Deleting source index "{0}"'.format(idx))
+            self.client.indices.delete(index=idx)
+            with self.lock:
+                self.index_list.mark_deleted([idx])
+            self.topology.refresh()
+        else: # Let's unset the routing we applied here.
+            self.loggit.info('Unassigning routing for source index: "{0}"'.format(idx))
+            self.route_index(idx, 'require', '_name', '', wait_for_rebalance)
+
+    def _reserve(self, idx, node_id):
+        """
+        Reserve on `node_id` the bytes of `idx` still to arrive there: the
+        shards it does not hold yet, and the shrunk copy.
+        """
+        nbytes = (
+            self._bytes_to_move(idx, node_id) +
+            self._space_needed(self.index_list.index_info[idx]['size_in_bytes'])
+            - self.index_list.index_info[idx]['size_in_bytes']
+        )
+        with self.lock:
+            self.reserved[node_id] += nbytes
+            self.in_flight[idx] = [node_id, nbytes]
+
+    def _release(self, idx, nbytes=None):
+        """
+        Release `nbytes` of the bytes reserved for `idx`, once they are
+        counted in the free space of its node, or all of them if `nbytes` is
+        `None`.  Nothing is released for an index with no reservation.
+        """
+        with self.lock:
+            if idx not in self.in_flight:
+                return
+            node_id, left = self.in_flight[idx]
+            nbytes = left if nbytes is None else min(nbytes, left)
+            self.reserved[node_id] -= nbytes
+            self.in_flight[idx][1] -= nbytes
+            if nbytes == left:
+                del self.in_flight[idx]
+
+    def _pick_node(self, idx, nodes, load, needed):
+        """
+        Return the id of the node in `nodes` with a free slot and more than
+        `needed` bytes of disk space left after its `reserved` bytes.  Of those,
+        pick the one with the most space left, or with ``least_movement``
+        placement, the one already holding the most of `idx`.  Return `None`
+        if no node qualifies.
+        """
+        best = None
+        best_key = None
+        for node_id in nodes:
+            if load[node_id] >= self.max_shrinks_per_node:
+                continue
+            with self.lock:
+                room = self.topology.available(node_id) - self.reserved[node_id]
+            if room <= needed:
+                continue
+            key = (room,)
+            if self.shrink_placement == 'least_movement':
+                key = (self.shard_bytes[idx]['held'].get(node_id, 0), room)
+            if best_key is None or key > best_key:
+                best = node_id
+                best_key = key
+        return best
+
+    def _pipelined_shrink(self, idx, node_id, finished):
+        """
+        Check and shrink `idx` on the node `node_id`, then put
+        ``(idx, error)`` in `finished`.
+        """
+        try:
+            self._check_index(idx)
+            self._shrink_index(
+                idx, node_id, self.topology.name(node_id), pipelined=True)
+            finished.put((idx, None))
+        except Exception as e:
+            try:
+                self._unblock_writes(idx)
+            except Exception as unblock_error:
+                self.loggit.error(
+                    'Unable to unblock writes on index "{0}": {1}'.format(
+                        idx, unblock_error)
+                )
+            finished.put((idx, e))
+
+    def _shrink_concurrently(self, indices):
+        """
+        Shrink `indices` on every eligible shrink node, or the named
+        `shrink_node`, with up to `max_shrinks_per_node` indices moving to or
+        shrinking on each node at a time.  Each index goes to the node with
+        the most disk space left once the indices already under way there are
+        counted, less the shards which have already arrived.  After a failure
+        no more indices are started, and those under way are finished before
+        it is reported.
+        """
+        if self.shrink_node != 'DETERMINISTIC':
+            self.qualify_single_node()
+            nodes = [self.shrink_node_id]
+        else:
+            nodes = self._eligible_nodes()
+        if not nodes:
+            raise exceptions.ActionError('No node is usable as a shrink node')
+        if self.copy_aliases:
+            self.index_list.load_aliases()
+        self.load_pre_check_data(indices)
+        for idx in indices:
+            self.shard_bytes.setdefault(
+                idx, {'primary': 0, 'total': 0, 'held': {}})
+        self.loggit.info(
+            'Shrinking {0} indices on {1} nodes, up to {2} per node at a '
+            'time'.format(len(indices), len(nodes), self.max_shrinks_per_node)
+        )
+        pending = deque(indices)
+        load = dict((node_id, 0) for node_id in nodes)
+        self.reserved = dict((node_id, 0) for node_id in nodes)
+        self.in_flight = {}
+        self.waiter = utils.CompletionWaiter(
+            self.client, wait_interval=self.wait_interval)
+        running = {}
+        failures = OrderedDict()
+        finished = Queue()
+        pool = ThreadPool(min(len(indices), self.max_shrinks_per_node * len(nodes)))
+        try:
+            while running or (pending and not failures):
+                while pending and not failures:
+                    idx = pending[0]
+                    needed = self._space_needed(
+                        self.index_list.index_info[idx]['size_in_bytes'])
+                    node_id = self._pick_node(idx, nodes, load, needed)
+                    if node_id is None:
+                        if running:
+                            # Wait for a slot, or for space to be freed
+                            break
+                        pending.popleft()
+                        failures[idx] = exceptions.ActionError(
+                            'Insufficient space available on any shrink node '
+                            'for 2x the size of index "{0}". Required: '
+                            '{1}'.format(idx, needed)
+                        )
+                        break
+                    pending.popleft()
+                    load[node_id] += 1
+                    self._reserve(idx, node_id)
+                    running[idx] = node_id
+                    self.loggit.info(
+                        'Source index: {0} -- Target index: {1} -- Shrink '
+                        'node: {2}'.format(
+                            idx, self._shrink_target(idx),
+                            self.topology.name(node_id))
+                    )
+                    pool.apply_async(
+                        self._pipelined_shrink, (idx, node_id, finished))
+                if not running:
+                    break
+                idx, error = finished.get()
+                node_id = running.pop(idx)
+                load[node_id] -= 1
+                self._release(idx)
+                if error is not None:
+                    self.loggit.error(
+                        'Unable to shrink index "{0}": {1}'.format(idx, error))
+                    failures[idx] = error
+        finally:
+            pool.close()
+            pool.join()
+            self.waiter = None
+        if failures:
+            raise exceptions.ActionError(
+                'Unable to shrink {0} of {1} indices: {2}'.format(
+                    len(failures), len(indices), dict(failures))
+            )
+
     def do_action(self):
         self.index_list.filter_closed()
         self.index_list.empty_list_check()
+        if self.max_shrinks_per_node > 0:
+            try:
+                self._shrink_concurrently(self.index_list.indices)
+            except Exception as e:
+                utils.report_failure(e)
+            return
+        idx = None
         try:
+            self.load_pre_check_data(self.index_list.indices)
             index_lists = utils.chunk_index_list(self.index_list.indices)
             for l in index_lists:
                 for idx in l: # Shrink can only be done one at a time...
@@ -2118,54 +2850,11 @@ class Shrink(object):
                     self.loggit.info('Source index: {0} -- Target index: {1}'.format(idx, target))
                     # Pre-check ensures disk space available for each pass of the loop
                     self.pre_shrink_check(idx)
-                    # Route the index to the shrink node
-                    self.loggit.info('Moving shards to shrink node: "{0}"'.format(self.shrink_node_name))
-                    self.route_index(idx, 'require', '_name', self.shrink_node_name)
-                    # Ensure a copy of each shard is present
-                    self._check_all_shards(idx)
-                    # Block writes on index
-                    self._block_writes(idx)
-                    # Do final health check
-                    if not utils.health_check(self.client, status='green'):
-                        raise exceptions.ActionError('Unable to proceed with shrink action. Cluster health is not "green"')
-                    # Do the shrink
-                    self.loggit.info('Shrinking index "{0}" to "{1}" with settings: {2}, wait_for_active_shards={3}'.format(idx, target, self.body, self.wait_for_active_shards))
-                    try:
-                        self.client.indices.shrink(index=idx, target=target, body=self.body, wait_for_active_shards=self.wait_for_active_shards)
-                        # Wait for it to complete
-                        if self.wfc:
-                            self.loggit.debug('Wait for shards to complete allocation for index: {0}'.format(target))
-                            if self.wait_for_rebalance:
-                                utils.wait_for_it(self.client, 'shrink', wait_interval=self.wait_interval, max_wait=self.max_wait)
-                            else:
-                                utils.wait_for_it(self.client, 'relocate', index=target, wait_interval=self.wait_interval, max_wait=self.max_wait)
-                    except Exception as e:
-                        if self.client.indices.exists(index=target):
-                            self.loggit.error('Deleting target index "{0}" due to failure to complete shrink'.format(target))
-                            self.client.indices.delete(index=target)
-                        raise exceptions.ActionError('Unable to shrink index "{0}" -- Error: {1}'.format(idx, e))
-                    self.loggit.info('Index "{0}" successfully shrunk to "{1}"'.format(idx, target))
-                    # Do post-shrink steps
-                    # Unblock writes on index (just in case)
-                    self._unblock_writes(idx)
-                    ## Post-allocation, if enabled
-                    if self.post_allocation:
-                        self.loggit.info('Applying post-shrink allocation rule "{0}" to index "{1}"'.format('index.routing.allocation.{0}.{1}:{2}'.format(self.post_allocation['allocation_type'], self.post_allocation['key'], self.post_allocation['value']), target))
-                        self.route_index(target, self.post_allocation['allocation_type'], self.post_allocation['key'], self.post_allocation['value'])
-                    ## Copy aliases, if flagged
-                    if self.copy_aliases:
-                        self.loggit.info('Copy source index aliases "{0}"'.format(idx))
-                        self.do_copy_aliases(idx, target)
-                    ## Delete, if flagged
-                    if self.delete_after:
-                        self.loggit.info('Deleting source index "{0}"'.format(idx))
-                        self.client.indices.delete(index=idx)
-                    else: # Let's unset the routing we applied here.
-                        self.loggit.info('Unassigning routing for source index: "{0}"'.format(idx))
-                        self.route_index(idx, 'require', '_name', '')
+                    self._shrink_index(idx, self.shrink_node_id, self.shrink_node_name)
 
         except Exception as e:
             # Just in case it fails after attempting to meet this condition
-            self._unblock_writes(idx)
+            if idx is not None:
+                self._unblock_writes(idx)
             utils.report_failure(e)
 
@@ -8,8 +8,13 @@ from curator.config_utils import process_config
 from curator.defaults import settings
 from curator.exceptions import NoIndices, NoSnapshots
 from curator.indexlist import IndexList
+from curator.indexsnapshot import IndexSnapshot
 from curator.snapshotlist import SnapshotList
-from curator.utils import get_client, get_yaml, prune_nones, validate_actions
+from curator.utils import (
+    get_client, get_search_pattern, get_yaml, pop_list_options, prune_nones,
+    request_cache_stats, set_request_timeout, size_connection_pool,
+    validate_actions
+)
 from curator.validators import SchemaCheck
 from curator._version import __version__
 
@@ -49,6 +54,10 @@ def process_action(client, config, **kwargs):
     opts = config['options']
     logger.debug('opts: {0}'.format(opts))
     mykwargs = {}
+    # Settings for any IndexList built for this action
+    list_args = kwargs['list_args'] if 'list_args' in kwargs else {}
+    # Index metadata shared with the other actions in the run, if any
+    snapshot = kwargs['snapshot'] if 'snapshot' in kwargs else None
 
     action_class = CLASS_MAP[action]
 
@@ -66,16 +75,22 @@ def process_action(client, config, **kwargs):
         # Special behavior for this action, as it has 2 index lists
         logger.debug('Running "{0}" action'.format(action.upper()))
         action_obj = action_class(**mykwargs)
-        removes = IndexList(client)
-        adds = IndexList(client)
         if 'remove' in config:
             logger.debug(
                 'Removing indices from alias "{0}"'.format(opts['name']))
+            removes = IndexList(
+                client, search_pattern=get_search_pattern(
+                    config['remove'].get('filters')),
+                snapshot=snapshot, **list_args)
             removes.iterate_filters(config['remove'])
             action_obj.remove(
                 removes, warn_if_no_indices= opts['warn_if_no_indices'])
         if 'add' in config:
             logger.debug('Adding indices to alias "{0}"'.format(opts['name']))
+            adds = IndexList(
+                client, search_pattern=get_search_pattern(
+                    config['add'].get('filters')),
+                snapshot=snapshot, **list_args)
             adds.iterate_filters(config['add'])
             action_obj.add(adds, warn_if_no_indices=opts['warn_if_no_indices'])
     elif action in [ 'cluster_routing', 'create_index', 'rollover']:
@@ -89,7 +104,10 @@ def process_action(client, config, **kwargs):
         action_obj = action_class(slo, **mykwargs)
     else:
         logger.debug('Running "{0}"'.format(action.upper()))
-        ilo = IndexList(client)
+        ilo = IndexList(
+            client, search_pattern=get_search_pattern(config.get('filters')),
+            snapshot=snapshot, **list_args
+        )
         ilo.iterate_filters(config)
         action_obj = action_class(ilo, **mykwargs)
     ### Do the action
@@ -97,7 +115,17 @@ def process_action(client, config, **kwargs):
         action_obj.do_dry_run()
     else:
         logger.debug('Doing the action here.')
-        action_obj.do_action()
+        try:
+            action_obj.do_action()
+        finally:
+            if snapshot is not None:
+                if action in settings.index_changing_actions():
+                    # Existing indices may have been restored over, written
+                    # to, or had aliases moved, so all are read again
+                    snapshot.refresh()
+                elif action in settings.index_creating_actions():
+                    # New indices are only found by listing again
+                    snapshot.refresh_listings()
 
 def run(config, action_file, dry_run=False):
     """
@@ -108,8 +136,16 @@ def run(config, action_file, dry_run=False):
     logger.debug('Client and logging options validated.')
 
     # Extract this and save it for later, in case there's no timeout_override.
-    default_timeout = client_args.pop('timeout')
+    default_timeout = client_args['timeout']
     logger.debug('default_timeout = {0}'.format(default_timeout))
+    # These are for IndexList, not the client
+    list_args = pop_list_options(client_args)
+    logger.debug('list_args = {0}'.format(list_args))
+    # Index metadata is read once, and shared by every action in the run
+    snapshot = IndexSnapshot()
+    # One client, and connection pool, is shared by every action in the run.
+    # It is created for the first action which is not disabled.
+    client = None
     #########################################
     ### Start working on the actions here ###
     #########################################
@@ -120,6 +156,10 @@ def run(config, action_file, dry_run=False):
     actions = action_dict['actions']
     logger.debug('Full list of actions: {0}'.format(actions))
     action_keys = sorted(list(actions.keys()))
+    # The shared connection pool must hold the most concurrent requests of any
+    # action
+    size_connection_pool(
+        client_args, [actions[idx]['options'] for idx in action_keys])
     for idx in action_keys:
         action = actions[idx]['action']
         action_disabled = actions[idx]['options'].pop('disable_action')
@@ -146,19 +186,22 @@ def run(config, action_file, dry_run=False):
             logger.info('Preparing Action ID: {0}, "{1}"'.format(idx, action))
         # Override the timeout, if specified, otherwise use the default.
         if isinstance(timeout_override, int):
-            client_args['timeout'] = timeout_override
+            timeout = timeout_override
         else:
-            client_args['timeout'] = default_timeout
+            timeout = default_timeout
 
         # Set up action kwargs
         kwargs = {}
-        kwargs['master_timeout'] = (
-            client_args['timeout'] if client_args['timeout'] <= 300 else 300)
+        kwargs['master_timeout'] = timeout if timeout <= 300 else 300
         kwargs['dry_run'] = dry_run
+        kwargs['list_args'] = list_args
+        kwargs['snapshot'] = snapshot
 
-        # Create a client object for each action...
-        client = get_client(**client_args)
-        logger.debug('client is {0}'.format(type(client)))
+        if client is None:
+            client = get_client(**client_args)
+            logger.debug('client is {0}'.format(type(client)))
+        # Every request of this action is sent with its timeout
+        set_request_timeout(client, timeout)
         ##########################
         ### Process the action ###
         ##########################
@@ -194,6 +237,9 @@ def run(config, action_file, dry_run=False):
                 else:
                     sys.exit(1)
         logger.info('Action ID: {0}, "{1}" completed.'.format(idx, action))
+    if client is not None:
+        logger.debug(
+            'Request cache: {0}'.format(request_cache_stats(client)))
     logger.info('Job completed.')
 
 @click.command()
@@ -8,7 +8,7 @@ from curator.cli_singletons.utils import get_width, validate_filter_json
 @click.option('--allocation_type', type=click.Choice(['require', 'include', 'exclude']))
 @click.option('--wait_for_completion/--no-wait_for_completion', default=False, help='Wait for the allocation to complete', show_default=True)
 @click.option('--max_wait', default=-1, type=int, help='Maximum number of seconds to wait_for_completion', show_default=True)
-@click.option('--wait_interval', default=9, type=int, help='Seconds to wait between completion checks.', show_default=True)
+@click.option('--wait_interval', default=9, type=int, help='Longest time in seconds between completion checks. Checks start sooner, and back off up to this.', show_default=True)
 @click.option('--ignore_empty_list', is_flag=True, help='Do not raise exception if there are no actionable indices')
 @click.option('--allow_ilm_indices/--no-allow_ilm_indices', help='Allow Curator to operate on Index Lifecycle Management monitored indices.', default=False, show_default=True)
 @click.option('--filter_list', callback=validate_filter_json, help='JSON array of filters selecting indices to act on.', required=True)
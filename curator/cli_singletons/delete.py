@@ -4,16 +4,17 @@ from curator.cli_singletons.utils import get_width, validate_filter_json
 
 #### Indices ####
 @click.command(context_settings=get_width())
+@click.option('--max_concurrent_chunks', type=int, default=1, show_default=True, help='Largest number of chunks of indices to send at the same time')
 @click.option('--ignore_empty_list', is_flag=True, help='Do not raise exception if there are no actionable indices')
 @click.option('--allow_ilm_indices/--no-allow_ilm_indices', help='Allow Curator to operate on Index Lifecycle Management monitored indices.', default=False, show_default=True)
 @click.option('--filter_list', callback=validate_filter_json, help='JSON array of filters selecting indices to act on.', required=True)
 @click.pass_context
-def delete_indices(ctx, ignore_empty_list, allow_ilm_indices, filter_list):
+def delete_indices(ctx, max_concurrent_chunks, ignore_empty_list, allow_ilm_indices, filter_list):
     """
     Delete Indices
     """
     # ctx.info_name is the name of the function or name specified in @click.command decorator
-    action = cli_action(ctx.info_name, ctx.obj['config']['client'], {'allow_ilm_indices':allow_ilm_indices}, filter_list, ignore_empty_list)
+    action = cli_action(ctx.info_name, ctx.obj['config']['client'], {'allow_ilm_indices':allow_ilm_indices, 'max_concurrent_chunks':max_concurrent_chunks}, filter_list, ignore_empty_list)
     action.do_singleton_action(dry_run=ctx.obj['dry_run'])
 
 #### Snapshots ####
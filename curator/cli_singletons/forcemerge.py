@@ -5,17 +5,21 @@ from curator.cli_singletons.utils import get_width, validate_filter_json
 @click.command(context_settings=get_width())
 @click.option('--max_num_segments', type=int, required=True, help='Maximum number of segments per shard (minimum of 1)')
 @click.option('--delay', type=float, help='Time in seconds to delay between operations. Default 0, maximum 3600')
+@click.option('--max_merges_per_node', type=int, default=0, show_default=True, help='Largest number of merges running at once on each node holding primaries. 0 merges one index at a time')
+@click.option('--max_duration', type=int, default=0, show_default=True, help='Seconds after which no more merges are started. 0 is no limit')
 @click.option('--ignore_empty_list', is_flag=True, help='Do not raise exception if there are no actionable indices')
 @click.option('--allow_ilm_indices/--no-allow_ilm_indices', help='Allow Curator to operate on Index Lifecycle Management monitored indices.', default=False, show_default=True)
 @click.option('--filter_list', callback=validate_filter_json, help='JSON array of filters selecting indices to act on.', required=True)
 @click.pass_context
-def forcemerge(ctx, max_num_segments, delay, ignore_empty_list, allow_ilm_indices, filter_list):
+def forcemerge(ctx, max_num_segments, delay, max_merges_per_node, max_duration, ignore_empty_list, allow_ilm_indices, filter_list):
     """
     forceMerge Indices (reduce segment count)
     """
     manual_options = { 
         'max_num_segments': max_num_segments,
         'delay': delay,
+        'max_merges_per_node': max_merges_per_node,
+        'max_duration': max_duration,
         'allow_ilm_indices': allow_ilm_indices,
     }
     # ctx.info_name is the name of the function or name specified in @click.command decorator
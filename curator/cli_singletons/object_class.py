@@ -8,7 +8,10 @@ from curator.actions import (
 from curator.defaults.settings import snapshot_actions
 from curator.exceptions import ConfigurationError, NoIndices, NoSnapshots
 from curator.validators import SchemaCheck, filters, options
-from curator.utils import get_client, prune_nones, validate_filters
+from curator.utils import (
+    get_client, get_search_pattern, pop_list_options, prune_nones,
+    size_connection_pool, validate_filters
+)
 from voluptuous import Schema
 
 
@@ -82,6 +85,9 @@ class cli_action():
                     self.action_kwargs[k] = kwargs[k] if k in kwargs else None
         else:
             self.check_filters(filter_list)
+        client_args = client_args.copy()
+        self.list_args = pop_list_options(client_args)
+        size_connection_pool(client_args, [self.options])
         self.client = get_client(**client_args)
         self.ignore = ignore_empty_list
 
@@ -146,7 +152,10 @@ class cli_action():
         if self.action in snapshot_actions() or self.action == 'show_snapshots':
             self.list_object = SnapshotList(self.client, repository=self.repository)
         else:
-            self.list_object = IndexList(self.client)
+            self.list_object = IndexList(
+                self.client, search_pattern=get_search_pattern(self.filters),
+                **self.list_args
+            )
 
     def get_alias_obj(self):
         action_obj = Alias(name=self.alias['name'], extra_settings=self.alias['extra_settings'])
@@ -159,7 +168,11 @@ class cli_action():
                         self.alias['name'] # 2 = the alias name
                     )
                 )
-                self.alias[k]['ilo'] = IndexList(self.client)
+                self.alias[k]['ilo'] = IndexList(
+                    self.client,
+                    search_pattern=get_search_pattern(self.alias[k]['filters']),
+                    **self.list_args
+                )
                 self.alias[k]['ilo'].iterate_filters({'filters':self.alias[k]['filters']})
                 f = getattr(action_obj, k)
                 f(self.alias[k]['ilo'], warn_if_no_indices=self.alias['wini'])
@@ -21,6 +21,10 @@ def show_indices(ctx, verbose, header, epoch, ignore_empty_list, allow_ilm_indic
     action = cli_action(ctx.info_name, ctx.obj['config']['client'], {'allow_ilm_indices': allow_ilm_indices}, filter_list, ignore_empty_list)
     action.get_list_object()
     action.do_filters()
+    action.list_object.load_index_info(
+        'state', 'creation_date', 'number_of_shards', 'number_of_replicas',
+        'size_in_bytes', 'docs'
+    )
     indices = sorted(action.list_object.indices)
     # Do some calculations to figure out the proper column sizes
     allbytes = []
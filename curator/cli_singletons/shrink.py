@@ -16,15 +16,17 @@ from curator.cli_singletons.utils import get_width, json_to_dict, validate_filte
 @click.option('--wait_for_active_shards', default=1, type=int, help='Wait for number of active shards before continuing')
 @click.option('--wait_for_rebalance/--no-wait_for_rebalance', default=True, help='Wait for rebalance to complete')
 @click.option('--wait_for_completion/--no-wait_for_completion', default=True, help='Wait for the shrink to complete')
-@click.option('--wait_interval', default=9, type=int, help='Seconds to wait between completion checks.')
+@click.option('--wait_interval', default=9, type=int, help='Longest time in seconds between completion checks. Checks start sooner, and back off up to this.')
 @click.option('--max_wait', default=-1, type=int, help='Maximum number of seconds to wait_for_completion')
+@click.option('--max_shrinks_per_node', default=0, type=int, help='Indices moved to or shrunk on each shrink node at a time. 0 shrinks one index at a time', show_default=True)
+@click.option('--shrink_placement', default='most_available', type=click.Choice(['most_available', 'least_movement']), help='How a DETERMINISTIC shrink node is chosen', show_default=True)
 @click.option('--ignore_empty_list', is_flag=True, help='Do not raise exception if there are no actionable indices')
 @click.option('--allow_ilm_indices/--no-allow_ilm_indices', help='Allow Curator to operate on Index Lifecycle Management monitored indices.', default=False, show_default=True)
 @click.option('--filter_list', callback=validate_filter_json, help='JSON array of filters selecting indices to act on.', required=True)
 @click.pass_context
 def shrink(ctx, shrink_node, node_filters, number_of_shards, number_of_replicas, shrink_prefix,
     shrink_suffix, copy_aliases, delete_after, post_allocation, extra_settings, wait_for_active_shards,
-    wait_for_rebalance, wait_for_completion, wait_interval, max_wait, ignore_empty_list, allow_ilm_indices, filter_list):
+    wait_for_rebalance, wait_for_completion, wait_interval, max_wait, max_shrinks_per_node, shrink_placement, ignore_empty_list, allow_ilm_indices, filter_list):
     """
     Shrink Indices to --number_of_shards
     """
@@ -44,6 +46,8 @@ def shrink(ctx, shrink_node, node_filters, number_of_shards, number_of_replicas,
         'wait_for_completion': wait_for_completion,
         'wait_interval': wait_interval,
         'max_wait': max_wait,
+        'max_shrinks_per_node': max_shrinks_per_node,
+        'shrink_placement': shrink_placement,
         'allow_ilm_indices': allow_ilm_indices,
     }
     # ctx.info_name is the name of the function or name specified in @click.command decorator
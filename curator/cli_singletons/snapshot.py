@@ -9,7 +9,7 @@ from curator.cli_singletons.utils import get_width, validate_filter_json
 @click.option('--include_global_state', is_flag=True, show_default=True, help='Store cluster global state with snapshot.')
 @click.option('--partial', is_flag=True, show_default=True, help='Do not fail if primary shard is unavailable.')
 @click.option('--wait_for_completion/--no-wait_for_completion', default=True, show_default=True, help='Wait for the snapshot to complete')
-@click.option('--wait_interval', default=9, type=int, help='Seconds to wait between completion checks.')
+@click.option('--wait_interval', default=9, type=int, help='Longest time in seconds between completion checks. Checks start sooner, and back off up to this.')
 @click.option('--max_wait', default=-1, type=int, help='Maximum number of seconds to wait_for_completion')
 @click.option('--skip_repo_fs_check', is_flag=True, show_default=True, help='Skip repository filesystem access validation.')
 @click.option('--ignore_empty_list', is_flag=True, help='Do not raise exception if there are no actionable indices')
@@ -24,6 +24,19 @@ def config_client():
         Optional('timeout', default=30): All(
             Coerce(int), Range(min=1, max=86400)),
         Optional('master_only', default=False): Boolean(),
+        Optional('index_inventory', default=None): Any(
+            None, 'cat', 'cluster_state'),
+        Optional('max_concurrent_requests', default=1): All(
+            Coerce(int), Range(min=1, max=32)),
+        Optional('field_stats_mode', default='aggs'): Any('aggs', 'sort'),
+        Optional('field_stats_cache', default=None): Any(None, *string_types),
+        Optional('field_stats_cache_size', default=100000): All(
+            Coerce(int), Range(min=1)),
+        Optional('reorder_filters', default=True): Boolean(),
+        Optional('url_budget', default=3072): All(
+            Coerce(int), Range(min=256, max=65536)),
+        Optional('cache_ttl', default=10): All(
+            Coerce(int), Range(min=0, max=3600)),
     }
 
 # Configuration file: logging
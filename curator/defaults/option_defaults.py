@@ -72,6 +72,29 @@ def indices():
 def key():
     return { Required('key'): Any(*string_types) }
 
+def max_concurrent_chunks():
+    return {
+        Optional('max_concurrent_chunks', default=1): All(
+            Coerce(int), Range(min=1, max=32))
+    }
+
+def max_duration():
+    return {
+        Optional('max_duration', default=0): All(Coerce(int), Range(min=0))
+    }
+
+def max_merges_per_node():
+    return {
+        Optional('max_merges_per_node', default=0): All(
+            Coerce(int), Range(min=0, max=32))
+    }
+
+def max_shrinks_per_node():
+    return {
+        Optional('max_shrinks_per_node', default=0): All(
+            Coerce(int), Range(min=0, max=32))
+    }
+
 def max_num_segments():
     return {
         Required('max_num_segments'): All(Coerce(int), Range(min=1, max=32768))
@@ -258,6 +281,12 @@ def cluster_routing_value():
 def shrink_node():
     return { Required('shrink_node'): Any(*string_types) }
 
+def shrink_placement():
+    return {
+        Optional('shrink_placement', default='most_available'): Any(
+            'most_available', 'least_movement')
+    }
+
 def shrink_prefix():
     return { Optional('shrink_prefix', default=''): Any(None, *string_types) }
 
@@ -12,6 +12,113 @@ def version_min():
 def config_file():
     return path.join(path.expanduser('~'), '.curator', 'curator.yml')
 
+# Client configuration settings which tune how Curator reads the cluster.
+# These are passed to IndexList, rather than to the Elasticsearch client.
+def list_options():
+    return [
+        'index_inventory', 'max_concurrent_requests', 'field_stats_mode',
+        'field_stats_cache', 'field_stats_cache_size', 'reorder_filters',
+    ]
+
+# Searches sent in each _msearch request for field_stats ages
+def msearch_batch_size():
+    return 100
+
+# Response filters for the index metadata IndexList reads, so that mappings
+# and other unused parts of the cluster state are never sent.
+def cluster_state_filter_path():
+    return ','.join([
+        'metadata.indices.*.state',
+        'metadata.indices.*.settings.index.creation_date',
+        'metadata.indices.*.settings.index.uuid',
+        'metadata.indices.*.settings.index.number_of_shards',
+        'metadata.indices.*.settings.index.number_of_replicas',
+        'metadata.indices.*.settings.index.routing',
+        'metadata.indices.*.settings.index.lifecycle',
+    ])
+
+# The index settings IndexList keeps for every index, and the response filter
+# which limits get_settings to them.
+def index_settings_keys():
+    return [
+        'uuid', 'creation_date', 'number_of_shards', 'number_of_replicas',
+        'routing', 'lifecycle',
+    ]
+
+def index_settings_filter_path():
+    return ','.join(
+        ['*.settings.index.{0}'.format(key) for key in index_settings_keys()])
+
+# Response filter for segment counts, so that only the total number of segments
+# in every copy of every shard of each index is sent.
+def segment_count_filter_path():
+    return 'indices.*.total.segments.count'
+
+# Response filter for the nodes holding the primary shards of each index
+def primary_routing_filter_path():
+    return ','.join([
+        'routing_table.indices.*.shards.*.primary',
+        'routing_table.indices.*.shards.*.node',
+    ])
+
+# Response filters for the node names, roles, data paths and free disk space
+# read by NodeTopology
+def node_info_filter_path():
+    return 'nodes.*.name,nodes.*.roles'
+
+def node_fs_filter_path():
+    return 'nodes.*.name,nodes.*.fs.data.path,nodes.*.fs.total'
+
+# Response filter for the node, primary flag and size of every shard copy
+def shard_placement_filter_path():
+    return ','.join([
+        'indices.*.shards.*.routing.node',
+        'indices.*.shards.*.routing.primary',
+        'indices.*.shards.*.store.size_in_bytes',
+    ])
+
+# Response filter for the state of every shard copy
+def shard_state_filter_path():
+    return 'routing_table.indices.*.shards.*.state'
+
+# Seconds before the first repeated check of a pending operation, doubled for
+# each check after, up to its wait_interval
+def wait_backoff_initial():
+    return 1
+
+# Most forceMerges the forcemerge action runs at once, each holding a thread
+# and a connection
+def forcemerge_max_threads():
+    return 32
+
+# Seconds for which responses of the cached request paths are reused
+def cache_ttl():
+    return 10
+
+# GET requests which the client answers from its cache while fresh.  These
+# change slowly, but some actions read them again and again.
+def cached_request_paths():
+    return [ '/', '/_nodes' ]
+
+# Parts of a cached path whose responses change quickly, and are never cached,
+# such as node statistics with free disk space
+def uncached_request_parts():
+    return [ 'stats' ]
+
+# Endpoints which are sent as POST but do not change the cluster, so do not
+# empty the request cache
+def read_only_post_endpoints():
+    return [ '_search', '_msearch', '_count', '_field_caps', '_explain' ]
+
+# Seconds to wait before the first retry of indices which failed to delete.
+# The wait doubles for each later retry.
+def delete_retry_backoff():
+    return 2
+
+# Columns requested from _cat/indices for the "cat" index_inventory
+def cat_indices_columns():
+    return 'index,uuid,status,creation.date,pri,rep,docs.count,docs.deleted,store.size'
+
 # Default filter patterns (regular expressions)
 def regex_map():
     return {
@@ -59,6 +166,16 @@ def index_actions():
         'snapshot',
     ]
 
+# Actions which create indices, after which the indices in a run's
+# IndexSnapshot must be listed again
+def index_creating_actions():
+    return [ 'create_index', 'reindex', 'restore', 'rollover', 'shrink' ]
+
+# Actions which may change existing indices without reporting which, e.g. by
+# restoring over them, writing into them, or moving aliases off them
+def index_changing_actions():
+    return [ 'reindex', 'restore', 'rollover' ]
+
 def snapshot_actions():
     return [ 'delete_snapshots', 'restore' ]
 
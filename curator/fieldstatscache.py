@@ -0,0 +1,110 @@
+import os
+import time
+import logging
+import sqlite3
+
+class FieldStatsCache(object):
+    def __init__(self, path, max_entries=100000):
+        """
+        A local sqlite file of the min and max values of fields in indices,
+        so that ``field_stats`` ages need not be queried again on every run.
+
+        Entries are keyed by index UUID and field name, and hold a fingerprint
+        of the index contents when the values were read.  An entry is only
+        used while the fingerprint still matches.  When the file holds more
+        than `max_entries`, the least recently used entries are removed.
+
+        :arg path: The path to the cache file.  It is created if missing.
+        :arg max_entries: The largest number of entries to keep.
+            Default: ``100000``
+        """
+        self.loggit = logging.getLogger('curator.fieldstatscache')
+        #: Instance variable.
+        #: The path to the cache file.
+        self.path = os.path.expanduser(path)
+        #: Instance variable.
+        #: The largest number of entries kept in the cache file.
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS field_stats ('
+            'uuid TEXT NOT NULL, field TEXT NOT NULL, '
+            'fingerprint TEXT NOT NULL, min_value INTEGER, max_value INTEGER, '
+            'used REAL NOT NULL, PRIMARY KEY (uuid, field))'
+        )
+        self.conn.commit()
+
+    def get(self, uuid, field, fingerprint):
+        """
+        Return the cached ``(min_value, max_value)`` of `field` in the index
+        with `uuid`, or `None` if there is no entry, or it was stored with a
+        different `fingerprint`.
+
+        :arg uuid: An index UUID
+        :arg field: A field name
+        :arg fingerprint: The current fingerprint of the index
+        :rtype: tuple
+        """
+        row = self.conn.execute(
+            'SELECT min_value, max_value FROM field_stats '
+            'WHERE uuid = ? AND field = ? AND fingerprint = ?',
+            (uuid, field, fingerprint)
+        ).fetchone()
+        if row is None:
+            return None
+        self.conn.execute(
+            'UPDATE field_stats SET used = ? WHERE uuid = ? AND field = ?',
+            (time.time(), uuid, field)
+        )
+        return row[0], row[1]
+
+    def put(self, entries):
+        """
+        Store `entries`, replacing any older entry for the same index and
+        field, then remove the least recently used entries beyond
+        `max_entries`.
+
+        :arg entries: A list of ``(uuid, field, fingerprint, min_value,
+            max_value)`` tuples
+        """
+        now = time.time()
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO field_stats '
+            '(uuid, field, fingerprint, min_value, max_value, used) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [entry + (now,) for entry in entries]
+        )
+        self.conn.execute(
+            'DELETE FROM field_stats WHERE rowid NOT IN ('
+            'SELECT rowid FROM field_stats ORDER BY used DESC LIMIT ?)',
+            (self.max_entries,)
+        )
+        self.conn.commit()
+
+    def prune(self, uuids):
+        """
+        Remove the entries for every index whose UUID is not in `uuids`.
+
+        :arg uuids: The UUIDs of every index in the cluster
+        """
+        live = set(uuids)
+        stale = [
+            row[0] for row in
+            self.conn.execute('SELECT DISTINCT uuid FROM field_stats')
+            if row[0] not in live
+        ]
+        if stale:
+            self.loggit.debug(
+                'Removing cached field stats for {0} deleted '
+                'indices'.format(len(stale))
+            )
+            self.conn.executemany(
+                'DELETE FROM field_stats WHERE uuid = ?',
+                [(uuid,) for uuid in stale]
+            )
+        self.conn.commit()
+
+    def close(self):
+        """Commit any changes and close the cache file."""
+        self.conn.commit()
+        self.conn.close()
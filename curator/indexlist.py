@@ -1,25 +1,109 @@
 from datetime import timedelta, datetime, date
 import time
 import re
+import fnmatch
 import itertools
 import logging
+import sqlite3
+from collections import OrderedDict
 from elasticsearch.exceptions import NotFoundError, TransportError
 from curator import exceptions, utils
 from curator.defaults import settings
+from curator.fieldstatscache import FieldStatsCache
+from curator.indexsnapshot import IndexSnapshot
 from curator.validators import SchemaCheck, filters
 
 class IndexList(object):
-    def __init__(self, client):
+    def __init__(self, client, search_pattern='_all', index_inventory=None,
+            max_concurrent_requests=1, field_stats_mode='aggs',
+            field_stats_cache=None, field_stats_cache_size=100000,
+            reorder_filters=True, snapshot=None):
         utils.verify_client_object(client)
         self.loggit = logging.getLogger('curator.indexlist')
         #: An Elasticsearch Client object
         #: Also accessible as an instance variable.
         self.client = client
+        #: An Elasticsearch index expression limiting which indices are
+        #: fetched from the cluster, e.g. ``logstash-*``.  Default is ``_all``.
+        #: :py:func:`curator.utils.get_search_pattern` builds one from the
+        #: leading filters of an action.
+        #: Also accessible as an instance variable.
+        self.search_pattern = search_pattern
+        #: How the list of indices is first read from the cluster.  With
+        #: ``None`` (the default), only index names are read, and everything
+        #: else is fetched by :py:meth:`load_index_info` as needed.  With
+        #: ``cat``, a single ``_cat/indices`` request also fills the state,
+        #: creation date, shard and replica counts, doc count and size of every
+        #: open index.  With ``cluster_state``, a single, trimmed cluster state
+        #: request fills everything but the doc count and size.
+        #: Also accessible as an instance variable.
+        self.index_inventory = index_inventory
+        #: The largest number of chunked requests for index information which
+        #: may be sent to Elasticsearch at the same time.  Default is ``1``.
+        #: Also accessible as an instance variable.
+        self.max_concurrent_requests = max_concurrent_requests
+        if field_stats_mode not in ['aggs', 'sort']:
+            raise exceptions.ConfigurationError(
+                'Invalid field_stats_mode: {0}'.format(field_stats_mode))
+        #: How ``field_stats`` ages are queried.  With ``aggs`` (the default),
+        #: one search per index asks for min and max aggregations of the
+        #: field.  With ``sort``, two searches per index each return the single
+        #: oldest or newest document, which is often cheaper on large indices.
+        #: Also accessible as an instance variable.
+        self.field_stats_mode = field_stats_mode
+        #: The path to a local file which keeps ``field_stats`` ages between
+        #: runs, so that only indices which changed since are queried.
+        #: Default is `None`, which queries every index.  See
+        #: :py:class:`curator.fieldstatscache.FieldStatsCache`.
+        #: Also accessible as an instance variable.
+        self.field_stats_cache = field_stats_cache
+        #: The largest number of entries kept in `field_stats_cache`.
+        #: Default is ``100000``.
+        #: Also accessible as an instance variable.
+        self.field_stats_cache_size = field_stats_cache_size
+        #: Whether :py:meth:`iterate_filters` runs filters in the order from
+        #: :py:meth:`plan_filters`, rather than the order given.  Default is
+        #: `True`.
+        #: Also accessible as an instance variable.
+        self.reorder_filters = reorder_filters
+        #: The :py:class:`curator.indexsnapshot.IndexSnapshot` which holds
+        #: what is read from the cluster about each index.  Passing the same
+        #: snapshot to several IndexList objects, as the actions in a run do,
+        #: means each index is only listed and read once.  Default is a new,
+        #: private snapshot.
+        #: Also accessible as an instance variable.
+        self.snapshot = snapshot if snapshot is not None else IndexSnapshot()
         #: Instance variable.
         #: Information extracted from indices, such as segment count, age, etc.
-        #: Populated at instance creation time, and by other private helper
-        #: methods, as needed. **Type:** ``dict()``
-        self.index_info = {}
+        #: Populated on demand by :py:meth:`load_index_info` and by other
+        #: private helper methods, as needed. **Type:** ``dict()``
+        self.index_info = self.snapshot.index_info
+        #: Instance variable.
+        #: The settings of each index which Curator reads, in a compact form:
+        #: the keys of the ``index`` settings listed in
+        #: :py:func:`curator.defaults.settings.index_settings_keys`.  Read from
+        #: the cluster once and shared by every filter.  Use
+        #: :py:meth:`refresh_settings` to read them again. **Type:** ``dict()``
+        self.index_settings = self.snapshot.index_settings
+        #: Instance variable.
+        #: The set of alias names of each index matched by `search_pattern`.
+        #: `None` until :py:meth:`load_aliases` reads it, with a single request,
+        #: for the first filter or action which needs it. **Type:** ``dict()``
+        self.index_aliases = None
+        #: Instance variable.
+        #: The reverse of `index_aliases`: the set of indices in each alias.
+        #: **Type:** ``dict()``
+        self.alias_indices = None
+        # Indices for which each group of fields in `index_info` has already
+        # been fetched.  See `load_index_info`.
+        self.__loaded = self.snapshot.loaded
+        # The actionable indices are tracked in an ordered, hashed collection
+        # so that membership tests and removals stay constant-time no matter
+        # how many indices the cluster holds.  ``indices`` is a list view of
+        # it, rebuilt only when read after a change.
+        self.__members = OrderedDict()
+        self.__view = []
+        self.__view_stale = False
         #: Instance variable.
         #: The running list of indices which will be used by an Action class.
         #: Populated at instance creation time. **Type:** ``list()``
@@ -30,6 +114,36 @@ class IndexList(object):
         self.all_indices = []
         self.__get_indices()
 
+    @property
+    def indices(self):
+        """
+        The running list of indices which will be used by an Action class.
+        Assigning a list replaces the actionable set with its contents.
+        """
+        self.__sync_members()
+        return self.__view
+
+    @indices.setter
+    def indices(self, value):
+        if not isinstance(value, list):
+            value = list(value)
+        self.__view = value
+        self.__members = OrderedDict.fromkeys(value)
+        self.__view_stale = False
+
+    def __sync_members(self):
+        """
+        Bring `indices` and the actionable set back in line with each other.
+        The list view is refreshed in place, so references to it held
+        elsewhere see the change.  If the view was modified directly (e.g.
+        appended to), the actionable set is rebuilt from it.
+        """
+        if self.__view_stale:
+            self.__view[:] = list(self.__members)
+            self.__view_stale = False
+        elif len(self.__view) != len(self.__members):
+            self.__members = OrderedDict.fromkeys(self.__view)
+
     def __actionable(self, idx):
         self.loggit.debug(
             'Index {0} is actionable and remains in the list.'.format(idx))
@@ -37,7 +151,18 @@ class IndexList(object):
     def __not_actionable(self, idx):
             self.loggit.debug(
                 'Index {0} is not actionable, removing from list.'.format(idx))
-            self.indices.remove(idx)
+            self.__discard(idx)
+
+    def __discard(self, idx):
+        """
+        Remove `idx` from the actionable set in constant time.
+        """
+        if not self.__view_stale:
+            self.__sync_members()
+        if idx not in self.__members:
+            raise ValueError('{0} is not in the actionable list'.format(idx))
+        del self.__members[idx]
+        self.__view_stale = True
 
     def __excludify(self, condition, exclude, index, msg=None):
         if condition == True:
@@ -60,16 +185,120 @@ class IndexList(object):
     def __get_indices(self):
         """
         Pull all indices into `all_indices`, then populate `indices` and
-        `index_info`
+        `index_info`.  Only the index names are fetched here.  Everything else
+        in `index_info` is fetched by :py:meth:`load_index_info` when a filter
+        or action first needs it.
         """
-        self.loggit.debug('Getting all indices')
-        self.all_indices = utils.get_indices(self.client)
-        self.indices = self.all_indices[:]
-        if self.indices:
-            for index in self.indices:
+        self.loggit.debug(
+            'Getting all indices matching {0}'.format(self.search_pattern))
+        listing = self.snapshot.get_listing(self.search_pattern)
+        if listing is not None:
+            self.loggit.debug(
+                'Found {0} indices in the snapshot'.format(len(listing)))
+            self.all_indices = listing
+            self.indices = self.all_indices[:]
+            for index in self.all_indices:
+                self.__build_index_info(index)
+                # Ages from the filters of an earlier list do not apply
+                age = self.index_info[index]['age']
+                for key in list(age):
+                    if key != 'creation_date':
+                        del age[key]
+            return
+        if self.index_inventory == 'cat':
+            self._get_cat_inventory()
+        elif self.index_inventory == 'cluster_state':
+            self._get_cluster_state_inventory()
+        elif self.index_inventory is None:
+            # Listing by settings also fills the settings snapshot
+            try:
+                response = self._get_settings([self.search_pattern])
+            except Exception as e:
+                raise exceptions.FailedExecution(
+                    'Failed to get indices. Error: {0}'.format(e))
+            self.all_indices = list(response)
+            self.indices = self.all_indices[:]
+            for index in self.all_indices:
                 self.__build_index_info(index)
-            self._get_metadata()
-            self._get_index_stats()
+                self.__store_settings(index, response[index])
+        else:
+            raise exceptions.ConfigurationError(
+                'Invalid index_inventory: {0}'.format(self.index_inventory))
+        self.snapshot.add_listing(self.search_pattern, self.all_indices)
+
+    def _get_cat_inventory(self):
+        """
+        Populate `all_indices`, `indices` and `index_info` from a single
+        ``_cat/indices`` request.  It has no routing information, and nothing
+        but the state for closed indices, so those fields are left for
+        :py:meth:`load_index_info` to fetch.
+
+        .. note:: The ``_cat/indices`` doc count is for primary shards only,
+            while the index stats count includes replicas.  Either way, an
+            empty index has a count of zero.
+        """
+        try:
+            response = self.client.cat.indices(
+                index=self.search_pattern, format='json',
+                h=settings.cat_indices_columns(), bytes='b'
+            )
+        except Exception as e:
+            raise exceptions.FailedExecution(
+                'Failed to get indices. Error: {0}'.format(e))
+        self.all_indices = [entry['index'] for entry in response]
+        self.indices = self.all_indices[:]
+        for entry in response:
+            index = entry['index']
+            self.__build_index_info(index)
+            info = self.index_info[index]
+            info['state'] = entry['status']
+            info['uuid'] = entry.get('uuid') or ''
+            if None in [entry.get('creation.date'), entry.get('pri'),
+                    entry.get('rep')]:
+                # Closed indices only have a state here
+                continue
+            info['age']['creation_date'] = utils.fix_epoch(
+                entry['creation.date'])
+            info['number_of_shards'] = entry['pri']
+            info['number_of_replicas'] = entry['rep']
+            info['size_in_bytes'] = int(entry.get('store.size') or 0)
+            info['docs'] = int(entry.get('docs.count') or 0)
+            info['deleted_docs'] = int(entry.get('docs.deleted') or 0)
+            # The _cat/indices doc count is for primaries already
+            info['primary_docs'] = info['docs']
+            self.__loaded['metadata'].add(index)
+            self.__loaded['stats'].add(index)
+        self.loggit.debug(
+            'Read {0} indices from _cat/indices'.format(len(self.all_indices)))
+
+    def _get_cluster_state_inventory(self):
+        """
+        Populate `all_indices`, `indices` and `index_info` from a single
+        cluster state request, trimmed to the fields Curator reads.  Index
+        stats are left for :py:meth:`load_index_info` to fetch.
+        """
+        try:
+            response = self.client.cluster.state(
+                index=self.search_pattern, metric='metadata',
+                expand_wildcards='open,closed',
+                filter_path=settings.cluster_state_filter_path()
+            )
+        except Exception as e:
+            raise exceptions.FailedExecution(
+                'Failed to get indices. Error: {0}'.format(e))
+        metadata = response.get('metadata', {}).get('indices', {})
+        self.all_indices = list(metadata.keys())
+        self.indices = self.all_indices[:]
+        for index in self.all_indices:
+            self.__build_index_info(index)
+        for index in self.all_indices:
+            self.__fill_metadata(index, metadata[index])
+        self.__loaded['metadata'].update(self.all_indices)
+        self.__loaded['routing'].update(self.all_indices)
+        self.loggit.debug(
+            'Read {0} indices from the cluster state'.format(
+                len(self.all_indices))
+        )
 
     def __build_index_info(self, index):
         """
@@ -86,9 +315,62 @@ class IndexList(object):
                 "segments" : 0,
                 "size_in_bytes" : 0,
                 "docs" : 0,
+                "deleted_docs" : 0,
+                "primary_docs" : 0,
                 "state" : "",
+                "uuid" : "",
             }
 
+    def __field_group(self, field):
+        groups = {
+            'state': 'metadata',
+            'uuid': 'metadata',
+            'creation_date': 'metadata',
+            'number_of_shards': 'metadata',
+            'number_of_replicas': 'metadata',
+            'routing': 'routing',
+            'size_in_bytes': 'stats',
+            'docs': 'stats',
+            'deleted_docs': 'stats',
+            'primary_docs': 'stats',
+            'segments': 'segments',
+        }
+        if field not in groups:
+            raise ValueError('Invalid index_info field: {0}'.format(field))
+        return groups[field]
+
+    def __fetch(self, indices, exec_func):
+        """
+        Call `exec_func` with `indices`, split into chunks short enough to send
+        in a request URL, sending up to `max_concurrent_requests` at the same
+        time, and return the responses in order.  Chunks which Elasticsearch
+        rejects as too large are split further by
+        :py:func:`curator.utils.chunked_requests`.  If `indices` is every index
+        matched by `search_pattern`, the pattern itself is sent first, so one
+        short request covers them all.
+        """
+        def fetch(data):
+            try:
+                return exec_func(data)
+            except TransportError as err:
+                if utils.IndexChunker.too_large(err):
+                    raise
+                self.loggit.debug(
+                    'Request for {0} indices failed: {1}'.format(len(data), err))
+                return {}
+        if (self.search_pattern != '_all'
+                and len(indices) == len(self.all_indices)
+                and set(indices) == set(self.all_indices)):
+            try:
+                return [fetch([self.search_pattern])]
+            except TransportError:
+                self.loggit.debug(
+                    'Request for "{0}" was too large.  Requesting indices by '
+                    'name instead.'.format(self.search_pattern)
+                )
+        return utils.chunked_requests(
+            indices, fetch, self.max_concurrent_requests)
+
     def __map_method(self, ft):
         methods = {
             'alias': self.filter_by_alias,
@@ -107,18 +389,66 @@ class IndexList(object):
         }
         return methods[ft]
 
-    def _get_index_stats(self):
+    def load_index_info(self, *fields):
+        """
+        Make sure `index_info` holds `fields` for every index in the actionable
+        list.  Fields are fetched in groups: ``state``, ``creation_date``,
+        ``number_of_shards``, ``number_of_replicas`` and ``routing`` come from
+        the cluster state, ``size_in_bytes``, ``docs``, ``deleted_docs`` and
+        ``primary_docs`` from the index stats, and ``segments`` from the
+        segments API.  A group is only requested the first time one of its
+        fields is needed, and only for indices in the actionable list which do
+        not have it yet.
+
+        :arg fields: One or more of the field names above.
+        """
+        groups = set(self.__field_group(field) for field in fields)
+        if 'stats' in groups:
+            # Closed indices are skipped when fetching stats, so state is
+            # needed first.
+            groups.add('metadata')
+        loaders = [
+            ('metadata', self._get_metadata),
+            ('routing', self._get_metadata),
+            ('stats', self._get_index_stats),
+            ('segments', self._get_segment_counts),
+        ]
+        for group, loader in loaders:
+            if group not in groups:
+                continue
+            needful = [
+                index for index in self.working_list()
+                if index not in self.__loaded[group]
+            ]
+            if needful:
+                self.loggit.debug(
+                    'Loading index {0} for {1} indices'.format(
+                        group, len(needful))
+                )
+                loader(needful)
+
+    def _get_index_stats(self, indices=None):
         """
         Populate `index_info` with index `size_in_bytes` and doc count
         information for each index.
+
+        :arg indices: The indices to fetch stats for.  Default is every index
+            in the actionable list.
         """
         self.loggit.debug('Getting index stats')
         self.empty_list_check()
         # Subroutine to do the dirty work
         def iterate_over_stats(stats):
             for index in stats['indices']:
+                if index not in requested:
+                    # Only possible if search_pattern now matches more
+                    continue
                 size = stats['indices'][index]['total']['store']['size_in_bytes']
                 docs = stats['indices'][index]['total']['docs']['count']
+                deleted = stats['indices'][index]['total']['docs'].get(
+                    'deleted', 0)
+                primary_docs = stats['indices'][index].get(
+                    'primaries', {}).get('docs', {}).get('count', 0)
                 self.loggit.debug(
                     'Index: {0}  Size: {1}  Docs: {2}'.format(
                         index, utils.byte_size(size), docs
@@ -126,103 +456,237 @@ class IndexList(object):
                 )
                 self.index_info[index]['size_in_bytes'] = size
                 self.index_info[index]['docs'] = docs
-
-        working_list = self.working_list()
-        for index in self.working_list():
-            if self.index_info[index]['state'] == 'close':
-                working_list.remove(index)
+                self.index_info[index]['deleted_docs'] = deleted
+                self.index_info[index]['primary_docs'] = primary_docs
+
+        if indices is None:
+            indices = self.working_list()
+        self.__loaded['stats'].update(indices)
+        working_list = [
+            index for index in indices
+            if self.index_info[index]['state'] != 'close'
+        ]
+        requested = set(working_list)
         if working_list:
-            index_lists = utils.chunk_index_list(working_list)
-            for l in index_lists:
-                stats_result = {}
-
-                try:
-                    stats_result.update(self._get_indices_stats(l))
-                except TransportError as err:
-                    if err.status_code == 413:
-                        self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                        stats_result = {}
-                        stats_result.update(self._bulk_queries(l, self._get_indices_stats))
-
-                iterate_over_stats(stats_result)
+            responses = self.__fetch(working_list, self._get_indices_stats)
+            for stats_result in responses:
+                if stats_result:
+                    iterate_over_stats(stats_result)
 
     def _get_indices_stats(self, data):
         return self.client.indices.stats(index=utils.to_csv(data), metric='store,docs')
 
-    def _bulk_queries(self, data, exec_func):
-        slice_number = 10
-        query_result = {}
-        loop_number = round(len(data)/slice_number) if round(len(data)/slice_number) > 0 else 1
-        self.loggit.debug("Bulk Queries - number requests created: {0}".format(loop_number))
+    def _get_cluster_state(self, data):
+        return self.client.cluster.state(
+            index=utils.to_csv(data), metric='metadata',
+            expand_wildcards='open,closed',
+            filter_path=settings.cluster_state_filter_path()
+        ).get('metadata', {}).get('indices', {})
+
+    def _get_index_states(self, data):
+        return self.client.cluster.state(
+            index=utils.to_csv(data), metric='metadata',
+            expand_wildcards='open,closed',
+            filter_path='metadata.indices.*.state'
+        ).get('metadata', {}).get('indices', {})
+
+    def _get_settings(self, data):
+        return self.client.indices.get_settings(
+            index=utils.to_csv(data), expand_wildcards='open,closed',
+            filter_path=settings.index_settings_filter_path()
+        )
 
-        for num in range(0, loop_number):
-            if num == (loop_number-1):
-                data_sliced = data[num*slice_number:]
-            else:
-                data_sliced = data[num*slice_number:(num+1)*slice_number]
-            query_result.update(exec_func(data_sliced))
+    def __store_settings(self, index, response):
+        """
+        Keep the compact form of the settings of `index` from `response`, its
+        entry in a ``get_settings`` response or the cluster state.
+        """
+        index_settings = response.get('settings', {}).get('index', {})
+        self.index_settings[index] = dict(
+            (key, index_settings[key]) for key in settings.index_settings_keys()
+            if key in index_settings
+        )
 
-        return query_result
+    def __load_settings(self, indices):
+        """
+        Make sure `index_settings` holds the settings of each of `indices`
+        which still exists, fetching any which are missing.
+        """
+        missing = [index for index in indices if index not in self.index_settings]
+        if not missing:
+            return
+        self.loggit.debug('Getting settings for {0} indices'.format(len(missing)))
+        requested = set(missing)
+        for response in self.__fetch(missing, self._get_settings):
+            for index in list(response.keys()):
+                if index in requested:
+                    self.__store_settings(index, response[index])
+
+    def refresh_settings(self, indices=None):
+        """
+        Discard the settings snapshot in `index_settings`, and the fields of
+        `index_info` read from it, so that they are read from the cluster again
+        when next needed.
 
-    def _get_cluster_state(self, data):
-        return self.client.cluster.state(index=utils.to_csv(data), metric='metadata')['metadata']['indices']
+        :arg indices: The indices to discard settings for.  Default is every
+            index.
+        """
+        if indices is None:
+            indices = list(self.index_settings)
+        for index in indices:
+            self.index_settings.pop(index, None)
+            self.__loaded['metadata'].discard(index)
+            self.__loaded['routing'].discard(index)
+
+    def mark_changed(self, indices):
+        """
+        Record that an action changed `indices`, e.g. opened, closed or merged
+        them, so that everything but their names is read from the cluster
+        again when next needed, by this or any IndexList sharing `snapshot`.
 
-    def _get_metadata(self):
+        :arg indices: A list of index names
         """
-        Populate `index_info` with index `size_in_bytes` and doc count
-        information for each index.
+        self.snapshot.changed(indices)
+
+    def mark_deleted(self, indices):
+        """
+        Record that an action deleted `indices`, so that IndexList objects
+        built later from `snapshot` do not list them.
+
+        :arg indices: A list of index names
+        """
+        self.snapshot.deleted(indices)
+
+    def load_aliases(self):
+        """
+        Make sure `index_aliases` and `alias_indices` hold the aliases of every
+        index matched by `search_pattern`, reading them with one request the
+        first time they are needed.  Use :py:meth:`refresh_aliases` to read
+        them again.
+        """
+        if self.index_aliases is not None:
+            return
+        self.loggit.debug(
+            'Getting aliases of indices matching {0}'.format(self.search_pattern))
+        try:
+            response = self.client.indices.get_alias(index=self.search_pattern)
+        except NotFoundError:
+            # No index matched by search_pattern has an alias
+            response = {}
+        self.index_aliases = {}
+        self.alias_indices = {}
+        for index in response:
+            for alias in response[index].get('aliases', {}):
+                self.__map_alias(index, alias, True)
+
+    def refresh_aliases(self):
+        """
+        Discard `index_aliases` and `alias_indices`, so that they are read from
+        the cluster again when next needed.
+        """
+        self.index_aliases = None
+        self.alias_indices = None
+
+    def __map_alias(self, index, alias, present):
+        if present:
+            self.index_aliases.setdefault(index, set()).add(alias)
+            self.alias_indices.setdefault(alias, set()).add(index)
+        else:
+            self.index_aliases.get(index, set()).discard(alias)
+            self.alias_indices.get(alias, set()).discard(index)
+
+    def apply_alias_actions(self, actions):
+        """
+        Bring `index_aliases` and `alias_indices`, if already read, in line
+        with alias `actions` which have been sent to ``update_aliases``.
+
+        :arg actions: A list of ``add`` and ``remove`` alias actions, as in the
+            body of an ``update_aliases`` request.
+        """
+        if self.index_aliases is None:
+            return
+        for action in actions:
+            for job in action:
+                self.__map_alias(
+                    action[job]['index'], action[job]['alias'], job == 'add')
+
+    def __fill_metadata(self, index, wl):
+        """
+        Populate `index_info` for `index` from its cluster state metadata, `wl`
+        """
+        s = self.index_info[index]
+
+        if 'settings' not in wl:
+            # Used by AWS ES <= 5.1
+            # We can try to get the same info from index/_settings.
+            # workaround for https://github.com/elastic/curator/issues/880
+            alt_wl = self.client.indices.get(index, feature='_settings')[index]
+            wl['settings'] = alt_wl['settings']
+
+        if 'creation_date' not in wl['settings']['index']:
+            self.loggit.warn(
+                'Index: {0} has no "creation_date"! This implies '
+                'that the index predates Elasticsearch v1.4. For '
+                'safety, this index will be removed from the '
+                'actionable list.'.format(index)
+            )
+            self.__not_actionable(index)
+        else:
+            s['age']['creation_date'] = (
+                utils.fix_epoch(wl['settings']['index']['creation_date'])
+            )
+        s['number_of_replicas'] = (
+            wl['settings']['index']['number_of_replicas']
+        )
+        s['number_of_shards'] = (
+            wl['settings']['index']['number_of_shards']
+        )
+        s['state'] = wl['state']
+        s['uuid'] = wl['settings']['index'].get('uuid', '')
+        if 'routing' in wl['settings']['index']:
+            s['routing'] = wl['settings']['index']['routing']
+        if index not in self.index_settings:
+            self.__store_settings(index, wl)
+
+    def _get_metadata(self, indices=None):
+        """
+        Populate `index_info` with index state, creation date, shard and
+        replica counts, and routing information for each index.
+
+        :arg indices: The indices to fetch metadata for.  Default is every index
+            in the actionable list.
         """
         self.loggit.debug('Getting index metadata')
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = {}
-            try:
-                working_list.update(self._get_cluster_state(l))
-            except TransportError as err:
-                if err.status_code == 413:
-                    self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                    working_list = {}
-                    working_list.update(self._bulk_queries(l, self._get_cluster_state))
-
+        if indices is None:
+            indices = self.working_list()
+        self.__loaded['metadata'].update(indices)
+        self.__loaded['routing'].update(indices)
+        requested = set(indices)
+        # Only ask for settings if some are missing from the snapshot
+        if [index for index in indices if index not in self.index_settings]:
+            exec_func = self._get_cluster_state
+        else:
+            exec_func = self._get_index_states
+        for working_list in self.__fetch(indices, exec_func):
             if working_list:
                 for index in list(working_list.keys()):
-                    s = self.index_info[index]
+                    if index not in requested:
+                        # Only possible if search_pattern now matches more
+                        continue
                     wl = working_list[index]
-
-                    if 'settings' not in wl:
-                        # Used by AWS ES <= 5.1
-                        # We can try to get the same info from index/_settings.
-                        # workaround for https://github.com/elastic/curator/issues/880
-                        alt_wl = self.client.indices.get(index, feature='_settings')[index]
-                        wl['settings'] = alt_wl['settings']
-
-                    if 'creation_date' not in wl['settings']['index']:
-                        self.loggit.warn(
-                            'Index: {0} has no "creation_date"! This implies '
-                            'that the index predates Elasticsearch v1.4. For '
-                            'safety, this index will be removed from the '
-                            'actionable list.'.format(index)
-                        )
-                        self.__not_actionable(index)
-                    else:
-                        s['age']['creation_date'] = (
-                            utils.fix_epoch(wl['settings']['index']['creation_date'])
-                        )
-                    s['number_of_replicas'] = (
-                        wl['settings']['index']['number_of_replicas']
-                    )
-                    s['number_of_shards'] = (
-                        wl['settings']['index']['number_of_shards']
-                    )
-                    s['state'] = wl['state']
-                    if 'routing' in wl['settings']['index']:
-                        s['routing'] = wl['settings']['index']['routing']
+                    if index in self.index_settings:
+                        wl = {
+                            'state': wl['state'],
+                            'settings': {'index': self.index_settings[index]},
+                        }
+                    self.__fill_metadata(index, wl)
 
     def empty_list_check(self):
         """Raise exception if `indices` is empty"""
         self.loggit.debug('Checking for empty list')
-        if not self.indices:
+        self.__sync_members()
+        if not self.__members:
             raise exceptions.NoIndices('index_list object is empty.')
 
     def working_list(self):
@@ -233,38 +697,39 @@ class IndexList(object):
         # Copy by value, rather than reference to prevent list stomping during
         # iterations
         self.loggit.debug('Generating working list of indices')
-        return self.indices[:]
+        self.__sync_members()
+        return list(self.__members)
 
     def _get_indices_segments(self, data):
-        return self.client.indices.segments(index=utils.to_csv(data))['indices'].copy()
+        return self.client.indices.stats(
+            index=utils.to_csv(data), metric='segments',
+            filter_path=settings.segment_count_filter_path()
+        ).get('indices', {})
 
-    def _get_segment_counts(self):
+    def _get_segment_counts(self, indices=None):
         """
-        Populate `index_info` with segment information for each index.
+        Populate `index_info` with the number of segments in each index, summed
+        over every copy of every shard.  The counts come from the index stats,
+        trimmed to the segment count, rather than the segments API, which
+        lists every segment.
+
+        :arg indices: The indices to fetch segment counts for.  Default is
+            every index in the actionable list.
         """
         self.loggit.debug('Getting index segment counts')
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = {}
-            try:
-                working_list.update(self._get_indices_segments(l))
-            except TransportError as err:
-                if err.status_code == 413:
-                    self.loggit.debug('Huge Payload 413 Error - Trying to get information with multiple requests')
-                    working_list = {}
-                    working_list.update(self._bulk_queries(l, self._get_indices_segments))  
-
+        if indices is None:
+            indices = self.working_list()
+        self.__loaded['segments'].update(indices)
+        requested = set(indices)
+        responses = self.__fetch(indices, self._get_indices_segments)
+        for working_list in responses:
             if working_list:
                 for index in list(working_list.keys()):
-                    shards = working_list[index]['shards']
-                    segmentcount = 0
-                    for shardnum in shards:
-                        for shard in range(0,len(shards[shardnum])):
-                            segmentcount += (
-                                shards[shardnum][shard]['num_search_segments']
-                            )
-                    self.index_info[index]['segments'] = segmentcount
+                    if index not in requested:
+                        continue
+                    self.index_info[index]['segments'] = (
+                        working_list[index]['total']['segments']['count'])
 
     def _get_name_based_ages(self, timestring):
         """
@@ -286,7 +751,11 @@ class IndexList(object):
     def _get_field_stats_dates(self, field='@timestamp'):
         """
         Add indices to `index_info` based on the values the queries return,
-        as determined by the min and max aggregated values of `field`
+        as determined by the min and max values of `field`.  The searches are
+        sent in ``_msearch`` batches, up to `max_concurrent_requests` at the
+        same time, and are built according to `field_stats_mode`.  If
+        `field_stats_cache` is set, only indices which changed since their
+        values were cached are queried.
 
         :arg field: The field with the date value.  The field must be mapped in
             elasticsearch as a date datatype.  Default: ``@timestamp``
@@ -303,30 +772,170 @@ class IndexList(object):
             'Getting index date by querying indices for min & max value of '
             '{0} field'.format(field)
         )
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            for index in l:
-                body = {
-                    'aggs' : {
-                        'min' : { 'min' : { 'field' : field } },
-                        'max' : { 'max' : { 'field' : field } }
-                    }
-                }
-                response = self.client.search(index=index, size=0, body=body)
-                self.loggit.debug('RESPONSE: {0}'.format(response))
-                if response:
+        cache = self.__open_field_stats_cache()
+        try:
+            self.__query_field_stats(field, cache)
+        finally:
+            if cache:
+                cache.close()
+
+    def __open_field_stats_cache(self):
+        """
+        Return a :py:class:`curator.fieldstatscache.FieldStatsCache` for
+        `field_stats_cache`, without the entries of deleted indices, or `None`
+        if there is no cache or it cannot be used.
+        """
+        if not self.field_stats_cache:
+            return None
+        try:
+            cache = FieldStatsCache(
+                self.field_stats_cache, self.field_stats_cache_size)
+        except sqlite3.Error as e:
+            self.loggit.warn(
+                'Unable to open field_stats cache {0}: {1}'.format(
+                    self.field_stats_cache, e)
+            )
+            return None
+        try:
+            # Every index in the cluster, not just those matching search_pattern
+            response = self.client.cat.indices(format='json', h='uuid')
+            cache.prune([entry['uuid'] for entry in response])
+        except Exception as e:
+            self.loggit.warn(
+                'Unable to remove deleted indices from the field_stats cache: '
+                '{0}'.format(e)
+            )
+        return cache
+
+    def __field_stats_fingerprint(self, index):
+        """
+        Return a string which changes whenever documents are added to, changed
+        in, or removed from `index`.
+        """
+        info = self.index_info[index]
+        return '{0}:{1}'.format(info['docs'], info['size_in_bytes'])
+
+    def __query_field_stats(self, field, cache=None):
+        """
+        Fill ``min_value`` and ``max_value`` of `field` in `index_info` for
+        every index in the actionable list, from `cache` where it has them, and
+        from ``_msearch`` requests otherwise, then store the new values in
+        `cache`.
+        """
+        queried = self.working_list()
+        if cache:
+            self.load_index_info('uuid', 'docs', 'size_in_bytes')
+            missed = []
+            for index in queried:
+                uuid = self.index_info[index]['uuid']
+                cached = None
+                if uuid:
                     try:
-                        r = response['aggregations']
-                        self.loggit.debug('r: {0}'.format(r))
-                        s = self.index_info[index]['age']
-                        s['min_value'] = utils.fix_epoch(r['min']['value'])
-                        s['max_value'] = utils.fix_epoch(r['max']['value'])
-                        self.loggit.debug('s: {0}'.format(s))
-                    except KeyError:
-                        raise exceptions.ActionError(
-                            'Field "{0}" not found in index '
-                            '"{1}"'.format(field, index)
-                            )
+                        cached = cache.get(
+                            uuid, field, self.__field_stats_fingerprint(index))
+                    except sqlite3.Error as e:
+                        self.loggit.warn(
+                            'Unable to read the field_stats cache: {0}'.format(e))
+                        cache = None
+                        missed = queried
+                        break
+                if cached:
+                    s = self.index_info[index]['age']
+                    s['min_value'], s['max_value'] = cached
+                else:
+                    missed.append(index)
+            self.loggit.debug(
+                'Found field_stats for {0} of {1} indices in the cache'.format(
+                    len(queried) - len(missed), len(queried))
+            )
+            queried = missed
+        # Elasticsearch 6.0 added track_total_hits
+        track_total_hits = (
+            bool(queried) and self.field_stats_mode == 'sort'
+            and utils.get_version(self.client) >= (6, 0, 0)
+        )
+        searches = []
+        for index in queried:
+            searches.extend(
+                self.__field_stats_searches(index, field, track_total_hits))
+        size = settings.msearch_batch_size()
+        batches = [
+            searches[num:num + size] for num in range(0, len(searches), size)]
+        def msearch(batch):
+            body = []
+            for index, _, search in batch:
+                body.extend([{'index': index}, search])
+            return self.client.msearch(body=body)['responses']
+        responses = utils.concurrent_map(
+            msearch, batches, self.max_concurrent_requests)
+        results = [response for batch in responses for response in batch]
+        for (index, stat, _), response in zip(searches, results):
+            self.loggit.debug('RESPONSE: {0}'.format(response))
+            if 'error' in response:
+                raise exceptions.ActionError(
+                    'Unable to query field "{0}" in index "{1}": '
+                    '{2}'.format(field, index, response['error'])
+                )
+            s = self.index_info[index]['age']
+            try:
+                if stat == 'aggs':
+                    r = response['aggregations']
+                    self.loggit.debug('r: {0}'.format(r))
+                    s['min_value'] = utils.fix_epoch(r['min']['value'])
+                    s['max_value'] = utils.fix_epoch(r['max']['value'])
+                else:
+                    s[stat] = utils.fix_epoch(
+                        response['hits']['hits'][0]['sort'][0])
+                self.loggit.debug('s: {0}'.format(s))
+            except (IndexError, KeyError):
+                raise exceptions.ActionError(
+                    'Field "{0}" not found in index '
+                    '"{1}"'.format(field, index)
+                    )
+        if cache and queried:
+            entries = []
+            for index in queried:
+                uuid = self.index_info[index]['uuid']
+                s = self.index_info[index]['age']
+                if uuid:
+                    entries.append((
+                        uuid, field, self.__field_stats_fingerprint(index),
+                        s['min_value'], s['max_value']
+                    ))
+            try:
+                cache.put(entries)
+            except sqlite3.Error as e:
+                self.loggit.warn(
+                    'Unable to write the field_stats cache: {0}'.format(e))
+
+    def __field_stats_searches(self, index, field, track_total_hits=False):
+        """
+        Return the searches which find the min and max values of `field` in
+        `index`, as ``(index, stat, body)`` tuples, according to
+        `field_stats_mode`.  Sorted searches skip counting total hits if
+        `track_total_hits` is `True`.
+        """
+        if self.field_stats_mode == 'aggs':
+            body = {
+                'size': 0,
+                'aggs' : {
+                    'min' : { 'min' : { 'field' : field } },
+                    'max' : { 'max' : { 'field' : field } }
+                }
+            }
+            return [(index, 'aggs', body)]
+        searches = []
+        for stat, order in [('min_value', 'asc'), ('max_value', 'desc')]:
+            body = {
+                'size': 1,
+                '_source': False,
+                'query': { 'exists': { 'field': field } },
+                'sort': [ { field: { 'order': order } } ],
+            }
+            if track_total_hits:
+                body['track_total_hits'] = False
+            searches.append((index, stat, body))
+        return searches
 
     def _calculate_ages(self, source=None, timestring=None, field=None,
             stats_result=None
@@ -355,8 +964,7 @@ class IndexList(object):
                 )
             self._get_name_based_ages(timestring)
         elif source == 'creation_date':
-            # Nothing to do here as this comes from `get_metadata` in __init__
-            pass
+            self.load_index_info('creation_date')
         elif source == 'field_stats':
             if not field:
                 raise exceptions.MissingArgument(
@@ -544,7 +1152,7 @@ class IndexList(object):
                 self.loggit.debug(
                     'Index "{0}" does not meet provided criteria. '
                     'Removing from list.'.format(index))
-                self.indices.remove(index)
+                self.__discard(index)
 
     def filter_by_space(
         self, disk_space=None, reverse=True, use_age=False,
@@ -614,6 +1222,7 @@ class IndexList(object):
             'Omitting any closed indices.'
         )
         self.filter_closed()
+        self.load_index_info('size_in_bytes')
 
         # Create a copy-by-value working list
         working_list = self.working_list()
@@ -684,7 +1293,8 @@ class IndexList(object):
             'Omitting any closed indices.'
         )
         self.filter_closed()
-        self._get_segment_counts()
+        self.load_index_info(
+            'number_of_shards', 'number_of_replicas', 'segments')
         for index in self.working_list():
             # Do this to reduce long lines and make it more readable...
             shards = int(self.index_info[index]['number_of_shards'])
@@ -711,6 +1321,7 @@ class IndexList(object):
         """
         self.loggit.debug('Filtering closed indices')
         self.empty_list_check()
+        self.load_index_info('state')
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'close'
             self.loggit.debug('Index {0} state: {1}'.format(
@@ -730,6 +1341,7 @@ class IndexList(object):
         """
         self.loggit.debug('Filtering empty indices')
         self.empty_list_check()
+        self.load_index_info('docs')
         for index in self.working_list():
             condition = self.index_info[index]['docs'] == 0
             self.loggit.debug('Index {0} doc count: {1}'.format(
@@ -749,6 +1361,7 @@ class IndexList(object):
         """
         self.loggit.debug('Filtering open indices')
         self.empty_list_check()
+        self.load_index_info('state')
         for index in self.working_list():
             condition = self.index_info[index]['state'] == 'open'
             self.loggit.debug('Index {0} state: {1}'.format(
@@ -783,26 +1396,23 @@ class IndexList(object):
                 'Invalid "allocation_type": {0}'.format(allocation_type)
             )
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = self.client.indices.get_settings(index=utils.to_csv(l))
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        has_routing = (
-                            working_list[index]['settings']['index']['routing']['allocation'][allocation_type][key] == value
-                        )
-                    except KeyError:
-                        has_routing = False
-                    # if has_routing:
-                    msg = (
-                        '{0}: Routing (mis)match: '
-                        'index.routing.allocation.{1}.{2}={3}.'.format(
-                            index, allocation_type, key, value
-                        )
-                    )
-                        # self.indices.remove(index)
-                    self.__excludify(has_routing, exclude, index, msg)
+        self.__load_settings(self.indices)
+        for index in self.working_list():
+            if index not in self.index_settings:
+                continue
+            try:
+                has_routing = (
+                    self.index_settings[index]['routing']['allocation'][allocation_type][key] == value
+                )
+            except KeyError:
+                has_routing = False
+            msg = (
+                '{0}: Routing (mis)match: '
+                'index.routing.allocation.{1}.{2}={3}.'.format(
+                    index, allocation_type, key, value
+                )
+            )
+            self.__excludify(has_routing, exclude, index, msg)
 
     def filter_none(self):
         self.loggit.debug('"None" filter selected.  No filtering will be done.')
@@ -839,31 +1449,34 @@ class IndexList(object):
             raise exceptions.MissingArgument('No value for "aliases" provided')
         aliases = utils.ensure_list(aliases)
         self.empty_list_check()
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            try:
-                # get_alias will either return {} or a NotFoundError.
-                has_alias = list(self.client.indices.get_alias(
-                    index=utils.to_csv(l),
-                    name=utils.to_csv(aliases)
-                ).keys())
-                self.loggit.debug('has_alias: {0}'.format(has_alias))
-            except NotFoundError:
-                # if we see the NotFoundError, we need to set working_list to {}
-                has_alias = []
-            for index in l:
-                if index in has_alias:
-                    isOrNot = 'is'
-                    condition = True
-                else:
-                    isOrNot = 'is not'
-                    condition = False
-                msg = (
-                    '{0} {1} associated with aliases: {2}'.format(
-                        index, isOrNot, aliases
-                    )
+        self.load_aliases()
+        # As with get_alias, a name which matches no alias matches no indices
+        aliased = set()
+        for name in aliases:
+            if '*' in name:
+                matches = fnmatch.filter(self.alias_indices, name)
+            elif name in self.alias_indices:
+                matches = [name]
+            else:
+                aliased = set()
+                break
+            for alias in matches:
+                aliased.update(self.alias_indices[alias])
+        self.loggit.debug('{0} indices have aliases {1}'.format(
+            len(aliased), aliases))
+        for index in self.working_list():
+            if index in aliased:
+                isOrNot = 'is'
+                condition = True
+            else:
+                isOrNot = 'is not'
+                condition = False
+            msg = (
+                '{0} {1} associated with aliases: {2}'.format(
+                    index, isOrNot, aliases
                 )
-                self.__excludify(condition, exclude, index, msg)
+            )
+            self.__excludify(condition, exclude, index, msg)
 
     def filter_by_count(
         self, count=None, reverse=True, use_age=False, pattern=None,
@@ -932,7 +1545,7 @@ class IndexList(object):
                 # Prune indices not matching the regular expression the object (and filtered_indices)
                 # We do not want to act on them by accident.
                 prune_these = list(filter(lambda x: r.match(x) is None, working_list))
-                filtered_indices = working_list
+                filtered_indices = [x for x in working_list if r.match(x) is not None]
                 for index in prune_these:
                     msg = (
                         '{0} does not match regular expression {1}.'.format(
@@ -942,8 +1555,6 @@ class IndexList(object):
                     condition = True
                     exclude = True
                     self.__excludify(condition, exclude, index, msg)
-                    # also remove it from filtered_indices
-                    filtered_indices.remove(index)
                 # Presort these filtered_indices using the lambda
                 presorted = sorted(filtered_indices, key=lambda x: r.match(x).group(1))
             except Exception as e:
@@ -1108,7 +1719,7 @@ class IndexList(object):
                 self.loggit.debug(
                     'Index "{0}" does not meet provided criteria. '
                     'Removing from list.'.format(index))
-                self.indices.remove(index)
+                self.__discard(index)
 
     def filter_ilm(self, exclude=True):
         """
@@ -1120,18 +1731,76 @@ class IndexList(object):
             Default is `True`
         """
         self.loggit.debug('Filtering indices with index.lifecycle.name')
-        index_lists = utils.chunk_index_list(self.indices)
-        for l in index_lists:
-            working_list = self.client.indices.get_settings(index=utils.to_csv(l))
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        has_ilm = 'name' in working_list[index]['settings']['index']['lifecycle']
-                        msg = '{0} has index.lifecycle.name {1}'.format(index, working_list[index]['settings']['index']['lifecycle']['name'])
-                    except KeyError:
-                        has_ilm = False
-                        msg = 'index.lifecycle.name is not set for index {0}'.format(index)
-                    self.__excludify(has_ilm, exclude, index, msg)
+        self.__load_settings(self.indices)
+        for index in self.working_list():
+            if index not in self.index_settings:
+                continue
+            try:
+                has_ilm = 'name' in self.index_settings[index]['lifecycle']
+                msg = '{0} has index.lifecycle.name {1}'.format(index, self.index_settings[index]['lifecycle']['name'])
+            except KeyError:
+                has_ilm = False
+                msg = 'index.lifecycle.name is not set for index {0}'.format(index)
+            self.__excludify(has_ilm, exclude, index, msg)
+
+    def __filter_cost(self, f):
+        """
+        Return how costly filter `f` is to run: ``0`` if it only reads index
+        names, ``1`` if it reads index metadata or settings, ``2`` if it reads
+        segments or searches the indices, and `None` if the result depends on
+        which other indices are in the list.
+        """
+        filtertype = f.get('filtertype')
+        if filtertype in ['count', 'space']:
+            return None
+        if filtertype in ['pattern', 'kibana', 'none']:
+            return 0
+        if filtertype == 'forcemerged':
+            return 2
+        if filtertype in ['age', 'period']:
+            # Both filter methods default to the index name
+            source = f.get('source', 'name')
+            if source == 'name':
+                return 0
+            if source == 'field_stats':
+                return 2
+        return 1
+
+    def plan_filters(self, filter_list):
+        """
+        Return `filter_list` in the order it can be run most cheaply, without
+        changing which indices remain.
+
+        Apart from ``count`` and ``space``, every filter keeps or removes each
+        index on its own, so these filters give the same result in any order.
+        Between each ``count`` or ``space`` filter, which depend on the other
+        indices in the list and so stay where they are, filters which only
+        read index names are moved first, then those which read metadata or
+        settings, then those which read segments or search the indices.
+        Filters of the same cost keep their order.
+
+        :arg filter_list: A list of filter dictionaries, as in
+            :py:meth:`iterate_filters`
+        :rtype: list
+        """
+        plan = []
+        segment = []
+        for f in filter_list:
+            cost = self.__filter_cost(f)
+            if cost is None:
+                plan.extend(sorted(segment, key=lambda pair: pair[0]))
+                plan.append((cost, f))
+                segment = []
+            else:
+                segment.append((cost, f))
+        plan.extend(sorted(segment, key=lambda pair: pair[0]))
+        planned = [f for _, f in plan]
+        order = ', '.join(str(f.get('filtertype')) for f in planned)
+        if planned != list(filter_list):
+            self.loggit.info('Running filters in the order: {0}'.format(order))
+        else:
+            self.loggit.debug('Filter order unchanged: {0}'.format(order))
+        return planned
 
     def iterate_filters(self, filter_dict):
         """
@@ -1160,7 +1829,10 @@ class IndexList(object):
             return
 
         self.loggit.debug('All filters: {0}'.format(filter_dict['filters']))
-        for f in filter_dict['filters']:
+        filter_list = filter_dict['filters']
+        if self.reorder_filters:
+            filter_list = self.plan_filters(filter_list)
+        for f in filter_list:
             self.loggit.debug('Top of the loop: {0}'.format(self.indices))
             self.loggit.debug('Un-parsed filter args: {0}'.format(f))
             # Make sure we got at least this much in the configuration
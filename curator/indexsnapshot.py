@@ -0,0 +1,116 @@
+import fnmatch
+import logging
+import threading
+
+class IndexSnapshot(object):
+    def __init__(self):
+        """
+        The index metadata read from the cluster by
+        :class:`curator.indexlist.IndexList` objects, kept so that it can be
+        shared by every action in a run instead of being read again for each.
+
+        Actions mark the indices they delete or change, so that the next
+        :class:`curator.indexlist.IndexList` does not list deleted indices,
+        and reads changed ones from the cluster again.
+        """
+        self.loggit = logging.getLogger('curator.indexsnapshot')
+        # Actions which send chunks concurrently mark indices from several
+        # threads at once.
+        self.lock = threading.RLock()
+        #: Instance variable.
+        #: The names of the indices matched by each search pattern which has
+        #: been listed. **Type:** ``dict()``
+        self.listings = {}
+        #: Instance variable.
+        #: The ``index_info`` of every index read so far. **Type:** ``dict()``
+        self.index_info = {}
+        #: Instance variable.
+        #: The ``index_settings`` of every index read so far.
+        #: **Type:** ``dict()``
+        self.index_settings = {}
+        #: Instance variable.
+        #: The indices for which each group of fields in `index_info` has been
+        #: read. **Type:** ``dict()``
+        self.loaded = {
+            'metadata': set(), 'routing': set(), 'stats': set(),
+            'segments': set(),
+        }
+
+    def get_listing(self, search_pattern):
+        """
+        Return the indices matched by `search_pattern`, or `None` if it has not
+        been listed.  A pattern is also answered from the listing of ``_all``,
+        if there is one, as the patterns built by
+        :py:func:`curator.utils.get_search_pattern` are simple wildcards.
+
+        :arg search_pattern: An Elasticsearch index expression
+        :rtype: list
+        """
+        if search_pattern in self.listings:
+            return self.listings[search_pattern][:]
+        if '_all' in self.listings and ',' not in search_pattern:
+            return [
+                index for index in self.listings['_all']
+                if fnmatch.fnmatchcase(index, search_pattern)
+            ]
+        return None
+
+    def add_listing(self, search_pattern, indices):
+        """
+        Keep `indices` as the indices matched by `search_pattern`.
+
+        :arg search_pattern: An Elasticsearch index expression
+        :arg indices: A list of index names
+        """
+        self.listings[search_pattern] = indices[:]
+
+    def refresh_listings(self):
+        """
+        Discard every listing, so that indices created since are found.  What
+        is known about each index is kept.
+        """
+        self.listings = {}
+
+    def refresh(self):
+        """
+        Discard every listing, and everything read about every index apart
+        from its name, after an action which may have changed indices without
+        reporting which, e.g. by restoring over an index which was closed.
+        """
+        with self.lock:
+            self.refresh_listings()
+            self.changed(list(self.index_info))
+        self.loggit.debug('Discarded the snapshot of every index')
+
+    def changed(self, indices):
+        """
+        Discard everything read about `indices`, apart from their names, so
+        that it is read from the cluster again when next needed.
+
+        :arg indices: A list of index names
+        """
+        with self.lock:
+            for index in indices:
+                self.index_settings.pop(index, None)
+                for group in self.loaded:
+                    self.loaded[group].discard(index)
+
+    def deleted(self, indices):
+        """
+        Remove `indices` from every listing, and discard everything read about
+        them.
+
+        :arg indices: A list of index names
+        """
+        gone = set(indices)
+        with self.lock:
+            self.changed(gone)
+            for index in gone:
+                self.index_info.pop(index, None)
+            for search_pattern in self.listings:
+                self.listings[search_pattern] = [
+                    index for index in self.listings[search_pattern]
+                    if index not in gone
+                ]
+        self.loggit.debug(
+            'Removed {0} deleted indices from the snapshot'.format(len(gone)))
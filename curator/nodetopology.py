@@ -0,0 +1,141 @@
+import logging
+import threading
+from curator.defaults import settings
+
+class NodeTopology(object):
+    def __init__(self, client):
+        """
+        The names, roles, data paths and free disk space of the nodes in the
+        cluster, read with one ``nodes.stats`` and, when roles are needed, one
+        ``nodes.info`` request, each trimmed to those fields, and kept for the
+        life of an action.
+
+        Roles and names are read once.  Disk space is read again after
+        :py:meth:`refresh`, which actions call after moving or deleting shards.
+        One object may be shared by several threads.
+
+        :arg client: An :class:`elasticsearch.Elasticsearch` client object
+        """
+        self.loggit = logging.getLogger('curator.nodetopology')
+        # A pipelined shrink reads and refreshes disk space from several
+        # threads at once.
+        self.lock = threading.RLock()
+        #: Instance variable.
+        #: The Elasticsearch Client object
+        self.client = client
+        #: Instance variable.
+        #: The ``name``, ``roles``, ``data_paths`` and ``available_in_bytes``
+        #: of each node, by node id.  **Type:** ``dict()``
+        self.nodes = {}
+        self.__roles_loaded = False
+        self.__space_loaded = False
+
+    def __node(self, node_id):
+        if node_id not in self.nodes:
+            self.nodes[node_id] = {
+                'name': None, 'roles': [], 'data_paths': 0,
+                'available_in_bytes': 0,
+            }
+        return self.nodes[node_id]
+
+    def __load_space(self):
+        with self.lock:
+            if not self.__space_loaded:
+                stats = self.client.nodes.stats(
+                    metric='fs', filter_path=settings.node_fs_filter_path()
+                ).get('nodes', {})
+                for node_id in stats:
+                    node = self.__node(node_id)
+                    fs = stats[node_id].get('fs', {})
+                    node['name'] = stats[node_id].get('name', node['name'])
+                    node['data_paths'] = len(fs.get('data', []))
+                    node['available_in_bytes'] = (
+                        fs.get('total', {}).get('available_in_bytes', 0))
+                self.__space_loaded = True
+                self.loggit.debug(
+                    'Read disk space for {0} nodes'.format(len(stats)))
+
+    def __load_roles(self):
+        with self.lock:
+            if not self.__roles_loaded:
+                info = self.client.nodes.info(
+                    filter_path=settings.node_info_filter_path()
+                ).get('nodes', {})
+                for node_id in info:
+                    node = self.__node(node_id)
+                    node['roles'] = info[node_id].get('roles', [])
+                    if node['name'] is None:
+                        node['name'] = info[node_id].get('name')
+                self.__roles_loaded = True
+
+    def refresh(self):
+        """
+        Read the free disk space of every node again when next needed, as
+        shards have moved or been deleted since it was read.
+        """
+        with self.lock:
+            self.__space_loaded = False
+
+    def node_ids(self):
+        """
+        Return the ids of every node.
+
+        :rtype: list
+        """
+        self.__load_space()
+        return list(self.nodes)
+
+    def name(self, node_id):
+        """
+        Return the name of the node identified by `node_id`, or `None`.
+
+        :rtype: str
+        """
+        self.__load_space()
+        if node_id not in self.nodes:
+            self.loggit.error('No node_id found matching: "{0}"'.format(node_id))
+            return None
+        return self.nodes[node_id]['name']
+
+    def node_id(self, name):
+        """
+        Return the id of the node named `name`, or `None`.
+
+        :rtype: str
+        """
+        self.__load_space()
+        for node_id in self.nodes:
+            if self.nodes[node_id]['name'] == name:
+                return node_id
+        self.loggit.error('No node_id found matching name: "{0}"'.format(name))
+        return None
+
+    def roles(self, node_id):
+        """
+        Return the roles of the node identified by `node_id`.
+
+        :rtype: list
+        """
+        self.__load_space()
+        self.__load_roles()
+        return self.nodes[node_id]['roles']
+
+    def single_data_path(self, node_id):
+        """
+        Return `True` if the node identified by `node_id` has a single data
+        path, as a shrink needs every shard of an index on one filesystem.
+
+        :rtype: bool
+        """
+        self.__load_space()
+        return self.nodes[node_id]['data_paths'] == 1
+
+    def available(self, node_id):
+        """
+        Return the free disk space in bytes of the node identified by
+        `node_id`, net of disk watermarks.
+
+        :rtype: int
+        """
+        self.__load_space()
+        return self.nodes[node_id]['available_in_bytes']
@@ -1,6 +1,7 @@
 import time
 import re
 import logging
+from collections import OrderedDict
 from datetime import timedelta, datetime, date
 from curator import exceptions, utils
 from curator.defaults import settings
@@ -28,6 +29,12 @@ class SnapshotList(object):
         #: Populated by internal method `__get_snapshots` at instance creation
         #: time. **Type:** ``dict()``
         self.snapshot_info = {}
+        # Actionable snapshots live in an ordered, hashed collection so that
+        # membership tests and removals are constant-time.  ``snapshots`` is
+        # a list view of it, rebuilt only when read after a change.
+        self.__members = OrderedDict()
+        self.__view = []
+        self.__view_stale = False
         #: Instance variable.
         #: The running list of snapshots which will be used by an Action class.
         #: Populated by internal methods `__get_snapshots` at instance creation
@@ -38,6 +45,45 @@ class SnapshotList(object):
         #: time.  **Type:** ``list()`` of ``dict()`` data.
         self.__get_snapshots()
 
+    @property
+    def snapshots(self):
+        """
+        The running list of snapshots which will be used by an Action class.
+        Assigning a list replaces the actionable set with its contents.
+        """
+        self.__sync_members()
+        return self.__view
+
+    @snapshots.setter
+    def snapshots(self, value):
+        if not isinstance(value, list):
+            value = list(value)
+        self.__view = value
+        self.__members = OrderedDict.fromkeys(value)
+        self.__view_stale = False
+
+    def __sync_members(self):
+        """
+        Bring `snapshots` and the actionable set back in line with each other.
+        The list view is refreshed in place; if it was modified directly, the
+        actionable set is rebuilt from it.
+        """
+        if self.__view_stale:
+            self.__view[:] = list(self.__members)
+            self.__view_stale = False
+        elif len(self.__view) != len(self.__members):
+            self.__members = OrderedDict.fromkeys(self.__view)
+
+    def __discard(self, snap):
+        """
+        Remove `snap` from the actionable set in constant time.
+        """
+        if not self.__view_stale:
+            self.__sync_members()
+        if snap not in self.__members:
+            raise ValueError('{0} is not in the actionable list'.format(snap))
+        del self.__members[snap]
+        self.__view_stale = True
 
     def __actionable(self, snap):
         self.loggit.debug(
@@ -48,7 +94,7 @@ class SnapshotList(object):
                 'Snapshot {0} is not actionable, removing from '
                 'list.'.format(snap)
             )
-            self.snapshots.remove(snap)
+            self.__discard(snap)
 
     def __excludify(self, condition, exclude, snap, msg=None):
         if condition == True:
@@ -74,10 +120,12 @@ class SnapshotList(object):
         `snapshot_info`
         """
         self.all_snapshots = utils.get_snapshot_data(self.client, self.repository)
+        snapshots = []
         for list_item in self.all_snapshots:
             if 'snapshot' in list_item.keys():
-                self.snapshots.append(list_item['snapshot'])
+                snapshots.append(list_item['snapshot'])
                 self.snapshot_info[list_item['snapshot']] = list_item
+        self.snapshots = snapshots
         self.empty_list_check()
 
     def __map_method(self, ft):
@@ -93,7 +141,8 @@ class SnapshotList(object):
 
     def empty_list_check(self):
         """Raise exception if `snapshots` is empty"""
-        if not self.snapshots:
+        self.__sync_members()
+        if not self.__members:
             raise exceptions.NoSnapshots('snapshot_list object is empty.')
 
     def working_list(self):
@@ -103,7 +152,8 @@ class SnapshotList(object):
         """
         # Copy by value, rather than reference to prevent list stomping during
         # iterations
-        return self.snapshots[:]
+        self.__sync_members()
+        return list(self.__members)
 
     def _get_name_based_ages(self, timestring):
         """
@@ -276,7 +326,7 @@ class SnapshotList(object):
         for snapshot in self.working_list():
             if not self.snapshot_info[snapshot][self.age_keyfield]:
                 self.loggit.debug('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
+                self.__discard(snapshot)
                 continue
             msg = (
                 'Snapshot "{0}" age ({1}), direction: "{2}", point of '
@@ -457,7 +507,7 @@ class SnapshotList(object):
         for snapshot in self.working_list():
             if not self.snapshot_info[snapshot][self.age_keyfield]:
                 self.loggit.debug('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
+                self.__discard(snapshot)
                 continue
             age = utils.fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
             msg = (
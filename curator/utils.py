@@ -1,8 +1,13 @@
 import elasticsearch
 import time
 import logging
+import threading
+import weakref
+from collections import OrderedDict
+from copy import deepcopy
 import yaml, os, random, re, string, sys
 from datetime import timedelta, datetime, date
+from multiprocessing.pool import ThreadPool
 from voluptuous import Schema
 from curator import exceptions
 from curator.defaults import settings
@@ -75,6 +80,51 @@ def test_client_options(config):
         if 'client_key' in config and  config['client_key']:
             read_file(config['client_key'])
 
+def pop_list_options(client_args):
+    """
+    Remove the settings in `client_args` which are meant for
+    :class:`curator.indexlist.IndexList` rather than the Elasticsearch client,
+    and return them as a dictionary of keyword arguments.
+
+    If ``max_concurrent_requests`` is greater than 1, the client connection
+    pool is sized to match, so that concurrent requests do not wait for, or
+    discard, connections.  ``url_budget`` is removed too, and passed to
+    :py:func:`set_url_budget` for every chunked request in the run.
+
+    :arg client_args: A client configuration dictionary
+    :rtype: dict
+    """
+    list_args = {}
+    for key in settings.list_options():
+        if key in client_args:
+            list_args[key] = client_args.pop(key)
+    if list_args.get('max_concurrent_requests', 1) > 1:
+        client_args['maxsize'] = list_args['max_concurrent_requests']
+    if 'url_budget' in client_args:
+        set_url_budget(client_args.pop('url_budget'))
+    return list_args
+
+def size_connection_pool(client_args, options_list):
+    """
+    Raise the client connection pool size in `client_args` to the largest
+    number of concurrent requests that any of the action options in
+    `options_list` asks for, with ``max_concurrent_chunks``, or with
+    ``max_merges_per_node``, which runs up to
+    ``settings.forcemerge_max_threads()`` merges across all nodes.  No action
+    then has more requests in flight than the pool keeps connections.
+
+    :arg client_args: A client configuration dictionary, after
+        :py:func:`pop_list_options`
+    :arg options_list: A list of action option dictionaries
+    """
+    wanted = [1]
+    for options in options_list:
+        wanted.append(options.get('max_concurrent_chunks') or 1)
+        if options.get('max_merges_per_node'):
+            wanted.append(settings.forcemerge_max_threads())
+    if max(wanted) > client_args.get('maxsize', 1):
+        client_args['maxsize'] = max(wanted)
+
 def rollable_alias(client, alias):
     """
     Ensure that `alias` is an alias, and points to an index that can use the
@@ -278,16 +328,163 @@ def datetime_to_epoch(mydate):
    tdelta = (mydate - datetime(1970,1,1))
    return tdelta.seconds + tdelta.days * 24 * 3600
 
+class _TimestringParser(object):
+    """
+    Convert the dates which a single strftime `timestring` matches in index
+    names to epoch timestamps.  The date components are read from the named
+    groups of one precompiled regular expression and converted directly,
+    without :py:func:`datetime.datetime.strptime`.  Results are kept per
+    name, so each name is only parsed once per run.
+
+    Timestrings with directives this does not handle directly, such as
+    ``%G`` without ``%V``, or a directive used twice, and dates which are not
+    valid, are passed to :py:func:`get_datetime` instead, so results and
+    errors are always the same as parsing with it.
+
+    :arg timestring: An strftime pattern
+    """
+    # Keep at most this many parsed names, so long runs cannot grow unbounded
+    max_cached = 1000000
+
+    def __init__(self, timestring):
+        self.timestring = timestring
+        self.epochs = {}
+        directives = re.findall(r'%(.?)', timestring)
+        self.fields = set(directives)
+        fast = (
+            len(directives) == len(self.fields)
+            and self.fields.issubset(settings.date_regex())
+            and len(self.fields & set('YyG')) <= 1
+            and len(self.fields & set('WUV')) <= 1
+            and ('G' in self.fields) == ('V' in self.fields)
+            and not (self.fields & set('WUV') and self.fields & set('mdj'))
+            and not ('j' in self.fields and self.fields & set('md'))
+        )
+        if fast:
+            # The same expression as get_date_regex, with named groups
+            regex = ''
+            prev = ''
+            for curr in timestring:
+                if curr == '%':
+                    pass
+                elif curr in settings.date_regex() and prev == '%':
+                    regex += r'(?P<{0}>\d{{{1}}})'.format(
+                        curr, settings.date_regex()[curr])
+                elif curr in ['.', '-']:
+                    regex += "\\" + curr
+                else:
+                    regex += curr
+                prev = curr
+        else:
+            regex = get_date_regex(timestring)
+        self.fast = fast
+        self.pattern = re.compile(r'(?P<date>{0})'.format(regex))
+        self.year_key = (self.fields & set('YGy') or set([None])).pop()
+        self.week_key = (self.fields & set('WUV') or set([None])).pop()
+
+    def get_epoch(self, searchme):
+        """
+        Return the epoch timestamp extracted from the `timestring` appearing in
+        `searchme`, or `None` if it does not appear.
+
+        :arg searchme: A string to be searched for a date pattern that matches
+            `timestring`
+        :rtype: int
+        """
+        if searchme in self.epochs:
+            return self.epochs[searchme]
+        epoch = None
+        match = self.pattern.search(searchme)
+        if match and match.group('date'):
+            timestamp = match.group('date')
+            try:
+                if not self.fast:
+                    raise ValueError('Not parsed directly')
+                epoch = self.__convert(match.groupdict())
+            except ValueError:
+                epoch = datetime_to_epoch(
+                    get_datetime(timestamp, self.timestring))
+        if len(self.epochs) >= self.max_cached:
+            self.epochs.clear()
+        self.epochs[searchme] = epoch
+        return epoch
+
+    def __convert(self, groups):
+        """
+        Return the epoch timestamp of the date components in `groups`, as
+        :py:func:`get_datetime` would read them.  Raise `ValueError` if they
+        are out of range, or not read directly.
+        """
+        if self.year_key is None:
+            year = 1900
+        else:
+            year = int(groups[self.year_key])
+            if self.year_key == 'y':
+                year += 2000 if year <= 68 else 1900
+        hour = int(groups.get('H', 0))
+        minute = int(groups.get('M', 0))
+        second = int(groups.get('S', 0))
+        if hour > 23 or minute > 59 or second > 59:
+            raise ValueError('Time out of range')
+        if self.week_key == 'V':
+            # The Monday of the ISO week.  Weeks which the ISO year does not
+            # have are left to get_datetime.
+            week = int(groups['V'])
+            jan4 = date(year, 1, 4)
+            weeks = 53 if date(year, 12, 28).isocalendar()[1] == 53 else 52
+            if week < 1 or week > weeks:
+                raise ValueError('Week out of range')
+            ordinal = jan4.toordinal() - jan4.weekday() + 7 * (week - 1)
+        elif self.week_key:
+            # As strptime reads a week number with a weekday of Monday
+            week = int(groups[self.week_key])
+            if week > 53:
+                raise ValueError('Week out of range')
+            jan1 = date(year, 1, 1)
+            first_weekday = jan1.weekday()
+            day_of_week = 0
+            if self.week_key == 'U':
+                first_weekday = (first_weekday + 1) % 7
+                day_of_week = 1
+            if week == 0:
+                julian = 1 + day_of_week - first_weekday
+            else:
+                julian = (
+                    1 + (7 - first_weekday) % 7 + 7 * (week - 1) + day_of_week)
+            ordinal = jan1.toordinal() + julian - 1
+        elif 'j' in groups:
+            julian = int(groups['j'])
+            if julian < 1 or julian > 366:
+                raise ValueError('Day of year out of range')
+            ordinal = date(year, 1, 1).toordinal() + julian - 1
+        else:
+            ordinal = date(
+                year, int(groups.get('m', 1)), int(groups.get('d', 1))
+            ).toordinal()
+        return (
+            (ordinal - _EPOCH_ORDINAL) * 86400
+            + hour * 3600 + minute * 60 + second
+        )
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 class TimestringSearch(object):
     """
     An object to allow repetitive search against a string, `searchme`, without
-    having to repeatedly recreate the regex.
+    having to repeatedly recreate the regex.  Parsed dates are shared by every
+    instance with the same `timestring` for the rest of the run.
 
     :arg timestring: An strftime pattern
     """
+    # One parser per timestring for the run
+    _parsers = {}
+
     def __init__(self, timestring):
-        regex = r'(?P<date>{0})'.format(get_date_regex(timestring))
-        self.pattern = re.compile(regex)
+        if timestring not in TimestringSearch._parsers:
+            TimestringSearch._parsers[timestring] = (
+                _TimestringParser(timestring))
+        self.__parser = TimestringSearch._parsers[timestring]
+        self.pattern = self.__parser.pattern
         self.timestring = timestring
     def get_epoch(self, searchme):
         """
@@ -298,21 +495,7 @@ class TimestringSearch(object):
             `timestring`
         :rtype: int
         """
-        match = self.pattern.search(searchme)
-        if match:
-            if match.group("date"):
-                timestamp = match.group("date")
-                return datetime_to_epoch(
-                    get_datetime(timestamp, self.timestring)
-                )
-                # # I would have used `total_seconds`, but apparently that's new
-                # # to Python 2.7+, and due to so many people still using
-                # # RHEL/CentOS 6, I need this to support Python 2.6.
-                # tdelta = (
-                #     get_datetime(timestamp, self.timestring) -
-                #     datetime(1970,1,1)
-                # )
-                # return tdelta.seconds + tdelta.days * 24 * 3600
+        return self.__parser.get_epoch(searchme)
 
 def get_point_of_reference(unit, count, epoch=None):
     """
@@ -603,40 +786,182 @@ def check_csv(value):
             'but is of type {1}'.format(value, type(value))
         )
 
+class IndexChunker(object):
+    """
+    Split lists of indices into chunks short enough to name in a request URL,
+    and send chunked requests.  If Elasticsearch rejects a chunk as too large,
+    with HTTP 413 or a ``circuit_breaking_exception``, the chunk is split in
+    half and retried, and the smaller size is used for every later chunk.
+
+    :arg url_budget: The longest comma-separated list of index names to send
+        in one request. Default: 3072
+    """
+    def __init__(self, url_budget=3072):
+        #: Instance variable.
+        #: The longest comma-separated list of index names currently sent in
+        #: one request.  It shrinks when a chunk proves too large.
+        self.url_budget = url_budget
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def too_large(err):
+        """
+        Return `True` if `err` means that a request asked for too much at once.
+
+        :arg err: An exception
+        :rtype: bool
+        """
+        if not isinstance(err, elasticsearch.TransportError):
+            return False
+        if err.status_code == 413:
+            return True
+        types = [err.args[1] if len(err.args) > 1 else None]
+        info = err.args[2] if len(err.args) > 2 else None
+        if isinstance(info, dict) and isinstance(info.get('error'), dict):
+            types.extend(
+                cause.get('type') for cause in
+                info['error'].get('root_cause', [])
+                if isinstance(cause, dict)
+            )
+        return 'circuit_breaking_exception' in types
+
+    def split(self, indices):
+        """
+        Return `indices` as a list of lists, each short enough to fit in
+        `url_budget` as a comma-separated string.  An index name longer than
+        `url_budget` is put in a chunk by itself.
+
+        :arg indices: A list of indices
+        :rtype: list
+        """
+        budget = self.url_budget
+        chunks = []
+        chunk = []
+        length = 0
+        for index in indices:
+            added = len(index) + (1 if chunk else 0)
+            if chunk and length + added > budget:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+                added = len(index)
+            chunk.append(index)
+            length += added
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def __shrink(self, chunk):
+        with self.__lock:
+            budget = max(1, len(to_csv(chunk)) // 2)
+            if budget < self.url_budget:
+                logger.info(
+                    'Request for {0} indices was too large.  Using chunks of '
+                    'at most {1} characters from now on.'.format(
+                        len(chunk), budget)
+                )
+                self.url_budget = budget
+
+    def __send(self, chunk, func):
+        try:
+            return [func(chunk)]
+        except elasticsearch.TransportError as err:
+            if len(chunk) < 2 or not self.too_large(err):
+                raise
+            self.__shrink(chunk)
+            half = len(chunk) // 2
+            return self.__send(chunk[:half], func) + self.__send(chunk[half:], func)
+
+    def run(self, indices, func, max_workers=1):
+        """
+        Call `func` with each chunk of `indices`, sending up to `max_workers`
+        at the same time, and return the results in order.  A chunk which is
+        too large is split in half, as often as needed, and `func` is called
+        with each half instead, so there may be more results than chunks.
+
+        :arg indices: A list of indices
+        :arg func: A function which takes a list of indices
+        :arg max_workers: The largest number of calls to run at once.
+        :rtype: list
+        """
+        results = concurrent_map(
+            lambda chunk: self.__send(chunk, func), self.split(indices),
+            max_workers
+        )
+        return [result for sent in results for result in sent]
+
+# Shared by every chunked request, so a chunk size learned from one request
+# is used for the rest of the run.
+_INDEX_CHUNKER = IndexChunker()
+
+def set_url_budget(url_budget):
+    """
+    Set the longest comma-separated list of index names sent in one request.
+
+    :arg url_budget: A number of characters
+    """
+    _INDEX_CHUNKER.url_budget = url_budget
+
 def chunk_index_list(indices):
     """
-    This utility chunks very large index lists into 3KB chunks
-    It measures the size as a csv string, then converts back into a list
-    for the return value.
+    Split very large index lists into chunks short enough to send in a
+    request URL, as set by :py:func:`set_url_budget` (3072 characters by
+    default), or smaller if a request has already proved too large.
 
     :arg indices: A list of indices to act on.
     :rtype: list
     """
-    chunks = []
-    chunk = ""
-    for index in indices:
-        if len(chunk) < 3072:
-            if not chunk:
-                chunk = index
-            else:
-                chunk += "," + index
-        else:
-            chunks.append(chunk.split(','))
-            chunk = index
-    chunks.append(chunk.split(','))
-    return chunks
+    return _INDEX_CHUNKER.split(indices)
 
-def get_indices(client):
+def chunked_requests(indices, func, max_workers=1):
+    """
+    Call `func` with each chunk of `indices`, as split by
+    :py:func:`chunk_index_list`, and return the results in order.  Chunks
+    which Elasticsearch rejects as too large are split in half and retried.
+    See :py:class:`IndexChunker`.
+
+    :arg indices: A list of indices
+    :arg func: A function which takes a list of indices
+    :arg max_workers: The largest number of calls to run at once. Default: 1
+    :rtype: list
+    """
+    return _INDEX_CHUNKER.run(indices, func, max_workers)
+
+def concurrent_map(func, items, max_workers=1):
+    """
+    Return ``[func(item) for item in items]``, running up to `max_workers`
+    calls at the same time on a pool of threads.  Results are in the same
+    order as `items`.  If any call raises an exception, it is raised here.
+
+    :arg func: A function which takes a single argument
+    :arg items: The values to call `func` with
+    :arg max_workers: The largest number of calls to run at once. Default: 1
+    :rtype: list
+    """
+    items = list(items)
+    workers = min(max_workers or 1, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+def get_indices(client, search_pattern='_all'):
     """
     Get the current list of indices from the cluster.
 
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg search_pattern: An Elasticsearch index expression limiting which
+        indices are listed. Default is ``_all``
     :rtype: list
     """
     try:
         indices = list(
             client.indices.get_settings(
-            index='_all', params={'expand_wildcards': 'open,closed'})
+            index=search_pattern, params={'expand_wildcards': 'open,closed'})
         )
         version_number = get_version(client)
         logger.debug(
@@ -648,21 +973,129 @@ def get_indices(client):
     except Exception as e:
         raise exceptions.FailedExecution('Failed to get indices. Error: {0}'.format(e))
 
+def existing_indices(client, indices):
+    """
+    Return the set of `indices` which exist in the cluster, open or closed,
+    with a single request which only names them.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg indices: A list of index names, short enough to send in one request
+    :rtype: set
+    """
+    response = client.indices.get_settings(
+        index=to_csv(indices), expand_wildcards='open,closed',
+        ignore_unavailable=True, filter_path='*.settings.index.uuid'
+    )
+    return set(response or {})
+
+def regex_literal_prefix(regex):
+    """
+    Return the literal text every match of `regex` must begin with, when the
+    pattern is anchored at the start, as it is with :py:func:`re.match`.
+    Returns an empty string if no literal prefix can be safely determined.
+
+    :arg regex: A regular expression string
+    :rtype: str
+    """
+    if '|' in regex:
+        # Alternation means there may be more than one possible prefix
+        return ''
+    special = '.^$*+?{}[]()|\\'
+    prefix = ''
+    pos = 1 if regex.startswith('^') else 0
+    while pos < len(regex):
+        char = regex[pos]
+        if char == '\\':
+            # Escaped punctuation is a literal, but escapes like \d are not
+            if pos + 1 >= len(regex) or regex[pos + 1].isalnum():
+                break
+            literal = regex[pos + 1]
+            step = 2
+        elif char in special:
+            break
+        else:
+            literal = char
+            step = 1
+        following = regex[pos + step:pos + step + 1]
+        if following in ['*', '?', '{']:
+            # The literal may be absent or repeated, so it cannot be relied on
+            break
+        prefix += literal
+        if following == '+':
+            break
+        pos += step
+    return prefix
+
+def get_search_pattern(filter_list):
+    """
+    Return an Elasticsearch index expression which matches every index that
+    could survive the leading ``pattern`` filters in `filter_list`.  Only an
+    inclusive ``prefix``, ``suffix``, or ``regex`` filter with a literal prefix
+    can be turned into an expression.  Returns ``_all`` if no such filter
+    leads the list.
+
+    Only leading filters are considered, as a filter like ``count`` or
+    ``space`` depends on which other indices are in the list.
+
+    :arg filter_list: A list of filter dictionaries, as found under
+        ``filters`` in an action
+    :rtype: str
+    """
+    unsafe = set('*?,<>"\\/| #')
+    for fil in filter_list or []:
+        if fil.get('filtertype') != 'pattern':
+            break
+        if fil.get('exclude', False):
+            continue
+        kind = fil.get('kind')
+        value = '{0}'.format(fil.get('value', ''))
+        if kind in ['prefix', 'regex']:
+            literal = regex_literal_prefix(value)
+            expression = literal + '*'
+        elif kind == 'suffix':
+            literal = value if regex_literal_prefix(value) == value else ''
+            expression = '*' + literal
+        else:
+            continue
+        if (not literal or unsafe.intersection(literal)
+                or expression[0] in ['-', '+', '_']):
+            continue
+        logger.debug(
+            'Limiting index listing to search pattern {0}'.format(expression))
+        return expression
+    return '_all'
+
+# The version of each client's cluster, read once per client.
+_VERSIONS = weakref.WeakKeyDictionary()
+
 def get_version(client):
     """
     Return the ES version number as a tuple.
     Omits trailing tags like -dev, or Beta
 
+    The version is only read from the cluster the first time it is needed for
+    each client.
+
     :arg client: An :class:`elasticsearch.Elasticsearch` client object
     :rtype: tuple
     """
+    try:
+        return _VERSIONS[client]
+    except (KeyError, TypeError):
+        pass
     version = client.info()['version']['number']
     version = version.split('-')[0]
     if len(version.split('.')) > 3:
         version = version.split('.')[:-1]
     else:
        version = version.split('.')
-    return tuple(map(int, version))
+    version = tuple(map(int, version))
+    try:
+        _VERSIONS[client] = version
+    except TypeError:
+        # Not every object can be weakly referenced
+        pass
+    return version
 
 def is_master_node(client):
     """
@@ -716,6 +1149,126 @@ def check_master(client, master_only=False):
         )
         sys.exit(0)
 
+class RequestTimeoutTransport(elasticsearch.Transport):
+    """
+    An :class:`elasticsearch.Transport` which sends `request_timeout`, if set,
+    as the ``request_timeout`` of every request which does not set its own.
+    This lets one client, and its connections, serve actions with different
+    timeouts.
+    """
+    #: The timeout in seconds for each request.  Default is `None`, which
+    #: uses the timeout of the client.
+    request_timeout = None
+
+    def perform_request(self, method, url, *args, **kwargs):
+        if self.request_timeout is not None and not args:
+            params = dict(kwargs.get('params') or {})
+            params.setdefault('request_timeout', self.request_timeout)
+            kwargs['params'] = params
+        return super(RequestTimeoutTransport, self).perform_request(
+            method, url, *args, **kwargs)
+
+class CachingTransport(RequestTimeoutTransport):
+    """
+    A :class:`RequestTimeoutTransport` which keeps the responses of ``GET``
+    requests to the APIs in
+    :py:func:`curator.defaults.settings.cached_request_paths` for `cache_ttl`
+    seconds, and answers identical requests from them.  These APIs, such as
+    ``info`` and ``nodes.info``, are read again and again by some actions,
+    but change slowly.  Node statistics, whose free disk space changes as
+    shards move, are never cached.  Any request which may change the cluster
+    empties the cache.
+    """
+    #: The number of seconds a response is kept.  ``0`` disables the cache.
+    cache_ttl = settings.cache_ttl()
+
+    def __init__(self, *args, **kwargs):
+        super(CachingTransport, self).__init__(*args, **kwargs)
+        self.cache_lock = threading.Lock()
+        self.cache = {}
+        #: The number of requests answered from the cache.
+        self.cache_hits = 0
+        #: The number of cacheable requests sent to Elasticsearch.
+        self.cache_misses = 0
+
+    def __cacheable(self, method, url):
+        if method != 'GET' or not self.cache_ttl:
+            return False
+        path = url.split('?')[0]
+        for part in path.split('/'):
+            if part in settings.uncached_request_parts():
+                return False
+        for cached in settings.cached_request_paths():
+            if path == cached or (
+                    cached != '/' and path.startswith(cached + '/')):
+                return True
+        return False
+
+    def __writes(self, method, url):
+        if method in ['GET', 'HEAD']:
+            return False
+        endpoint = url.split('?')[0].rstrip('/').split('/')[-1]
+        return endpoint not in settings.read_only_post_endpoints()
+
+    def perform_request(self, method, url, *args, **kwargs):
+        if not self.__cacheable(method, url):
+            if self.__writes(method, url):
+                self.clear_cache()
+            return super(CachingTransport, self).perform_request(
+                method, url, *args, **kwargs)
+        params = dict(kwargs.get('params') or {})
+        params.pop('request_timeout', None)
+        key = (url, repr(args), repr(sorted(params.items())))
+        with self.cache_lock:
+            if key in self.cache and self.cache[key][0] > time.time():
+                self.cache_hits += 1
+                return deepcopy(self.cache[key][1])
+            self.cache_misses += 1
+        response = super(CachingTransport, self).perform_request(
+            method, url, *args, **kwargs)
+        with self.cache_lock:
+            self.cache[key] = (time.time() + self.cache_ttl, response)
+        return deepcopy(response)
+
+    def clear_cache(self):
+        """
+        Forget every cached response.
+        """
+        with self.cache_lock:
+            self.cache = {}
+
+def request_cache_stats(client):
+    """
+    Return the number of `hits` and `misses` of the response cache of
+    `client`, or `None` if it has no cache.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :rtype: dict
+    """
+    if not isinstance(client.transport, CachingTransport):
+        return None
+    return {
+        'hits': client.transport.cache_hits,
+        'misses': client.transport.cache_misses,
+    }
+
+def set_request_timeout(client, timeout):
+    """
+    Set the timeout of every request sent by `client` from now on, without
+    creating a new client.  Only clients from :py:func:`get_client` support
+    this.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg timeout: A number of seconds, or `None` for the client timeout
+    """
+    if isinstance(client.transport, RequestTimeoutTransport):
+        client.transport.request_timeout = timeout
+    else:
+        logger.warn(
+            'Unable to set a request timeout of {0} for this client.'.format(
+                timeout)
+        )
+
 def get_client(**kwargs):
     """
     NOTE: AWS IAM parameters `aws_sign_request` and `aws_region` are
@@ -769,6 +1322,10 @@ def get_client(**kwargs):
     :type master_only: bool
     :arg skip_version_test: If `True`, skip the version check as part of the
         client connection.
+    :arg cache_ttl: How many seconds responses of slowly changing APIs, such
+        as ``info`` and ``nodes.stats``, are reused for.  ``0`` turns this off.
+        See :py:class:`CachingTransport`.
+    :type cache_ttl: int
     :rtype: :class:`elasticsearch.Elasticsearch`
     """
     if 'url_prefix' in kwargs:
@@ -888,8 +1445,13 @@ def get_client(**kwargs):
                 '"master_only" cannot be true if more than one host is '
                 'specified. Hosts = {0}'.format(kwargs['hosts'])
             )
+    cache_ttl = kwargs.pop('cache_ttl', settings.cache_ttl())
+    if not 'transport_class' in kwargs:
+        kwargs['transport_class'] = CachingTransport
     try:
         client = elasticsearch.Elasticsearch(**kwargs)
+        if isinstance(client.transport, CachingTransport):
+            client.transport.cache_ttl = cache_ttl
         if skip_version_test:
             logger.warn(
                 'Skipping Elasticsearch version verification. This is '
@@ -920,6 +1482,7 @@ def show_dry_run(ilo, action, **kwargs):
         '(CLOSED) indices may be shown that may not be acted on by '
         'action "{0}".'.format(action)
     )
+    ilo.load_index_info('state')
     indices = sorted(ilo.indices)
     for idx in indices:
             index_closed = ilo.index_info[idx]['state'] == 'close'
@@ -1499,10 +2062,15 @@ def health_check(client, **kwargs):
     klist = list(kwargs.keys())
     if len(klist) < 1:
         raise exceptions.MissingArgument('Must provide at least one keyword argument')
-    hc_data = client.cluster.health()
-    response = True
+    return _health_matches(client.cluster.health(), kwargs)
 
-    for k in klist:
+def _health_matches(hc_data, kwargs):
+    """
+    Return `True` if every key in `kwargs` has the same value in the cluster
+    health response `hc_data`.
+    """
+    response = True
+    for k in list(kwargs.keys()):
         # First, verify that all kwargs are in the list
         if not k in list(hc_data.keys()):
             raise exceptions.ConfigurationError('Key "{0}" not in cluster health output')
@@ -1542,6 +2110,13 @@ def snapshot_check(client, snapshot=None, repository=None):
             'Unable to obtain information for snapshot "{0}" in repository '
             '"{1}". Error: {2}'.format(snapshot, repository, e)
         )
+    return _snapshot_finished(snapshot, state)
+
+def _snapshot_finished(snapshot, state):
+    """
+    Log the `state` of `snapshot`, and return `False` if it is still
+    `IN_PROGRESS`, or `True` otherwise.
+    """
     logger.debug('Snapshot state = {0}'.format(state))
     if state == 'IN_PROGRESS':
         logger.info('Snapshot {0} still in progress.'.format(snapshot))
@@ -1598,6 +2173,14 @@ def restore_check(client, index_list):
             'Unable to obtain recovery information for specified indices. '
             'Error: {0}'.format(e)
         )
+    return _recovered(response, index_list)
+
+def _recovered(response, index_list):
+    """
+    Return `True` if every index in `index_list` is in the recovery
+    `response`, and every shard of each is in the `DONE` stage, or `False`
+    otherwise.
+    """
     # This should address #962, where perhaps the cluster state hasn't yet
     # had a chance to add a _recovery state yet, so it comes back empty.
     if response == {}:
@@ -1606,7 +2189,13 @@ def restore_check(client, index_list):
     # Fixes added in #989
     logger.info('Provided indices: {0}'.format(index_list))
     logger.info('Found indices: {0}'.format(list(response.keys())))
+    missing = [index for index in index_list if index not in response]
+    if missing:
+        logger.info('Indices not yet recovering: {0}'.format(missing))
+        return False
     for index in response:
+        if index not in index_list:
+            continue
         for shard in range(0, len(response[index]['shards'])):
             # Apparently `is not` is not always `!=`.  Unsure why, will
             # research later.  Using != fixes #966
@@ -1639,6 +2228,13 @@ def task_check(client, task_id=None):
             'Unable to obtain task information for task_id "{0}". Exception '
             '{1}'.format(task_id, e)
         )
+    return _task_finished(task_id, task_data)
+
+def _task_finished(task_id, task_data):
+    """
+    Log the progress of the task `task_id` from its `task_data`, and return
+    `True` if it has completed, or `False` otherwise.
+    """
     task = task_data['task']
     completed = task_data['completed']
     running_time = 0.000000001 * task['running_time_in_nanos']
@@ -1674,47 +2270,17 @@ def wait_for_it(
         declared.
     :arg snapshot: The name of the snapshot.
     :arg repository: The Elasticsearch snapshot repository to use
-    :arg wait_interval: How frequently the specified "wait" behavior will be
-        polled to check for completion.
+    :arg wait_interval: The longest time in seconds between checks for
+        completion.  Checks start after about a second, and back off up to
+        this.
     :arg max_wait: Number of seconds will the "wait" behavior persist
         before giving up and raising an Exception.  The default is -1, meaning
         it will try forever.
     """
-    action_map = {
-        'allocation':{
-            'function': health_check,
-            'args': {'relocating_shards':0},
-        },
-        'replicas':{
-            'function': health_check,
-            'args': {'status':'green'},
-        },
-        'cluster_routing':{
-            'function': health_check,
-            'args': {'relocating_shards':0},
-        },
-        'snapshot':{
-            'function':snapshot_check,
-            'args':{'snapshot':snapshot, 'repository':repository},
-        },
-        'restore':{
-            'function':restore_check,
-            'args':{'index_list':index_list},
-        },
-        'reindex':{
-            'function':task_check,
-            'args':{'task_id':task_id},
-        },
-        'shrink':{
-            'function': health_check,
-            'args': {'status':'green'},
-        },
-        'relocate':{
-            'function': relocate_check,
-            'args': {'index':index}
-        },
-    }
-    wait_actions = list(action_map.keys())
+    wait_actions = [
+        'allocation', 'replicas', 'cluster_routing', 'snapshot', 'restore',
+        'reindex', 'shrink', 'relocate',
+    ]
 
     if action not in wait_actions:
         raise exceptions.ConfigurationError(
@@ -1743,37 +2309,14 @@ def wait_for_it(
                 'Unable to find task_id {0}. Exception: {1}'.format(task_id, e)
             )
 
-    # Now with this mapped, we can perform the wait as indicated.
-    start_time = datetime.now()
-    result = False
-    while True:
-        elapsed = int((datetime.now() - start_time).total_seconds())
-        logger.debug('Elapsed time: {0} seconds'.format(elapsed))
-        response = action_map[action]['function'](
-            client, **action_map[action]['args'])
-        logger.debug('Response: {0}'.format(response))
-        # Success
-        if response:
-            logger.debug(
-                'Action "{0}" finished executing (may or may not have been '
-                'successful)'.format(action))
-            result = True
-            break
-        # Not success, and reached maximum wait (if defined)
-        elif (max_wait != -1) and (elapsed >= max_wait):
-            logger.error(
-                'Unable to complete action "{0}" within max_wait ({1}) '
-                'seconds.'.format(action, max_wait)
-            )
-            break
-        # Not success, so we wait.
-        else:
-            logger.debug(
-                'Action "{0}" not yet complete, {1} total seconds elapsed. '
-                'Waiting {2} seconds before checking '
-                'again.'.format(action, elapsed, wait_interval))
-            time.sleep(wait_interval)
-
+    # Wait for this one operation
+    waiter = CompletionWaiter(client, wait_interval=wait_interval)
+    waiter.add(
+        action, action, max_wait=max_wait, task_id=task_id,
+        snapshot=snapshot, repository=repository, index=index,
+        index_list=index_list
+    )
+    result = all(completed for _, completed in waiter)
     logger.debug('Result: {0}'.format(result))
     if result == False:
         raise exceptions.ActionTimeout(
@@ -1781,6 +2324,375 @@ def wait_for_it(
             '{1} seconds'.format(action, max_wait)
         )
 
+class CompletionWaiter(object):
+    """
+    Wait for many operations at once: tasks, snapshots, restores, index
+    relocations, and cluster health conditions.  Each cycle, all pending
+    operations of a kind are checked together, with one batched request, and
+    the time between cycles grows exponentially, with jitter, up to
+    `wait_interval` seconds.  Each operation keeps its own `max_wait`.
+
+    Operations are added with :py:meth:`add`, and :py:meth:`wait` returns
+    those which finish as soon as any do, so more can be added in between.
+    Iterating over the waiter yields each operation as it finishes, until none
+    are pending.  Threads sharing one waiter each add their own operations
+    and call :py:meth:`wait_for`, which checks for all of them at once.
+
+    :arg client: An :class:`elasticsearch.Elasticsearch` client object
+    :arg wait_interval: The longest time in seconds between checks.
+    """
+    # The check each wait_for_it action uses, and the cluster health it waits
+    # for, if any.
+    kinds = {
+        'allocation': ('health', {'relocating_shards': 0}),
+        'cluster_routing': ('health', {'relocating_shards': 0}),
+        'replicas': ('health', {'status': 'green'}),
+        'shrink': ('health', {'status': 'green'}),
+        'snapshot': ('snapshot', None),
+        'restore': ('restore', None),
+        'reindex': ('task', None),
+        'task': ('task', None),
+        'relocate': ('relocate', None),
+    }
+
+    def __init__(self, client, wait_interval=9):
+        #: Instance variable.
+        #: The Elasticsearch Client object
+        self.client = client
+        #: Instance variable.
+        #: The longest time in seconds between checks
+        self.wait_interval = wait_interval
+        #: Instance variable.
+        #: The operations not yet finished, by key.  **Type:** ``dict()``
+        self.pending = OrderedDict()
+        #: Instance variable.
+        #: The final task data of each finished ``task`` or ``reindex``
+        #: operation, by key.  **Type:** ``dict()``
+        self.results = {}
+        self.__cycle = 0
+        # Guards `pending` for threads calling add() and wait_for()
+        self.__condition = threading.Condition(threading.RLock())
+        self.__polling = False
+        # Outcomes not yet collected by wait() or wait_for(), by key
+        self.__finished = OrderedDict()
+
+    def add(self, key, action, max_wait=-1, task_id=None, snapshot=None,
+            repository=None, index=None, index_list=None):
+        """
+        Start waiting for an operation.
+
+        :arg key: A hashable value identifying the operation to the caller
+        :arg action: One of the :py:func:`wait_for_it` actions, or ``task``
+        :arg max_wait: Number of seconds to wait for this operation before
+            giving up on it.  The default, ``-1``, waits forever.
+        :arg task_id: The task id, for ``task`` and ``reindex``
+        :arg snapshot: The snapshot name, for ``snapshot``
+        :arg repository: The repository name, for ``snapshot``
+        :arg index: The index name, for ``relocate``
+        :arg index_list: The restored index names, for ``restore``
+        """
+        if action not in self.kinds:
+            raise exceptions.ConfigurationError(
+                '"action" must be one of {0}'.format(sorted(self.kinds)))
+        kind, health = self.kinds[action]
+        with self.__condition:
+            self.pending[key] = {
+                'key': key, 'action': action, 'kind': kind, 'health': health,
+                'max_wait': -1 if max_wait is None else max_wait,
+                'started': time.time(), 'task_id': task_id,
+                'snapshot': snapshot, 'repository': repository, 'index': index,
+                'index_list': index_list,
+            }
+            # Check new operations soon
+            self.__cycle = 0
+
+    def __backoff(self):
+        delay = min(
+            self.wait_interval,
+            settings.wait_backoff_initial() * (2 ** self.__cycle)
+        )
+        self.__cycle += 1
+        return random.uniform(delay / 2.0, delay)
+
+    def __check_health(self, operations):
+        if len(operations) == 1:
+            if health_check(self.client, **operations[0]['health']):
+                return operations
+            return []
+        hc_data = self.client.cluster.health()
+        done = []
+        for op in operations:
+            for k in op['health']:
+                if not k in hc_data:
+                    raise exceptions.ConfigurationError(
+                        'Key "{0}" not in cluster health output'.format(k))
+            if _health_matches(hc_data, op['health']):
+                done.append(op)
+        return done
+
+    def __check_tasks(self, operations):
+        if len(operations) > 1:
+            # Only tasks which are no longer running need to be fetched
+            running = set()
+            listing = self.client.tasks.list(detailed=False)
+            for node in listing.get('nodes', {}).values():
+                running.update(node.get('tasks', {}))
+            operations = [
+                op for op in operations if op['task_id'] not in running]
+        done = []
+        for op in operations:
+            try:
+                task_data = self.client.tasks.get(task_id=op['task_id'])
+            except Exception as e:
+                raise exceptions.CuratorException(
+                    'Unable to obtain task information for task_id "{0}". '
+                    'Exception {1}'.format(op['task_id'], e)
+                )
+            if _task_finished(op['task_id'], task_data):
+                self.results[op['key']] = task_data
+                done.append(op)
+        return done
+
+    def __check_snapshots(self, operations):
+        repositories = OrderedDict()
+        for op in operations:
+            repositories.setdefault(op['repository'], []).append(op)
+        done = []
+        for repository, ops in repositories.items():
+            if len(ops) == 1:
+                if snapshot_check(
+                        self.client, snapshot=ops[0]['snapshot'],
+                        repository=repository):
+                    done.append(ops[0])
+                continue
+            names = [op['snapshot'] for op in ops]
+            try:
+                snapshots = self.client.snapshot.get(
+                    repository=repository, snapshot=to_csv(names)
+                )['snapshots']
+            except Exception as e:
+                raise exceptions.CuratorException(
+                    'Unable to obtain information for snapshots {0} in '
+                    'repository "{1}". Error: {2}'.format(names, repository, e)
+                )
+            states = dict((snap['snapshot'], snap['state']) for snap in snapshots)
+            for op in ops:
+                state = states.get(op['snapshot'], 'IN_PROGRESS')
+                if _snapshot_finished(op['snapshot'], state):
+                    done.append(op)
+        return done
+
+    def __check_restores(self, operations):
+        if len(operations) == 1:
+            if restore_check(self.client, operations[0]['index_list']):
+                return operations
+            return []
+        indices = sorted(set(
+            index for op in operations for index in op['index_list']))
+        response = {}
+        try:
+            for chunk in chunked_requests(
+                    indices, lambda data: self.client.indices.recovery(
+                        index=to_csv(data), human=True)):
+                response.update(chunk or {})
+        except Exception as e:
+            raise exceptions.CuratorException(
+                'Unable to obtain recovery information for specified indices. '
+                'Error: {0}'.format(e)
+            )
+        return [
+            op for op in operations if _recovered(response, op['index_list'])]
+
+    def __check_relocations(self, operations):
+        if len(operations) == 1:
+            try:
+                if relocate_check(self.client, operations[0]['index']):
+                    return operations
+            except KeyError:
+                raise exceptions.CuratorException(
+                    'Index "{0}" not found in the routing table'.format(
+                        operations[0]['index'])
+                )
+            return []
+        indices = sorted(set(op['index'] for op in operations))
+        tables = {}
+        for response in chunked_requests(
+                indices, lambda data: self.client.cluster.state(
+                    index=to_csv(data), metric='routing_table',
+                    filter_path=settings.shard_state_filter_path())):
+            tables.update(
+                (response or {}).get('routing_table', {}).get('indices', {}))
+        done = []
+        for op in operations:
+            if op['index'] not in tables:
+                raise exceptions.CuratorException(
+                    'Index "{0}" not found in the routing table'.format(
+                        op['index'])
+                )
+            shards = tables[op['index']].get('shards', {})
+            if shards and all(
+                    all(shard['state'] == 'STARTED' for shard in copies)
+                    for copies in shards.values()):
+                logger.info(
+                    'Relocate Check for index: "{0}" has passed.'.format(
+                        op['index']))
+                done.append(op)
+        return done
+
+    def __check(self, check, operations):
+        """
+        Return ``(op, True)`` for each of `operations` which `check` finds
+        finished, and ``(op, error)`` for each it fails on.  When a batched
+        check fails, each operation is checked on its own, so that one bad
+        operation does not fail the others.
+        """
+        try:
+            return [(op, True) for op in check(operations)]
+        except Exception as e:
+            if len(operations) == 1:
+                logger.error(
+                    'Unable to check action "{0}": {1}'.format(
+                        operations[0]['action'], e)
+                )
+                return [(operations[0], e)]
+        outcomes = []
+        for op in operations:
+            outcomes.extend(self.__check(check, [op]))
+        return outcomes
+
+    def __poll(self):
+        checks = {
+            'health': self.__check_health,
+            'task': self.__check_tasks,
+            'snapshot': self.__check_snapshots,
+            'restore': self.__check_restores,
+            'relocate': self.__check_relocations,
+        }
+        kinds = OrderedDict()
+        with self.__condition:
+            checked = list(self.pending.values())
+        for op in checked:
+            kinds.setdefault(op['kind'], []).append(op)
+        finished = []
+        for kind, operations in kinds.items():
+            for op, outcome in self.__check(checks[kind], operations):
+                if outcome is True:
+                    logger.debug(
+                        'Action "{0}" finished executing (may or may not have '
+                        'been successful)'.format(op['action']))
+                finished.append((op['key'], outcome))
+        now = time.time()
+        with self.__condition:
+            for key, _ in finished:
+                del self.pending[key]
+            for op in checked:
+                if op['key'] not in self.pending:
+                    continue
+                elapsed = now - op['started']
+                if op['max_wait'] != -1 and elapsed >= op['max_wait']:
+                    logger.error(
+                        'Unable to complete action "{0}" within max_wait ({1}) '
+                        'seconds.'.format(op['action'], op['max_wait'])
+                    )
+                    del self.pending[op['key']]
+                    finished.append((op['key'], False))
+        return finished
+
+    def wait(self):
+        """
+        Check the pending operations until at least one finishes or reaches
+        its `max_wait`, and return ``(key, completed)`` for each which did.
+        `completed` is `False` if the operation reached its `max_wait`.
+        Return an empty list if no operations are pending.
+
+        If checking an operation fails, it is no longer pending, and its error
+        is raised.  Other operations which finished at the same time are
+        returned by the next call.
+
+        :rtype: list
+        """
+        while True:
+            with self.__condition:
+                finished = list(self.__finished.items())
+                self.__finished.clear()
+            if finished or not self.pending:
+                break
+            finished = self.__poll()
+            if finished:
+                break
+            delay = self.__backoff()
+            logger.debug(
+                '{0} operations not yet complete. Waiting {1:.1f} seconds '
+                'before checking again.'.format(len(self.pending), delay))
+            time.sleep(delay)
+        for index, (key, outcome) in enumerate(finished):
+            if isinstance(outcome, Exception):
+                with self.__condition:
+                    for other in finished[:index] + finished[index + 1:]:
+                        self.__finished[other[0]] = other[1]
+                raise outcome
+        return finished
+
+    def wait_for(self, key):
+        """
+        Wait until the operation `key` finishes or reaches its `max_wait`, and
+        return `True` if it finished.  Several threads may wait at once: one
+        of them checks the pending operations of all, and the others are woken
+        when it is done.  If checking the operation fails, its error is raised
+        here, in the thread waiting for it, and not in the others.  If this
+        thread stops waiting for any other reason, the operation is dropped.
+
+        :arg key: The key of an operation added with :py:meth:`add`
+        :rtype: bool
+        """
+        try:
+            outcome = self.__wait_for(key)
+        except BaseException:
+            self.discard(key)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def __wait_for(self, key):
+        while True:
+            with self.__condition:
+                if key in self.__finished:
+                    return self.__finished.pop(key)
+                if key not in self.pending:
+                    raise exceptions.CuratorException(
+                        'No operation "{0}" is pending'.format(key))
+                if self.__polling:
+                    self.__condition.wait()
+                    continue
+                self.__polling = True
+            finished = []
+            try:
+                finished = self.__poll()
+                if not finished:
+                    time.sleep(self.__backoff())
+            finally:
+                with self.__condition:
+                    self.__polling = False
+                    self.__finished.update(finished)
+                    self.__condition.notify_all()
+
+    def discard(self, key):
+        """
+        Stop waiting for the operation `key`, and forget its outcome, if it
+        has one which has not been collected.
+
+        :arg key: The key of an operation added with :py:meth:`add`
+        """
+        with self.__condition:
+            self.pending.pop(key, None)
+            self.__finished.pop(key, None)
+
+    def __iter__(self):
+        while self.pending or self.__finished:
+            for item in self.wait():
+                yield item
+
 def node_roles(client, node_id):
     """
     Return the list of roles assigned to the node identified by ``node_id``
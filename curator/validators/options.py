@@ -17,7 +17,10 @@ def action_specific(action):
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
         ],
-        'close' : [ option_defaults.delete_aliases() ],
+        'close' : [
+            option_defaults.delete_aliases(),
+            option_defaults.max_concurrent_chunks(),
+        ],
         'cluster_routing' : [
             option_defaults.routing_type(),
             option_defaults.cluster_routing_setting(),
@@ -30,7 +33,7 @@ def action_specific(action):
             option_defaults.name(action),
             option_defaults.extra_settings(),
         ],
-        'delete_indices' : [],
+        'delete_indices' : [ option_defaults.max_concurrent_chunks() ],
         'delete_snapshots' : [
             option_defaults.repository(),
             option_defaults.retry_interval(),
@@ -38,6 +41,8 @@ def action_specific(action):
         ],
         'forcemerge' : [
             option_defaults.delay(),
+            option_defaults.max_duration(),
+            option_defaults.max_merges_per_node(),
             option_defaults.max_num_segments(),
         ],
         'index_settings' : [
@@ -45,7 +50,7 @@ def action_specific(action):
             option_defaults.ignore_unavailable(),
             option_defaults.preserve_existing(),
         ],
-        'open' : [],
+        'open' : [ option_defaults.max_concurrent_chunks() ],
         'reindex' : [
             option_defaults.request_body(),
             option_defaults.refresh(),
@@ -124,6 +129,8 @@ def action_specific(action):
             option_defaults.wait_for_rebalance(),
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
+            option_defaults.max_shrinks_per_node(),
+            option_defaults.shrink_placement(),
         ],
     }
     return options[action]
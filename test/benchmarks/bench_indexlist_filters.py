@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Measure how IndexList filter cost scales with the number of indices.
+
+Run from the top of the repository::
+
+    python -m test.benchmarks.bench_indexlist_filters
+
+A fake client answers the listing, metadata and stats calls, so no cluster
+is needed.  Each size is timed for a ``pattern`` filter which removes half of
+the indices, and an ``age`` filter by name which removes the rest.  The
+per-index cost in the last column should stay roughly flat as the index
+count grows; a quadratic list removal would grow it linearly instead.
+"""
+from __future__ import print_function
+import sys
+import time
+from datetime import datetime, timedelta
+from mock import Mock
+import curator
+
+SIZES = [1000, 5000, 10000, 50000, 100000]
+
+def _names(count):
+    start = datetime(2016, 1, 1)
+    names = []
+    for num in range(count):
+        prefix = 'keep' if num % 2 else 'drop'
+        day = start + timedelta(days=num % 900)
+        names.append(
+            '{0}-{1:06d}-{2}'.format(prefix, num, day.strftime('%Y.%m.%d')))
+    return names
+
+def _requested(kwargs):
+    return kwargs['index'].split(',')
+
+def fake_client(names):
+    settings = {}
+    state = {}
+    stats = {}
+    for name in names:
+        settings[name] = {'settings': {'index': {}}}
+        state[name] = {
+            'state': 'open',
+            'settings': {
+                'index': {
+                    'creation_date': '1456963200172',
+                    'number_of_shards': '1',
+                    'number_of_replicas': '0',
+                }
+            },
+        }
+        stats[name] = {
+            'total': {'store': {'size_in_bytes': 1024}, 'docs': {'count': 1}}
+        }
+    client = Mock()
+    client.info.return_value = {'version': {'number': '5.0.0'}}
+    client.indices.get_settings.return_value = settings
+    client.cluster.state.side_effect = lambda **kw: {
+        'metadata': {
+            'indices': dict((i, state[i]) for i in _requested(kw))
+        }
+    }
+    client.indices.stats.side_effect = lambda **kw: {
+        'indices': dict((i, stats[i]) for i in _requested(kw))
+    }
+    return client
+
+def run(sizes=None):
+    sizes = sizes or SIZES
+    print('{0:>8} {1:>10} {2:>10} {3:>14}'.format(
+        'indices', 'regex (s)', 'age (s)', 'us per index'))
+    for count in sizes:
+        ilo = curator.IndexList(fake_client(_names(count)))
+        start = time.time()
+        ilo.filter_by_regex(kind='prefix', value='drop-', exclude=True)
+        regex_time = time.time() - start
+        start = time.time()
+        ilo.filter_by_age(
+            source='name', direction='younger', timestring='%Y.%m.%d',
+            unit='days', unit_count=1
+        )
+        age_time = time.time() - start
+        print('{0:>8} {1:>10.3f} {2:>10.3f} {3:>14.2f}'.format(
+            count, regex_time, age_time,
+            (regex_time + age_time) / count * 1000000
+        ))
+
+if __name__ == '__main__':
+    run([int(x) for x in sys.argv[1:]])
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+Compare the ways IndexList can read its index inventory.
+
+Run from the top of the repository::
+
+    python -m test.benchmarks.bench_inventory [RECORDING_DIR]
+
+``RECORDING_DIR`` may hold responses recorded from a real cluster:
+
+* ``settings.json``: ``GET /_all/_settings?expand_wildcards=open,closed``
+* ``state.json``: ``GET /_cluster/state/metadata/_all?expand_wildcards=open,closed``
+* ``stats.json``: ``GET /_all/_stats/store,docs``
+* ``cat.json``: ``GET /_cat/indices?format=json&bytes=b&h=`` followed by the
+  columns in :py:func:`curator.defaults.settings.cat_indices_columns`
+
+Without it, responses for 50,000 indices, each with a small mapping, are
+generated.  Every fake request is serialized to JSON and parsed again, so the
+report reflects the bytes Curator would receive and decode.  Each mode loads
+what an ``age`` filter by ``creation_date`` followed by ``space`` needs.
+"""
+from __future__ import print_function
+import json
+import os
+import sys
+import time
+from mock import Mock
+import curator
+
+COUNT = 50000
+
+def _generate(count):
+    settings_resp = {}
+    state = {}
+    stats = {}
+    cat = []
+    mapping = {
+        'doc': {'properties': dict(
+            ('field_{0}'.format(num), {'type': 'keyword'}) for num in range(20)
+        )}
+    }
+    for num in range(count):
+        name = 'logstash-{0:06d}'.format(num)
+        index_settings = {
+            'index': {
+                'creation_date': '1456963200172',
+                'number_of_shards': '5',
+                'number_of_replicas': '1',
+                'uuid': 'u{0:021d}'.format(num),
+                'version': {'created': '6020499'},
+                'provided_name': name,
+            }
+        }
+        settings_resp[name] = {'settings': index_settings}
+        state[name] = {
+            'state': 'open', 'settings': index_settings,
+            'mappings': mapping, 'aliases': [],
+        }
+        stats[name] = {
+            'primaries': {
+                'docs': {'count': 500, 'deleted': 0},
+                'store': {'size_in_bytes': 524288},
+            },
+            'total': {
+                'docs': {'count': 1000, 'deleted': 0},
+                'store': {'size_in_bytes': 1048576},
+            },
+        }
+        cat.append({
+            'index': name, 'status': 'open', 'creation.date': '1456963200172',
+            'pri': '5', 'rep': '1', 'docs.count': '500',
+            'store.size': '1048576',
+        })
+    return {
+        'settings': settings_resp,
+        'state': {'metadata': {'indices': state}},
+        'stats': {'indices': stats},
+        'cat': cat,
+    }
+
+def _load(path):
+    data = {}
+    for key in ['settings', 'state', 'stats', 'cat']:
+        with open(os.path.join(path, key + '.json')) as fhandle:
+            data[key] = json.load(fhandle)
+    return data
+
+def _requested(index, names):
+    if index in ['_all', None]:
+        return names
+    return index.split(',')
+
+def _trim_state(indices):
+    keep = ['creation_date', 'number_of_shards', 'number_of_replicas',
+        'routing']
+    trimmed = {}
+    for name, meta in indices.items():
+        index_settings = dict(
+            (k, v) for k, v in meta['settings']['index'].items() if k in keep)
+        trimmed[name] = {
+            'state': meta['state'], 'settings': {'index': index_settings}}
+    return trimmed
+
+class Recorder(object):
+    """Serve the recorded responses and count requests and bytes"""
+    def __init__(self, data):
+        self.data = data
+        self.names = list(data['settings'].keys())
+        self.requests = 0
+        self.received = 0
+
+    def _send(self, response):
+        body = json.dumps(response)
+        self.requests += 1
+        self.received += len(body)
+        return json.loads(body)
+
+    def client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.2.4'}}
+        client.indices.get_settings.side_effect = self.get_settings
+        client.cluster.state.side_effect = self.state
+        client.indices.stats.side_effect = self.stats
+        client.cat.indices.side_effect = self.cat
+        return client
+
+    def get_settings(self, index=None, **kwargs):
+        wanted = _requested(index, self.names)
+        return self._send(
+            dict((i, self.data['settings'][i]) for i in wanted))
+
+    def state(self, index=None, metric=None, filter_path=None, **kwargs):
+        source = self.data['state']['metadata']['indices']
+        wanted = dict((i, source[i]) for i in _requested(index, self.names))
+        if filter_path:
+            wanted = _trim_state(wanted)
+        return self._send({'metadata': {'indices': wanted}})
+
+    def stats(self, index=None, metric=None):
+        source = self.data['stats']['indices']
+        wanted = _requested(index, self.names)
+        return self._send({'indices': dict((i, source[i]) for i in wanted)})
+
+    def cat(self, index=None, **kwargs):
+        return self._send(self.data['cat'])
+
+def run(data):
+    print('{0:>14} {1:>9} {2:>12} {3:>9}'.format(
+        'inventory', 'requests', 'MB received', 'seconds'))
+    for mode in [None, 'cluster_state', 'cat']:
+        recorder = Recorder(data)
+        start = time.time()
+        ilo = curator.IndexList(recorder.client(), index_inventory=mode)
+        ilo.load_index_info('creation_date', 'size_in_bytes')
+        elapsed = time.time() - start
+        print('{0:>14} {1:>9} {2:>12.1f} {3:>9.2f}'.format(
+            str(mode), recorder.requests, recorder.received / 1048576.0,
+            elapsed
+        ))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(_load(sys.argv[1]))
+    else:
+        run(_generate(COUNT))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Compare ways of reading the date in index names with a timestring.
+
+Run from the top of the repository::
+
+    python -m test.benchmarks.bench_timestring [COUNT]
+
+``COUNT`` names (100,000 by default) are parsed for each timestring three
+ways: with the regular expression and :py:func:`curator.utils.get_datetime`,
+as ``TimestringSearch`` used to; with a new ``TimestringSearch``; and again
+with it, as a second filter in the same run would, reusing the parsed names.
+"""
+from __future__ import print_function
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from curator import utils
+
+COUNT = 100000
+TIMESTRINGS = ['%Y.%m.%d', '%Y.%m.%d.%H', '%G.%V']
+
+def _names(timestring, count):
+    start = datetime(2000, 1, 1)
+    return [
+        'logstash-{0}-{1:06d}'.format(
+            (start + timedelta(hours=num)).strftime(timestring), num)
+        for num in range(count)
+    ]
+
+def _strptime(timestring, names):
+    pattern = re.compile(
+        r'(?P<date>{0})'.format(utils.get_date_regex(timestring)))
+    for name in names:
+        match = pattern.search(name)
+        if match and match.group('date'):
+            utils.datetime_to_epoch(
+                utils.get_datetime(match.group('date'), timestring))
+
+def _search(timestring, names):
+    ts = utils.TimestringSearch(timestring)
+    for name in names:
+        ts.get_epoch(name)
+
+def _timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+def run(count=COUNT):
+    print('{0:>12} {1:>12} {2:>12} {3:>12}'.format(
+        'timestring', 'strptime (s)', 'parser (s)', 'repeat (s)'))
+    for timestring in TIMESTRINGS:
+        names = _names(timestring, count)
+        print('{0:>12} {1:>12.3f} {2:>12.3f} {3:>12.3f}'.format(
+            timestring,
+            _timed(_strptime, timestring, names),
+            _timed(_search, timestring, names),
+            _timed(_search, timestring, names),
+        ))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
@@ -126,6 +126,23 @@ class TestActionAlias(TestCase):
         ao = curator.Alias(name='alias')
         ao.add(_)
         self.assertIsNone(ao.do_action())
+    def test_do_action_updates_alias_map(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.indices.get_alias.return_value = testvars.settings_2_get_aliases
+        client.indices.update_aliases.return_value = testvars.alias_success
+        _ = curator.IndexList(client)
+        ao = curator.Alias(name='my_alias')
+        ao.remove(_)
+        ao.do_action()
+        self.assertEqual(set(), _.alias_indices['my_alias'])
+        ao = curator.Alias(name='my_alias')
+        ao.remove(_)
+        self.assertEqual([], ao.actions)
+        self.assertEqual(1, client.indices.get_alias.call_count)
     def test_do_action_raises_exception(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
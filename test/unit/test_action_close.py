@@ -75,3 +75,19 @@ class TestActionClose(TestCase):
         client.indices.delete_alias.side_effect = testvars.fake_fail
         co = curator.Close(ilo, delete_aliases=True)
         self.assertIsNone(co.do_action())
+    def test_do_action_concurrent_chunks(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.flush_synced.return_value = testvars.synced_pass
+        client.indices.close.return_value = None
+        ilo = curator.IndexList(client)
+        curator.set_url_budget(15)
+        self.addCleanup(curator.set_url_budget, 3072)
+        co = curator.Close(ilo, max_concurrent_chunks=4)
+        self.assertIsNone(co.do_action())
+        # One of the four indices is already closed
+        self.assertEqual(3, client.indices.close.call_count)
+        self.assertEqual(3, client.indices.flush_synced.call_count)
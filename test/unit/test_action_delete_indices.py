@@ -36,7 +36,8 @@ class TestActionDeleteIndices(TestCase):
         ilo = curator.IndexList(client)
         do = curator.DeleteIndices(ilo)
         self.assertIsNone(do.do_dry_run())
-    def test_do_action(self):
+    @patch('time.sleep')
+    def test_do_action(self, mock_sleep):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_four
@@ -46,7 +47,8 @@ class TestActionDeleteIndices(TestCase):
         ilo = curator.IndexList(client)
         do = curator.DeleteIndices(ilo)
         self.assertIsNone(do.do_action())
-    def test_do_action_not_successful(self):
+    @patch('time.sleep')
+    def test_do_action_not_successful(self, mock_sleep):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_four
@@ -56,6 +58,48 @@ class TestActionDeleteIndices(TestCase):
         ilo = curator.IndexList(client)
         do = curator.DeleteIndices(ilo)
         self.assertIsNone(do.do_action())
+    @patch('time.sleep')
+    def test_verify_per_chunk(self, mock_sleep):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.delete.return_value = None
+        ilo = curator.IndexList(client)
+        client.indices.get_settings.return_value = {
+            'a-2016.03.03': {'settings': {'index': {'uuid': 'x'}}}}
+        do = curator.DeleteIndices(ilo)
+        do.do_action()
+        # The listing, then one check per try
+        self.assertEqual(4, client.indices.get_settings.call_count)
+        self.assertTrue(
+            client.indices.get_settings.call_args[1]['ignore_unavailable'])
+        self.assertEqual(
+            'a-2016.03.03', client.indices.delete.call_args[1]['index'])
+        self.assertEqual(
+            [((2,), {}), ((4,), {})],
+            [tuple(c) for c in mock_sleep.call_args_list]
+        )
+        self.assertEqual(['a-2016.03.03'], sorted(
+            ilo.snapshot.get_listing('_all')))
+    @patch('time.sleep')
+    def test_do_action_concurrent_chunks(self, mock_sleep):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.delete.return_value = None
+        ilo = curator.IndexList(client)
+        client.indices.get_settings.return_value = {}
+        curator.set_url_budget(15)
+        self.addCleanup(curator.set_url_budget, 3072)
+        do = curator.DeleteIndices(ilo, max_concurrent_chunks=4)
+        do.do_action()
+        self.assertEqual(4, client.indices.delete.call_count)
+        self.assertEqual([], ilo.snapshot.get_listing('_all'))
+        self.assertFalse(mock_sleep.called)
     def test_do_action_raises_exception(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
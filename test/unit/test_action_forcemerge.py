@@ -1,3 +1,4 @@
+import time
 from unittest import TestCase
 from mock import Mock, patch
 import elasticsearch
@@ -5,6 +6,15 @@ import curator
 # Get test variables and constants from a single source
 from . import testvars as testvars
 
+def stats_and_segments(stats, segments):
+    # One response serves both the store/docs and the segments stats requests
+    response = {'indices': {}}
+    for source in (stats, segments):
+        for index, data in source['indices'].items():
+            total = response['indices'].setdefault(index, {'total': {}})['total']
+            total.update(data['total'])
+    return response
+
 class TestActionForceMerge(TestCase):
     def test_init_raise_bad_client(self):
         self.assertRaises(
@@ -14,8 +24,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         ilo = curator.IndexList(client)
         self.assertRaises(
             curator.MissingArgument, curator.ForceMerge, ilo)
@@ -24,8 +34,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         ilo = curator.IndexList(client)
         fmo = curator.ForceMerge(ilo, max_num_segments=2)
         self.assertEqual(ilo, fmo.index_list)
@@ -35,8 +45,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         client.indices.forcemerge.return_value = None
         client.indices.optimize.return_value = None
         ilo = curator.IndexList(client)
@@ -47,8 +57,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         client.info.return_value = {'version': {'number': '2.3.2'} }
         client.indices.optimize.return_value = None
         ilo = curator.IndexList(client)
@@ -59,8 +69,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.forcemerge.return_value = None
         ilo = curator.IndexList(client)
@@ -71,8 +81,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.forcemerge.return_value = None
         ilo = curator.IndexList(client)
@@ -83,8 +93,8 @@ class TestActionForceMerge(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
-        client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_one, testvars.segments_one)
         client.indices.forcemerge.return_value = None
         client.indices.optimize.return_value = None
         client.indices.forcemerge.side_effect = testvars.fake_fail
@@ -92,3 +102,94 @@ class TestActionForceMerge(TestCase):
         ilo = curator.IndexList(client)
         fmo = curator.ForceMerge(ilo, max_num_segments=2)
         self.assertRaises(curator.FailedExecution, fmo.do_action)
+    def two_index_client(self, version='5.0.0'):
+        client = Mock()
+        client.info.return_value = {'version': {'number': version} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_two, {'indices': dict(
+                (index, {'total': {'segments': {'count': 71}}})
+                for index in testvars.settings_two)})
+        routing = {'routing_table': {'indices': dict(
+            (index, {'shards': {'0': [
+                {'primary': True, 'node': 'node_a'},
+                {'primary': False, 'node': 'node_b'}]}})
+            for index in testvars.settings_two)}}
+        def state(**kwargs):
+            if kwargs.get('metric') == 'routing_table':
+                return routing
+            return testvars.clu_state_two
+        client.cluster.state.side_effect = state
+        return client
+    def test_do_action_concurrent_per_node_limit(self):
+        import threading
+        client = self.two_index_client()
+        lock = threading.Lock()
+        counts = {'running': 0, 'most': 0}
+        def forcemerge(**kwargs):
+            with lock:
+                counts['running'] += 1
+                counts['most'] = max(counts['most'], counts['running'])
+            time.sleep(0.01)
+            with lock:
+                counts['running'] -= 1
+        client.indices.forcemerge.side_effect = forcemerge
+        ilo = curator.IndexList(client)
+        fmo = curator.ForceMerge(ilo, max_num_segments=2, max_merges_per_node=1)
+        fmo.do_action()
+        self.assertEqual(2, client.indices.forcemerge.call_count)
+        self.assertEqual(1, counts['most'])
+        self.assertEqual(
+            {'index-2016.03.03': set(['node_a']),
+             'index-2016.03.04': set(['node_a'])},
+            fmo._primary_nodes(ilo.indices)
+        )
+    @patch('curator.defaults.settings.forcemerge_max_threads')
+    def test_do_action_concurrent_thread_limit(self, mock_threads):
+        import threading
+        mock_threads.return_value = 1
+        client = self.two_index_client()
+        lock = threading.Lock()
+        counts = {'running': 0, 'most': 0}
+        def forcemerge(**kwargs):
+            with lock:
+                counts['running'] += 1
+                counts['most'] = max(counts['most'], counts['running'])
+            time.sleep(0.01)
+            with lock:
+                counts['running'] -= 1
+        client.indices.forcemerge.side_effect = forcemerge
+        ilo = curator.IndexList(client)
+        fmo = curator.ForceMerge(ilo, max_num_segments=2, max_merges_per_node=2)
+        fmo.do_action()
+        self.assertEqual(2, client.indices.forcemerge.call_count)
+        self.assertEqual(1, counts['most'])
+    def test_do_action_concurrent_raises_exception(self):
+        client = self.two_index_client()
+        client.indices.forcemerge.side_effect = testvars.fake_fail
+        ilo = curator.IndexList(client)
+        fmo = curator.ForceMerge(ilo, max_num_segments=2, max_merges_per_node=2)
+        self.assertRaises(curator.FailedExecution, fmo.do_action)
+        self.assertEqual(2, client.indices.forcemerge.call_count)
+    def test_do_action_by_benefit(self):
+        client = self.two_index_client()
+        client.indices.stats.return_value = stats_and_segments(
+            testvars.stats_two, {'indices': {
+                'index-2016.03.03': {'total': {'segments': {'count': 71}}},
+                'index-2016.03.04': {'total': {'segments': {'count': 300}}},
+            }})
+        ilo = curator.IndexList(client)
+        fmo = curator.ForceMerge(ilo, max_num_segments=2)
+        fmo.do_action()
+        self.assertEqual(
+            ['index-2016.03.04', 'index-2016.03.03'],
+            [c[1]['index'] for c in client.indices.forcemerge.call_args_list]
+        )
+    def test_do_action_max_duration(self):
+        client = self.two_index_client()
+        client.indices.forcemerge.side_effect = lambda **kwargs: time.sleep(0.05)
+        ilo = curator.IndexList(client)
+        fmo = curator.ForceMerge(ilo, max_num_segments=2, max_duration=1)
+        fmo.max_duration = 0.01
+        fmo.do_action()
+        self.assertEqual(1, client.indices.forcemerge.call_count)
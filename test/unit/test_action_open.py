@@ -53,3 +53,19 @@ class TestActionOpen(TestCase):
         ilo = curator.IndexList(client)
         oo = curator.Open(ilo)
         self.assertRaises(curator.FailedExecution, oo.do_action)
+    def test_do_action_concurrent_chunks(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.open.return_value = None
+        ilo = curator.IndexList(client)
+        curator.set_url_budget(15)
+        self.addCleanup(curator.set_url_budget, 3072)
+        oo = curator.Open(ilo, max_concurrent_chunks=4)
+        self.assertIsNone(oo.do_action())
+        self.assertEqual(4, client.indices.open.call_count)
+        opened = sorted(
+            c[1]['index'] for c in client.indices.open.call_args_list)
+        self.assertEqual(sorted(testvars.settings_four.keys()), opened)
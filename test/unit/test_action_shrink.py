@@ -134,6 +134,21 @@ class TestActionShrink_most_available_node(TestCase):
         shrink.most_available_node()
         self.assertIsNone(shrink.shrink_node_name)
 
+    def test_many_nodes(self):
+        self.builder()
+        self.client.nodes.info.return_value = {u'nodes': dict(
+            (u'node_{0}'.format(i), {u'roles': [u'data']}) for i in range(5))}
+        self.client.nodes.stats.return_value = {u'nodes': dict(
+            (u'node_{0}'.format(i), {u'name': u'name_{0}'.format(i), u'fs': {
+                u'data': [u'one'], u'total': {u'available_in_bytes': i}}})
+            for i in range(5))}
+        shrink = curator.Shrink(self.ilo)
+        shrink.most_available_node()
+        shrink.most_available_node()
+        self.assertEqual(u'name_4', shrink.shrink_node_name)
+        self.assertEqual(1, self.client.nodes.stats.call_count)
+        self.assertEqual(1, self.client.nodes.info.call_count)
+
 class TestActionShrink_route_index(TestCase):
     def builder(self):
         self.client = Mock()
@@ -171,7 +186,7 @@ class TestActionShrink_dry_run(TestCase):
     def test_dry_run_raises(self):
         self.builder()
         self.client.nodes.info.return_value = {u'nodes':{self.node_id:{u'roles':[u'data']}}}
-        self.client.indices.get.side_effect = testvars.fake_fail
+        self.client.indices.stats.side_effect = testvars.fake_fail
         self.client.indices.exists.return_value = False
         shrink = curator.Shrink(self.ilo, shrink_node=self.node_name)
         self.assertRaises(Exception, shrink.do_dry_run)
@@ -215,4 +230,204 @@ class TestActionShrink_various(TestCase):
         self.client.cluster.state.return_value = {'routing_table': {'indices': {testvars.named_index: {'shards': {'0': [{u'index': testvars.named_index, u'node': 'not_this_node', u'primary': True, u'shard': 0, u'state': u'STARTED'}]}}}}}
         shrink = curator.Shrink(self.ilo, shrink_node=self.node_name)
         shrink.shrink_node_id = self.node_id
-        self.assertRaises(curator.ActionError, shrink._check_all_shards, testvars.named_index)
\ No newline at end of file
+        self.assertRaises(curator.ActionError, shrink._check_all_shards, testvars.named_index)
+class TestActionShrink_pipelined(TestCase):
+    def builder(self, available=10**12):
+        self.client = Mock()
+        self.client.info.return_value = {'version': {'number': '5.0.0'} }
+        self.client.indices.get_settings.return_value = testvars.settings_two
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.client.indices.exists.return_value = False
+        self.client.indices.get.side_effect = lambda idx: {
+            idx: {'settings': {'index': {'number_of_shards': 5}}}}
+        self.client.nodes.info.return_value = {u'nodes': {
+            u'id_a': {u'roles': [u'data']}, u'id_b': {u'roles': [u'data']}}}
+        self.client.nodes.stats.return_value = {u'nodes': dict(
+            (u'id_{0}'.format(n), {u'name': u'node_{0}'.format(n), u'fs': {
+                u'data': [u'one'],
+                u'total': {u'available_in_bytes': available}}})
+            for n in ['a', 'b'])}
+        def state(**kwargs):
+            if kwargs.get('metric') == 'metadata':
+                return testvars.clu_state_two
+            shards = dict(
+                (str(i), [
+                    {u'node': u'id_a', u'primary': True, u'state': u'STARTED'},
+                    {u'node': u'id_b', u'primary': False, u'state': u'STARTED'}
+                ]) for i in range(5))
+            return {'routing_table': {'indices': dict(
+                (name, {'shards': shards})
+                for name in kwargs['index'].split(','))}}
+        self.client.cluster.state.side_effect = state
+        self.ilo = curator.IndexList(self.client)
+    def shrink_nodes(self):
+        return set(
+            c[1]['body']['index.routing.allocation.require._name']
+            for c in self.client.indices.put_settings.call_args_list
+            if c[1]['body'].get('index.routing.allocation.require._name')
+        )
+    def test_spread_over_nodes(self):
+        self.builder()
+        shrink = curator.Shrink(self.ilo, max_shrinks_per_node=1)
+        shrink.do_action()
+        self.assertEqual(2, self.client.indices.shrink.call_count)
+        self.assertEqual(set([u'node_a', u'node_b']), self.shrink_nodes())
+        self.assertEqual(2, self.client.indices.delete.call_count)
+    def test_named_node(self):
+        self.builder()
+        shrink = curator.Shrink(
+            self.ilo, shrink_node=u'node_b', max_shrinks_per_node=2)
+        shrink.do_action()
+        self.assertEqual(2, self.client.indices.shrink.call_count)
+        self.assertEqual(set([u'node_b']), self.shrink_nodes())
+    def test_failure_rolls_back(self):
+        self.builder()
+        created = set()
+        def fail(**kwargs):
+            created.add(kwargs['target'])
+            raise testvars.fake_fail
+        self.client.indices.shrink.side_effect = fail
+        self.client.indices.exists.side_effect = (
+            lambda *args, **kwargs: kwargs.get('index') in created)
+        shrink = curator.Shrink(self.ilo, max_shrinks_per_node=1)
+        self.assertRaises(curator.FailedExecution, shrink.do_action)
+        deleted = [c[1]['index'] for c in self.client.indices.delete.call_args_list]
+        self.assertEqual(
+            ['index-2016.03.03-shrink', 'index-2016.03.04-shrink'],
+            sorted(deleted)
+        )
+    def test_shared_waiter(self):
+        self.builder()
+        shrink = curator.Shrink(self.ilo, max_shrinks_per_node=1)
+        shrink.waiter = curator.CompletionWaiter(self.client)
+        shrink.waiter.add('other', 'relocate', index='index-2016.03.04')
+        shrink._wait_for_relocation('index-2016.03.03')
+        batched = [
+            c for c in self.client.cluster.state.call_args_list
+            if c[1].get('index') == 'index-2016.03.03,index-2016.03.04'
+        ]
+        self.assertEqual(1, len(batched))
+        self.assertTrue(shrink.waiter.wait_for('other'))
+    def test_reserve_bytes_to_arrive(self):
+        self.builder()
+        idx = 'index-2016.03.03'
+        shrink = curator.Shrink(self.ilo, max_shrinks_per_node=1)
+        shrink.load_pre_check_data(self.ilo.indices)
+        shrink.shard_bytes[idx] = {
+            'primary': 1000, 'total': 2000, 'held': {u'id_a': 400}}
+        size = self.ilo.index_info[idx]['size_in_bytes']
+        shrink.reserved = {u'id_a': 0}
+        shrink._reserve(idx, u'id_a')
+        self.assertEqual(600 + size + 32 * 1024, shrink.reserved[u'id_a'])
+        # Once moved, the shards are counted in the node's free space
+        shrink._release(idx, 600)
+        self.assertEqual(size + 32 * 1024, shrink.reserved[u'id_a'])
+        shrink._release(idx)
+        self.assertEqual(0, shrink.reserved[u'id_a'])
+        self.assertEqual({}, shrink.in_flight)
+    def test_insufficient_space(self):
+        self.builder(available=1024)
+        shrink = curator.Shrink(self.ilo, max_shrinks_per_node=1)
+        self.assertRaises(curator.FailedExecution, shrink.do_action)
+        self.assertEqual(0, self.client.indices.shrink.call_count)
+
+class TestActionShrink_least_movement(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = {'version': {'number': '5.0.0'} }
+        self.client.indices.get_settings.return_value = testvars.settings_one
+        self.client.cluster.state.return_value = testvars.clu_state_one
+        self.client.nodes.info.return_value = {u'nodes': {
+            u'id_a': {u'roles': [u'data']}, u'id_b': {u'roles': [u'data']}}}
+        self.client.nodes.stats.return_value = {u'nodes': {
+            u'id_a': {u'name': u'node_a', u'fs': {u'data': [u'one'],
+                u'total': {u'available_in_bytes': 90000}}},
+            u'id_b': {u'name': u'node_b', u'fs': {u'data': [u'one'],
+                u'total': {u'available_in_bytes': 50000}}},
+        }}
+        def copy(node, primary, size):
+            return {u'routing': {u'node': node, u'primary': primary},
+                u'store': {u'size_in_bytes': size}}
+        self.client.indices.stats.return_value = {u'indices': {
+            testvars.named_index: {u'shards': {
+                u'0': [copy(u'id_b', True, 100), copy(u'id_a', False, 100)],
+                u'1': [copy(u'id_b', True, 300), copy(u'id_c', False, 300)],
+            }}}}
+        self.ilo = curator.IndexList(self.client)
+    def test_load_shard_placement(self):
+        self.builder()
+        shrink = curator.Shrink(self.ilo)
+        shrink.load_shard_placement([testvars.named_index])
+        self.assertEqual(
+            {'primary': 400, 'total': 800,
+             'held': {u'id_a': 100, u'id_b': 400, u'id_c': 300}},
+            shrink.shard_bytes[testvars.named_index]
+        )
+        self.assertEqual(300, shrink._bytes_to_move(testvars.named_index, u'id_a'))
+    def test_least_movement(self):
+        self.builder()
+        shrink = curator.Shrink(self.ilo, shrink_placement='least_movement')
+        shrink._check_node(testvars.named_index)
+        # Both nodes have room, and node_b holds more of the index
+        self.assertEqual(u'node_b', shrink.shrink_node_name)
+        self.assertEqual(50000, shrink.shrink_node_avail)
+    def test_least_movement_needs_space(self):
+        self.builder()
+        self.client.nodes.stats.return_value[u'nodes'][u'id_b'][u'fs'][
+            u'total'][u'available_in_bytes'] = 5000
+        shrink = curator.Shrink(self.ilo, shrink_placement='least_movement')
+        shrink._check_node(testvars.named_index)
+        self.assertEqual(u'node_a', shrink.shrink_node_name)
+    def test_most_available(self):
+        self.builder()
+        shrink = curator.Shrink(self.ilo)
+        shrink._check_node(testvars.named_index)
+        self.assertEqual(u'node_a', shrink.shrink_node_name)
+
+class TestActionShrink_pre_check_data(TestCase):
+    def test_dry_run_batched(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.nodes.info.return_value = {u'nodes': {u'id_a': {u'roles': [u'data']}}}
+        client.nodes.stats.return_value = {u'nodes': {u'id_a': {
+            u'name': u'node_a', u'fs': {u'data': [u'one'],
+            u'total': {u'available_in_bytes': 10**12}}}}}
+        ilo = curator.IndexList(client)
+        shrink = curator.Shrink(ilo)
+        shrink.do_dry_run()
+        self.assertEqual(set(testvars.settings_two), shrink.pre_checked)
+        self.assertEqual(
+            3187481, ilo.index_info['index-2016.03.03']['primary_docs'])
+        self.assertFalse(client.indices.get.called)
+        self.assertFalse(client.indices.exists.called)
+        # One stats request for the index list, one for shard placement
+        self.assertEqual(2, client.indices.stats.call_count)
+    def test_existing_target(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = curator.IndexList(client)
+        shrink = curator.Shrink(ilo)
+        client.indices.get_settings.return_value = {
+            'index-2016.03.04-shrink': {}}
+        shrink.load_pre_check_data(ilo.indices)
+        self.assertEqual(
+            set(['index-2016.03.04-shrink']), shrink.existing_targets)
+        self.assertRaises(
+            curator.ActionError, shrink._check_target_exists, 'index-2016.03.04')
+        self.assertIsNone(shrink._check_target_exists('index-2016.03.03'))
+    def test_do_action_pre_check_data_fails(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.side_effect = testvars.fake_fail
+        ilo = curator.IndexList(client)
+        shrink = curator.Shrink(ilo)
+        self.assertRaises(curator.FailedExecution, shrink.do_action)
+        self.assertFalse(client.indices.put_settings.called)
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from mock import Mock
+import curator
+# Get test variables and constants from a single source
+from . import testvars as testvars
+
+class TestFieldStatsCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache.db')
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    def test_miss(self):
+        cache = curator.FieldStatsCache(self.path)
+        self.assertIsNone(cache.get('uuid1', '@timestamp', '10:100'))
+        cache.close()
+    def test_hit_after_reopen(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put([('uuid1', '@timestamp', '10:100', 1, 2)])
+        cache.close()
+        cache = curator.FieldStatsCache(self.path)
+        self.assertEqual((1, 2), cache.get('uuid1', '@timestamp', '10:100'))
+        cache.close()
+    def test_fingerprint_changed(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put([('uuid1', '@timestamp', '10:100', 1, 2)])
+        self.assertIsNone(cache.get('uuid1', '@timestamp', '11:120'))
+        self.assertIsNone(cache.get('uuid1', 'other_field', '10:100'))
+        cache.close()
+    def test_max_entries(self):
+        cache = curator.FieldStatsCache(self.path, max_entries=2)
+        cache.put([('uuid1', 'f', 'x', 1, 2)])
+        cache.put([('uuid2', 'f', 'x', 1, 2)])
+        cache.put([('uuid3', 'f', 'x', 1, 2)])
+        self.assertIsNone(cache.get('uuid1', 'f', 'x'))
+        self.assertEqual((1, 2), cache.get('uuid3', 'f', 'x'))
+        cache.close()
+    def test_prune(self):
+        cache = curator.FieldStatsCache(self.path)
+        cache.put([('uuid1', 'f', 'x', 1, 2), ('uuid2', 'f', 'x', 3, 4)])
+        cache.prune(['uuid2'])
+        self.assertIsNone(cache.get('uuid1', 'f', 'x'))
+        self.assertEqual((3, 4), cache.get('uuid2', 'f', 'x'))
+        cache.close()
+
+class TestIndexListFieldStatsCache(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'cache.db')
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+    def client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.cat.indices.return_value = [
+            {'uuid': 'random_uuid_string_here'},
+            {'uuid': 'another_random_uuid_string'},
+        ]
+        client.msearch.return_value = {
+            'responses': [testvars.fieldstats_query] * 2}
+        return client
+    def test_second_run_uses_cache(self):
+        client = self.client()
+        il = curator.IndexList(client, field_stats_cache=self.path)
+        il._get_field_stats_dates(field='timestamp')
+        self.assertEqual(1, client.msearch.call_count)
+        il = curator.IndexList(client, field_stats_cache=self.path)
+        il._get_field_stats_dates(field='timestamp')
+        self.assertEqual(1, client.msearch.call_count)
+        for index in il.indices:
+            self.assertEqual(
+                1456963206, il.index_info[index]['age']['min_value'])
+            self.assertEqual(
+                1457049599, il.index_info[index]['age']['max_value'])
+    def test_deleted_index_pruned(self):
+        client = self.client()
+        il = curator.IndexList(client, field_stats_cache=self.path)
+        il._get_field_stats_dates(field='timestamp')
+        client.cat.indices.return_value = [
+            {'uuid': 'another_random_uuid_string'}]
+        il = curator.IndexList(client, field_stats_cache=self.path)
+        il._get_field_stats_dates(field='timestamp')
+        self.assertEqual(2, client.msearch.call_count)
+        self.assertEqual(
+            2, len(client.msearch.call_args[1]['body']))
+    def test_unusable_cache(self):
+        client = self.client()
+        il = curator.IndexList(
+            client, field_stats_cache=os.path.join(self.tmpdir, 'no', 'db'))
+        il._get_field_stats_dates(field='timestamp')
+        self.assertEqual(1, client.msearch.call_count)
@@ -24,6 +24,7 @@ class TestIndexListClientAndInit(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('size_in_bytes', 'state')
         self.assertEqual(
             testvars.stats_two['indices']['index-2016.03.03']['total']['store']['size_in_bytes'],
             il.index_info['index-2016.03.03']['size_in_bytes']
@@ -40,6 +41,7 @@ class TestIndexListClientAndInit(TestCase):
         client.cluster.state.return_value = testvars.cs_two_closed
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('state')
         self.assertEqual('close', il.index_info['index-2016.03.03']['state'])
     def test_skip_index_without_creation_date(self):
         client = Mock()
@@ -48,7 +50,125 @@ class TestIndexListClientAndInit(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two_no_cd
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('creation_date')
         self.assertEqual(['index-2016.03.03'], sorted(il.indices))
+    def test_init_fetches_names_only(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        il.filter_by_regex(kind='prefix', value='index-')
+        il.filter_by_age(
+            source='name', direction='older', timestring='%Y.%m.%d',
+            unit='days', unit_count=1
+        )
+        self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+    def test_load_index_info_fetches_each_group_once(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        il.filter_closed()
+        il.filter_empty()
+        il.load_index_info('state', 'docs', 'creation_date')
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertEqual(1, client.indices.stats.call_count)
+    def test_search_pattern(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client, search_pattern='index-*')
+        il.load_index_info('state')
+        client.indices.get_settings.assert_called_with(
+            index='index-*', expand_wildcards='open,closed',
+            filter_path=curator.defaults.settings.index_settings_filter_path()
+        )
+        self.assertEqual(
+            'index-*', client.cluster.state.call_args[1]['index'])
+        il.filter_by_regex(kind='suffix', value='03')
+        il.load_index_info('docs')
+        self.assertEqual(
+            'index-2016.03.03', client.indices.stats.call_args[1]['index'])
+    def test_concurrent_chunks(self):
+        names = ['index-{0:04d}-{1}'.format(num, 'x' * 100) for num in range(200)]
+        def requested(kwargs):
+            return kwargs['index'].split(',')
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = dict(
+            (name, {'settings': {'index': {
+                'creation_date': '1456963200172',
+                'number_of_shards': '1', 'number_of_replicas': '0'}}})
+            for name in names
+        )
+        client.cluster.state.side_effect = lambda **kw: {
+            'metadata': {'indices': dict(
+                (name, {'state': 'open'}) for name in requested(kw)
+            )}
+        }
+        client.indices.stats.side_effect = lambda **kw: {
+            'indices': dict(
+                (name, {'total': {
+                    'store': {'size_in_bytes': int(name[6:10])},
+                    'docs': {'count': 1}}})
+                for name in requested(kw)
+            )
+        }
+        il = curator.IndexList(client, max_concurrent_requests=4)
+        il.load_index_info('size_in_bytes')
+        self.assertTrue(client.indices.stats.call_count > 1)
+        for name in names:
+            self.assertEqual(
+                int(name[6:10]), il.index_info[name]['size_in_bytes'])
+    def test_split_on_413(self):
+        self.addCleanup(curator.set_url_budget, 3072)
+        names = ['index-{0:04d}-{1}'.format(num, 'x' * 100) for num in range(100)]
+        def stats(**kwargs):
+            requested = kwargs['index'].split(',')
+            if len(requested) > 5:
+                raise elasticsearch.TransportError(413, 'too large')
+            return {'indices': dict(
+                (name, {'total': {
+                    'store': {'size_in_bytes': int(name[6:10])},
+                    'docs': {'count': 1}}})
+                for name in requested
+            )}
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = dict(
+            (name, {'settings': {'index': {
+                'creation_date': '1456963200172',
+                'number_of_shards': '1', 'number_of_replicas': '0'}}})
+            for name in names
+        )
+        client.cluster.state.side_effect = lambda **kw: {
+            'metadata': {'indices': dict(
+                (name, {'state': 'open'}) for name in kw['index'].split(',')
+            )}
+        }
+        client.indices.stats.side_effect = stats
+        il = curator.IndexList(client)
+        il.load_index_info('size_in_bytes')
+        for name in names:
+            self.assertEqual(
+                int(name[6:10]), il.index_info[name]['size_in_bytes'])
+        self.assertTrue(len(curator.chunk_index_list(names)[0]) <= 5)
+    def test_load_index_info_invalid_field(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        self.assertRaises(ValueError, il.load_index_info, 'mappings')
 class TestIndexListOtherMethods(TestCase):
     def test_empty_list(self):
         client = Mock()
@@ -66,10 +186,82 @@ class TestIndexListOtherMethods(TestCase):
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
         client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.segments_one
         il = curator.IndexList(client)
         il._get_segment_counts()
         self.assertEqual(71, il.index_info[testvars.named_index]['segments'])
+        self.assertEqual('segments', client.indices.stats.call_args[1]['metric'])
+    def test_removal_keeps_order_and_list_reference(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        il = curator.IndexList(client)
+        names = ['a-2016.03.03', 'b-2016.03.04', 'a-2016.03.05']
+        il.indices = names
+        il.filter_by_regex(kind='prefix', value='b-', exclude=True)
+        self.assertEqual(['a-2016.03.03', 'a-2016.03.05'], il.indices)
+        self.assertIs(names, il.indices)
+    def test_direct_append_is_picked_up(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client)
+        il.indices.append('dummy')
+        self.assertEqual(
+            ['dummy', 'index-2016.03.03', 'index-2016.03.04'],
+            sorted(il.working_list())
+        )
+
+class TestIndexListInventory(TestCase):
+    def test_cat(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_two
+        il = curator.IndexList(client, index_inventory='cat')
+        il.load_index_info('state', 'creation_date', 'size_in_bytes', 'docs')
+        self.assertEqual(
+            ['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertEqual(1456963200, il.index_info['index-2016.03.03']['age']['creation_date'])
+        self.assertEqual(1120891046, il.index_info['index-2016.03.04']['size_in_bytes'])
+        self.assertEqual(3188772, il.index_info['index-2016.03.04']['docs'])
+        self.assertEqual('5', il.index_info['index-2016.03.04']['number_of_shards'])
+        self.assertFalse(client.indices.get_settings.called)
+        self.assertFalse(client.cluster.state.called)
+        self.assertFalse(client.indices.stats.called)
+    def test_cat_closed_falls_back(self):
+        client = Mock()
+        client.cat.indices.return_value = testvars.cat_indices_2_closed
+        client.cluster.state.return_value = testvars.cs_two_closed
+        il = curator.IndexList(client, index_inventory='cat')
+        il.load_index_info('creation_date', 'docs')
+        self.assertEqual('close', il.index_info['index-2016.03.03']['state'])
+        self.assertEqual(1456963200, il.index_info['index-2016.03.03']['age']['creation_date'])
+        self.assertEqual('index-2016.03.03', client.cluster.state.call_args[1]['index'])
+        self.assertFalse(client.indices.stats.called)
+    def test_cluster_state(self):
+        client = Mock()
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        il = curator.IndexList(client, index_inventory='cluster_state')
+        il.load_index_info('state', 'routing', 'docs')
+        self.assertEqual(
+            ['index-2016.03.03','index-2016.03.04'], sorted(il.indices))
+        self.assertEqual(
+            {'allocation': {'include': {'tag': 'bar'}}},
+            il.index_info['index-2016.03.04']['routing']
+        )
+        self.assertEqual(6377544, il.index_info['index-2016.03.04']['docs'])
+        self.assertEqual(1, client.cluster.state.call_count)
+        self.assertFalse(client.indices.get_settings.called)
+    def test_invalid(self):
+        client = Mock()
+        self.assertRaises(
+            curator.ConfigurationError, curator.IndexList, client,
+            index_inventory='mappings'
+        )
 
 class TestIndexListAgeFilterName(TestCase):
     def test_get_name_based_ages_match(self):
@@ -88,6 +280,7 @@ class TestIndexListAgeFilterName(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
         nomatch = curator.IndexList(client)
+        nomatch.load_index_info('creation_date')
         nomatch._get_name_based_ages('%Y-%m-%d')
         self.assertEqual(
             curator.fix_epoch(
@@ -103,21 +296,78 @@ class TestIndexListAgeFilterStatsAPI(TestCase):
         client.indices.get_settings.return_value = testvars.settings_two
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
-        client.search.return_value = testvars.fieldstats_query
+        client.msearch.return_value = {
+            'responses': [testvars.fieldstats_query] * 2}
         il = curator.IndexList(client)
         client.field_stats.return_value = testvars.fieldstats_two
         il._get_field_stats_dates(field='timestamp')
         self.assertNotIn('not_an_index_name', list(il.index_info.keys()))
+        self.assertEqual(1, client.msearch.call_count)
+        self.assertEqual(
+            1456963206, il.index_info['index-2016.03.04']['age']['min_value'])
     def test_get_field_stats_dates_field_not_found(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.indices.get_settings.return_value = testvars.settings_two
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
-        client.search.return_value = {u'aggregations': {u'foo':u'bar'}}
+        client.msearch.return_value = {
+            'responses': [{u'aggregations': {u'foo':u'bar'}}] * 2}
         il = curator.IndexList(client)
         self.assertRaises(
             curator.ActionError, il._get_field_stats_dates, field='not_in_index')
+    def test_get_field_stats_dates_error(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.msearch.return_value = {
+            'responses': [{'error': {'type': 'search_phase_execution_exception'}}] * 2}
+        il = curator.IndexList(client)
+        self.assertRaises(
+            curator.ActionError, il._get_field_stats_dates, field='timestamp')
+    def test_get_field_stats_dates_sort(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.2.4'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        def msearch(body=None):
+            responses = []
+            for header, search in zip(body[::2], body[1::2]):
+                self.assertFalse(search['track_total_hits'])
+                order = search['sort'][0]['timestamp']['order']
+                value = 1456963206189 if order == 'asc' else 1457049599152
+                responses.append({'hits': {'hits': [{'sort': [value]}]}})
+            return {'responses': responses}
+        client.msearch.side_effect = msearch
+        il = curator.IndexList(client, field_stats_mode='sort')
+        il._get_field_stats_dates(field='timestamp')
+        for index in il.indices:
+            self.assertEqual(1456963206, il.index_info[index]['age']['min_value'])
+            self.assertEqual(1457049599, il.index_info[index]['age']['max_value'])
+    def test_get_field_stats_dates_sort_not_found(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.msearch.return_value = {
+            'responses': [{'hits': {'hits': []}}] * 4}
+        il = curator.IndexList(client, field_stats_mode='sort')
+        self.assertRaises(
+            curator.ActionError, il._get_field_stats_dates, field='timestamp')
+        self.assertNotIn(
+            'track_total_hits', client.msearch.call_args[1]['body'][1])
+    def test_invalid_field_stats_mode(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        self.assertRaises(
+            curator.ConfigurationError, curator.IndexList, client,
+            field_stats_mode='minmax'
+        )
 
 class TestIndexListRegexFilters(TestCase):
     def test_filter_by_regex_prefix(self):
@@ -329,6 +579,7 @@ class TestIndexListFilterByAge(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('creation_date')
         il.index_info['index-2016.03.03']['age'].pop('creation_date')
         il.index_info['index-2016.03.04']['age'].pop('creation_date')
         il.filter_by_age(
@@ -353,6 +604,7 @@ class TestIndexListFilterByAge(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('creation_date')
         il.index_info['index-2016.03.03']['age'].pop('creation_date')
         il.index_info['index-2016.03.04']['age'].pop('creation_date')
         il.filter_by_age(
@@ -651,7 +903,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
         client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.segments_one
         il = curator.IndexList(client)
         self.assertRaises(curator.MissingArgument, il.filter_forceMerged)
     def test_filter_forcemerge_positive(self):
@@ -660,7 +912,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
         client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.segments_one
         il = curator.IndexList(client)
         il.filter_forceMerged(max_num_segments=2)
         self.assertEqual([testvars.named_index], il.indices)
@@ -670,7 +922,7 @@ class TestIndexListFilterForceMerged(TestCase):
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
         client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.fm_shards
+        client.indices.stats.return_value = testvars.fm_segments_one
         il = curator.IndexList(client)
         il.filter_forceMerged(max_num_segments=2)
         self.assertEqual([], il.indices)
@@ -812,7 +1064,7 @@ class TestIterateFiltersIndex(TestCase):
         client.indices.get_settings.return_value = testvars.settings_one
         client.cluster.state.return_value = testvars.clu_state_one
         client.indices.stats.return_value = testvars.stats_one
-        client.indices.segments.return_value = testvars.shards
+        client.indices.stats.return_value = testvars.segments_one
         ilo = curator.IndexList(client)
         config = yaml.load(testvars.forcemerge_ft)['actions'][1]
         ilo.iterate_filters(config)
@@ -912,6 +1164,108 @@ class TestIterateFiltersIndex(TestCase):
         ilo.iterate_filters(config)
         self.assertEqual(['index-2016.03.03','index-2016.03.04'], sorted(ilo.indices))
 
+class TestSettingsSnapshot(TestCase):
+    def client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '6.3.0'} }
+        with_ilm = deepcopy(testvars.settings_two)
+        with_ilm['index-2016.03.03']['settings']['index']['lifecycle'] = {'name':'mypolicy'}
+        client.indices.get_settings.return_value = with_ilm
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        return client
+    def test_compact(self):
+        ilo = curator.IndexList(self.client())
+        self.assertEqual(
+            {'name': 'mypolicy'},
+            ilo.index_settings['index-2016.03.03']['lifecycle']
+        )
+        self.assertNotIn('version', ilo.index_settings['index-2016.03.03'])
+    def test_reused(self):
+        client = self.client()
+        ilo = curator.IndexList(client)
+        config = {'filters': [
+            {'filtertype': 'ilm', 'exclude': True},
+            {'filtertype': 'allocated', 'key': 'tag', 'value': 'bar',
+                'allocation_type': 'include', 'exclude': False},
+            {'filtertype': 'age', 'source': 'creation_date', 'direction': 'older',
+                'unit': 'days', 'unit_count': 1},
+        ]}
+        ilo.iterate_filters(config)
+        self.assertEqual(['index-2016.03.04'], ilo.indices)
+        self.assertEqual(1, client.indices.get_settings.call_count)
+        self.assertEqual(
+            'metadata.indices.*.state',
+            client.cluster.state.call_args[1]['filter_path']
+        )
+    def test_refresh_settings(self):
+        client = self.client()
+        ilo = curator.IndexList(client)
+        ilo.refresh_settings()
+        self.assertEqual({}, ilo.index_settings)
+        ilo.filter_ilm()
+        self.assertEqual(2, client.indices.get_settings.call_count)
+        self.assertEqual(['index-2016.03.04'], ilo.indices)
+
+class TestPlanFilters(TestCase):
+    def client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.indices.stats.side_effect = lambda index=None, **kwargs: {
+            'indices': dict(
+                (name, {'total': {'segments': {'count': 50}}})
+                for name in index.split(',')
+            )
+        }
+        return client
+    def test_plan(self):
+        ilo = curator.IndexList(self.client())
+        filters = [
+            {'filtertype': 'forcemerged', 'max_num_segments': 1},
+            {'filtertype': 'count', 'count': 3},
+            {'filtertype': 'age', 'source': 'field_stats', 'field': 'f'},
+            {'filtertype': 'closed'},
+            {'filtertype': 'age', 'source': 'name', 'timestring': '%Y.%m.%d'},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a-'},
+            {'filtertype': 'space', 'disk_space': 1},
+            {'filtertype': 'period'},
+        ]
+        self.assertEqual(
+            [filters[i] for i in [0, 1, 4, 5, 3, 2, 6, 7]],
+            ilo.plan_filters(filters)
+        )
+    def test_default_source_is_name(self):
+        ilo = curator.IndexList(self.client())
+        filters = [
+            {'filtertype': 'closed'},
+            {'filtertype': 'age', 'timestring': '%Y.%m.%d'},
+        ]
+        self.assertEqual(
+            [filters[1], filters[0]], ilo.plan_filters(filters))
+    def test_cheap_filters_first(self):
+        client = self.client()
+        ilo = curator.IndexList(client)
+        ilo.iterate_filters({'filters': [
+            {'filtertype': 'forcemerged', 'max_num_segments': 2},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a-'},
+        ]})
+        self.assertEqual(['a-2016.03.03'], ilo.indices)
+        self.assertEqual(
+            'a-2016.03.03', client.indices.stats.call_args[1]['index'])
+    def test_reorder_disabled(self):
+        client = self.client()
+        ilo = curator.IndexList(client, reorder_filters=False)
+        ilo.iterate_filters({'filters': [
+            {'filtertype': 'forcemerged', 'max_num_segments': 2},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a-'},
+        ]})
+        self.assertEqual(['a-2016.03.03'], ilo.indices)
+        self.assertNotEqual(
+            'a-2016.03.03', client.indices.stats.call_args[1]['index'])
+
 class TestIndexListFilterAlias(TestCase):
     def test_raise(self):
         client = Mock()
@@ -956,6 +1310,51 @@ class TestIndexListFilterAlias(TestCase):
         self.assertEqual(
             sorted([]), sorted(il.indices))
 
+    def test_wildcard(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.indices.get_alias.return_value = {
+            'index-2016.03.03': {'aliases': {'my_alias': {}}},
+            'index-2016.03.04': {'aliases': {}},
+        }
+        il = curator.IndexList(client)
+        il.filter_by_alias(aliases=['my_*'])
+        self.assertEqual(['index-2016.03.03'], il.indices)
+    def test_one_request(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.indices.get_alias.return_value = testvars.settings_2_get_aliases
+        il = curator.IndexList(client)
+        il.filter_by_alias(aliases=['my_alias'])
+        il.filter_by_alias(aliases=['not_my_alias'], exclude=True)
+        self.assertEqual(1, client.indices.get_alias.call_count)
+        self.assertEqual(
+            sorted(list(testvars.settings_two.keys())), sorted(il.indices))
+    def test_apply_alias_actions(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.indices.get_alias.return_value = testvars.settings_2_get_aliases
+        il = curator.IndexList(client)
+        il.load_aliases()
+        il.apply_alias_actions([
+            {'remove': {'index': 'index-2016.03.03', 'alias': 'my_alias'}},
+            {'add': {'index': 'index-2016.03.03', 'alias': 'new_alias'}},
+        ])
+        self.assertEqual({'index-2016.03.04'}, il.alias_indices['my_alias'])
+        self.assertEqual({'new_alias'}, il.index_aliases['index-2016.03.03'])
+        il.refresh_aliases()
+        il.load_aliases()
+        self.assertEqual(2, client.indices.get_alias.call_count)
+
 class TestIndexListFilterCount(TestCase):
     def builder(self):
         self.client = Mock()
@@ -1064,6 +1463,7 @@ class TestIndexListPeriodFilterName(TestCase):
         client.cluster.state.return_value = testvars.clu_state_two
         client.indices.stats.return_value = testvars.stats_two
         il = curator.IndexList(client)
+        il.load_index_info('creation_date')
         il.index_info['index-2016.03.03']['age'].pop('creation_date')
         il.index_info['index-2016.03.04']['age'].pop('creation_date')
         il.filter_period(unit=unit, range_from=range_from, range_to=range_to, 
@@ -0,0 +1,81 @@
+from unittest import TestCase
+from mock import Mock, patch
+import importlib
+import curator
+# Get test variables and constants from a single source
+from . import testvars as testvars
+
+class TestIndexSnapshot(TestCase):
+    def client(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        return client
+    def test_listing_reused(self):
+        client = self.client()
+        snapshot = curator.IndexSnapshot()
+        first = curator.IndexList(client, snapshot=snapshot)
+        first.filter_by_age(source='creation_date', direction='older',
+            unit='days', unit_count=1)
+        second = curator.IndexList(
+            client, search_pattern='index-*', snapshot=snapshot)
+        second.filter_by_age(source='creation_date', direction='older',
+            unit='days', unit_count=1)
+        self.assertEqual(sorted(first.indices), sorted(second.indices))
+        self.assertEqual(1, client.indices.get_settings.call_count)
+        self.assertEqual(1, client.cluster.state.call_count)
+    def test_pattern_from_all(self):
+        snapshot = curator.IndexSnapshot()
+        snapshot.add_listing('_all', ['index-1', 'other-1', 'index-2'])
+        self.assertEqual(['index-1', 'index-2'], snapshot.get_listing('index-*'))
+        self.assertIsNone(snapshot.get_listing('index-*,other-*'))
+    def test_deleted(self):
+        client = self.client()
+        snapshot = curator.IndexSnapshot()
+        first = curator.IndexList(client, snapshot=snapshot)
+        first.mark_deleted(['index-2016.03.03'])
+        second = curator.IndexList(client, snapshot=snapshot)
+        self.assertEqual(['index-2016.03.04'], second.indices)
+        self.assertNotIn('index-2016.03.03', snapshot.index_info)
+    def test_changed(self):
+        client = self.client()
+        snapshot = curator.IndexSnapshot()
+        first = curator.IndexList(client, snapshot=snapshot)
+        first.load_index_info('state')
+        first.mark_changed(['index-2016.03.03'])
+        second = curator.IndexList(client, snapshot=snapshot)
+        second.load_index_info('state')
+        self.assertEqual(2, client.cluster.state.call_count)
+        self.assertEqual(
+            'index-2016.03.03', client.cluster.state.call_args[1]['index'])
+    def test_name_ages_not_shared(self):
+        client = self.client()
+        snapshot = curator.IndexSnapshot()
+        first = curator.IndexList(client, snapshot=snapshot)
+        first._get_name_based_ages('%Y.%m.%d')
+        self.assertIn('name', first.index_info['index-2016.03.03']['age'])
+        second = curator.IndexList(client, snapshot=snapshot)
+        self.assertNotIn('name', second.index_info['index-2016.03.03']['age'])
+    def test_refresh_after_restore(self):
+        client = self.client()
+        client.cluster.state.return_value = testvars.cs_two_closed
+        client.indices.get_settings.return_value = testvars.settings_2_closed
+        snapshot = curator.IndexSnapshot()
+        closed = curator.IndexList(client, snapshot=snapshot)
+        closed.filter_closed(exclude=False)
+        self.assertEqual(['index-2016.03.03'], closed.indices)
+        # The restore opens the closed index again
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.get_settings.return_value = testvars.settings_two
+        restore = {'action': 'restore', 'options': {'repository': 'repo'}}
+        # curator.cli is also the name of the command, so import the module
+        cli = importlib.import_module('curator.cli')
+        with patch.object(cli, 'SnapshotList'), \
+                patch.dict(cli.CLASS_MAP, {'restore': Mock()}):
+            cli.process_action(client, restore, snapshot=snapshot)
+        opened = curator.IndexList(client, snapshot=snapshot)
+        opened.filter_closed()
+        self.assertEqual(
+            ['index-2016.03.03', 'index-2016.03.04'], sorted(opened.indices))
@@ -0,0 +1,62 @@
+from unittest import TestCase
+from mock import Mock
+import curator
+
+class TestNodeTopology(TestCase):
+    def client(self):
+        client = Mock()
+        client.nodes.stats.return_value = {'nodes': {
+            'id_a': {'name': 'node_a', 'fs': {
+                'data': [{'path': '/data'}],
+                'total': {'available_in_bytes': 100}}},
+            'id_b': {'name': 'node_b', 'fs': {
+                'data': [{'path': '/data1'}, {'path': '/data2'}],
+                'total': {'available_in_bytes': 200}}},
+        }}
+        client.nodes.info.return_value = {'nodes': {
+            'id_a': {'name': 'node_a', 'roles': ['data']},
+            'id_b': {'name': 'node_b', 'roles': ['master', 'data']},
+        }}
+        return client
+    def test_read_once(self):
+        client = self.client()
+        topology = curator.NodeTopology(client)
+        self.assertEqual('id_b', topology.node_id('node_b'))
+        self.assertEqual('node_a', topology.name('id_a'))
+        self.assertTrue(topology.single_data_path('id_a'))
+        self.assertFalse(topology.single_data_path('id_b'))
+        self.assertEqual(['master', 'data'], topology.roles('id_b'))
+        self.assertEqual(['data'], topology.roles('id_a'))
+        self.assertEqual(200, topology.available('id_b'))
+        self.assertEqual(1, client.nodes.stats.call_count)
+        self.assertEqual(1, client.nodes.info.call_count)
+    def test_refresh(self):
+        client = self.client()
+        topology = curator.NodeTopology(client)
+        topology.roles('id_a')
+        topology.refresh()
+        self.assertEqual(100, topology.available('id_a'))
+        self.assertEqual(2, client.nodes.stats.call_count)
+        self.assertEqual(1, client.nodes.info.call_count)
+    def test_unknown_node(self):
+        topology = curator.NodeTopology(self.client())
+        self.assertIsNone(topology.node_id('node_c'))
+        self.assertIsNone(topology.name('id_c'))
+    def test_threads_read_once(self):
+        import threading, time
+        client = self.client()
+        stats = client.nodes.stats.return_value
+        def slow_stats(**kwargs):
+            time.sleep(0.01)
+            return stats
+        client.nodes.stats.side_effect = slow_stats
+        topology = curator.NodeTopology(client)
+        threads = [
+            threading.Thread(target=topology.available, args=('id_a',))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, client.nodes.stats.call_count)
@@ -385,7 +385,8 @@ class TestSnapshotListFilterCount(TestCase):
         slo.age_keyfield = 'invalid'
         snaps = slo.snapshots
         slo._sort_by_age(snaps)
-        self.assertEqual(['snapshot-2015.03.01'], slo.snapshots)
+        # Neither snapshot has the age key, so both are removed
+        self.assertEqual([], slo.snapshots)
 
 class TestSnapshotListPeriodFilter(TestCase):
     def test_bad_args(self):
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from unittest import TestCase
-from mock import Mock
+from mock import Mock, patch
 import elasticsearch
 import yaml
 from . import testvars as testvars
@@ -75,6 +75,81 @@ class TestGetVersion(TestCase):
         client.info.return_value = {'version': {'number': '9.9.9-dev'} }
         version = curator.get_version(client)
         self.assertEqual(version, (9,9,9))
+    def test_read_once(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '9.9.9'} }
+        curator.get_version(client)
+        self.assertEqual((9,9,9), curator.get_version(client))
+        self.assertEqual(1, client.info.call_count)
+
+class TestRequestTimeout(TestCase):
+    def test_sets_request_timeout(self):
+        client = curator.get_client(
+            hosts=['127.0.0.1:1'], skip_version_test=True)
+        client.transport.connection_pool.connections[0].perform_request = Mock(
+            return_value=(200, {}, '{}'))
+        curator.set_request_timeout(client, 42)
+        client.indices.get_settings(index='foo')
+        conn = client.transport.connection_pool.connections[0]
+        self.assertEqual(42, conn.perform_request.call_args[1]['timeout'])
+    def test_keeps_own_request_timeout(self):
+        client = curator.get_client(
+            hosts=['127.0.0.1:1'], skip_version_test=True)
+        client.transport.connection_pool.connections[0].perform_request = Mock(
+            return_value=(200, {}, '{}'))
+        curator.set_request_timeout(client, 42)
+        client.indices.get_settings(index='foo', request_timeout=7)
+        conn = client.transport.connection_pool.connections[0]
+        self.assertEqual(7, conn.perform_request.call_args[1]['timeout'])
+
+class TestRequestCache(TestCase):
+    def client(self, **kwargs):
+        client = curator.get_client(
+            hosts=['127.0.0.1:1'], skip_version_test=True, **kwargs)
+        self.conn = client.transport.connection_pool.connections[0]
+        self.conn.perform_request = Mock(return_value=(200, {}, '{}'))
+        return client
+    def test_hit(self):
+        client = self.client()
+        client.nodes.info()
+        client.nodes.info()
+        client.info()
+        client.info()
+        self.assertEqual(2, self.conn.perform_request.call_count)
+        self.assertEqual(
+            {'hits': 2, 'misses': 2}, curator.request_cache_stats(client))
+    def test_params_in_key(self):
+        client = self.client()
+        client.nodes.info()
+        client.nodes.info(metric='os')
+        self.assertEqual(2, self.conn.perform_request.call_count)
+    def test_not_cached(self):
+        client = self.client()
+        client.cluster.health()
+        client.cluster.health()
+        self.assertEqual(2, self.conn.perform_request.call_count)
+    def test_stats_not_cached(self):
+        client = self.client()
+        client.nodes.stats(metric='fs')
+        client.nodes.stats(metric='fs')
+        client.nodes.stats(node_id='id_a', metric='fs')
+        client.nodes.stats(node_id='id_a', metric='fs')
+        self.assertEqual(4, self.conn.perform_request.call_count)
+    def test_write_clears(self):
+        client = self.client()
+        client.nodes.info()
+        client.msearch(body=[{'index': 'foo'}, {}])
+        client.nodes.info()
+        client.indices.put_settings(index='foo', body={})
+        client.nodes.info()
+        self.assertEqual(2, curator.request_cache_stats(client)['misses'])
+    def test_disabled(self):
+        client = self.client(cache_ttl=0)
+        client.info()
+        client.info()
+        self.assertEqual(2, self.conn.perform_request.call_count)
+    def test_no_cache(self):
+        self.assertIsNone(curator.request_cache_stats(Mock()))
 
 class TestIsMasterNode(TestCase):
     def test_positive(self):
@@ -134,6 +209,42 @@ class TestGetIndexTime(TestCase):
                 ]:
             self.assertEqual(dt, curator.get_datetime(text, datestring))
 
+class TestTimestringSearch(TestCase):
+    def test_get_epoch(self):
+        for text, timestring in [
+            ('2014.01.19', '%Y.%m.%d'), ('14.01.19', '%y.%m.%d'),
+            ('2012-12', '%Y-%m'), ('2014-28', '%Y-%W'), ('2014-28', '%Y-%U'),
+            ('20091011121306', '%Y%m%d%H%M%S'), ('2016-03-30t16', '%Y-%m-%dt%H'),
+            ('2016.366', '%Y.%j'), ('2014-42', '%G-%V'), ('2008-52', '%G-%V'),
+            ('2009-01', '%G-%V'), ('2010-01', '%G-%V'), ('2009-53', '%G-%V'),
+            ('2009-53', '%Y-%W'), ('2010-00', '%Y-%U'),
+                ]:
+            self.assertEqual(
+                curator.datetime_to_epoch(
+                    curator.get_datetime(text, timestring)),
+                curator.TimestringSearch(timestring).get_epoch(
+                    'index-{0}-000001'.format(text))
+            )
+    def test_no_match(self):
+        self.assertIsNone(
+            curator.TimestringSearch('%Y.%m.%d').get_epoch('index-2016.03'))
+    def test_unsupported_directive(self):
+        self.assertEqual(
+            1451606400,
+            curator.TimestringSearch('%Y.%m.%j').get_epoch('index-2016.03.001')
+        )
+    def test_invalid_date(self):
+        self.assertRaises(
+            ValueError,
+            curator.TimestringSearch('%Y.%m.%d').get_epoch, 'index-2016.02.30'
+        )
+    def test_shared_results(self):
+        first = curator.TimestringSearch('%Y.%m.%d')
+        epoch = first.get_epoch('index-2016.03.04')
+        second = curator.TimestringSearch('%Y.%m.%d')
+        self.assertEqual(epoch, second.get_epoch('index-2016.03.04'))
+        self.assertIs(first.pattern, second.pattern)
+
 class TestGetDateRegex(TestCase):
     def test_non_escaped(self):
         self.assertEqual(
@@ -191,6 +302,50 @@ class TestChunkIndexList(TestCase):
         self.assertEqual(2, len(curator.chunk_index_list(indices)))
     def test_small_list(self):
         self.assertEqual(1, len(curator.chunk_index_list(['short','list','of','indices'])))
+    def test_empty_list(self):
+        self.assertEqual([], curator.chunk_index_list([]))
+
+class TestIndexChunker(TestCase):
+    names = ['index-{0:03d}'.format(num) for num in range(64)]
+    def limited(self, limit, err):
+        def func(chunk):
+            if len(chunk) > limit:
+                raise err
+            return chunk
+        return func
+    def test_split_within_budget(self):
+        chunker = curator.IndexChunker(url_budget=100)
+        for chunk in chunker.split(self.names):
+            self.assertTrue(len(','.join(chunk)) <= 100)
+        self.assertEqual(
+            self.names, [i for chunk in chunker.split(self.names) for i in chunk])
+    def test_split_on_413(self):
+        chunker = curator.IndexChunker()
+        func = self.limited(10, elasticsearch.TransportError(413, 'too large'))
+        results = chunker.run(self.names, func)
+        self.assertEqual(self.names, [i for chunk in results for i in chunk])
+        self.assertEqual(8, len(results))
+        for chunk in chunker.split(self.names):
+            self.assertTrue(len(chunk) <= 10)
+    def test_split_on_circuit_breaker(self):
+        err = elasticsearch.TransportError(
+            500, 'exception',
+            {'error': {'root_cause': [{'type': 'circuit_breaking_exception'}]}}
+        )
+        chunker = curator.IndexChunker()
+        results = chunker.run(self.names, self.limited(16, err), max_workers=4)
+        self.assertEqual(self.names, [i for chunk in results for i in chunk])
+    def test_other_error(self):
+        chunker = curator.IndexChunker()
+        func = self.limited(10, elasticsearch.TransportError(500, 'boom'))
+        self.assertRaises(
+            elasticsearch.TransportError, chunker.run, self.names, func)
+        self.assertEqual(3072, chunker.url_budget)
+    def test_single_index_too_large(self):
+        chunker = curator.IndexChunker()
+        func = self.limited(0, elasticsearch.TransportError(413, 'too large'))
+        self.assertRaises(
+            elasticsearch.TransportError, chunker.run, self.names, func)
 
 class TestGetIndices(TestCase):
     def test_client_exception(self):
@@ -214,6 +369,99 @@ class TestGetIndices(TestCase):
         client.indices.get_settings.return_value = {}
         self.assertEqual([], curator.get_indices(client))
 
+class TestRegexLiteralPrefix(TestCase):
+    def test_plain(self):
+        self.assertEqual('logstash-', curator.regex_literal_prefix('logstash-'))
+    def test_anchored_with_escapes(self):
+        self.assertEqual(
+            'foo.bar-', curator.regex_literal_prefix(r'^foo\.bar-\d{4}'))
+    def test_optional_last_char(self):
+        self.assertEqual('ab', curator.regex_literal_prefix('abc?d'))
+    def test_alternation(self):
+        self.assertEqual('', curator.regex_literal_prefix('abc|def'))
+
+class TestGetSearchPattern(TestCase):
+    def test_prefix(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logstash-'},
+            {'filtertype': 'age', 'source': 'name'},
+        ]
+        self.assertEqual('logstash-*', curator.get_search_pattern(filters))
+    def test_suffix_after_exclude(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'a',
+             'exclude': True},
+            {'filtertype': 'pattern', 'kind': 'suffix', 'value': '-prod'},
+        ]
+        self.assertEqual('*-prod', curator.get_search_pattern(filters))
+    def test_regex(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'regex', 'value': r'^log-\d+$'}]
+        self.assertEqual('log-*', curator.get_search_pattern(filters))
+    def test_not_leading(self):
+        filters = [
+            {'filtertype': 'count', 'count': 5},
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'logstash-'},
+        ]
+        self.assertEqual('_all', curator.get_search_pattern(filters))
+    def test_timestring(self):
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'timestring',
+             'value': '%Y.%m.%d'}]
+        self.assertEqual('_all', curator.get_search_pattern(filters))
+    def test_no_filters(self):
+        self.assertEqual('_all', curator.get_search_pattern(None))
+
+class TestPopListOptions(TestCase):
+    def test_pop(self):
+        client_args = {'hosts': ['127.0.0.1'], 'index_inventory': 'cat'}
+        self.assertEqual(
+            {'index_inventory': 'cat'}, curator.pop_list_options(client_args))
+        self.assertEqual({'hosts': ['127.0.0.1']}, client_args)
+    def test_pool_size(self):
+        client_args = {'hosts': ['127.0.0.1'], 'max_concurrent_requests': 8}
+        curator.pop_list_options(client_args)
+        self.assertEqual(8, client_args['maxsize'])
+    def test_pool_size_for_merges(self):
+        client_args = {'hosts': ['127.0.0.1']}
+        curator.size_connection_pool(client_args, [{'max_merges_per_node': 2}])
+        self.assertEqual(32, client_args['maxsize'])
+    def test_pool_size_from_actions(self):
+        client_args = {'hosts': ['127.0.0.1'], 'max_concurrent_requests': 4}
+        curator.pop_list_options(client_args)
+        curator.size_connection_pool(client_args, [
+            {'max_concurrent_chunks': 16}, {'max_concurrent_chunks': 2}, {}])
+        self.assertEqual(16, client_args['maxsize'])
+    def test_pool_size_kept(self):
+        client_args = {'hosts': ['127.0.0.1'], 'max_concurrent_requests': 8}
+        curator.pop_list_options(client_args)
+        curator.size_connection_pool(client_args, [{'max_concurrent_chunks': 2}])
+        self.assertEqual(8, client_args['maxsize'])
+
+    def test_url_budget(self):
+        self.addCleanup(curator.set_url_budget, 3072)
+        client_args = {'hosts': ['127.0.0.1'], 'url_budget': 256}
+        self.assertEqual({}, curator.pop_list_options(client_args))
+        self.assertEqual({'hosts': ['127.0.0.1']}, client_args)
+        self.assertEqual(
+            2, len(curator.chunk_index_list(['x' * 200, 'y' * 200])))
+
+class TestConcurrentMap(TestCase):
+    def test_order(self):
+        self.assertEqual(
+            [x * 2 for x in range(50)],
+            curator.concurrent_map(lambda x: x * 2, range(50), max_workers=8)
+        )
+    def test_serial(self):
+        self.assertEqual([], curator.concurrent_map(lambda x: x, [], 4))
+    def test_exception(self):
+        def func(x):
+            if x == 3:
+                raise ValueError('boom')
+            return x
+        self.assertRaises(
+            ValueError, curator.concurrent_map, func, range(10), 4)
+
 class TestCheckVersion(TestCase):
     def test_check_version_(self):
         client = Mock()
@@ -823,6 +1071,152 @@ class TestWaitForIt(TestCase):
                 wait_interval=1, max_wait=1
         )
 
+class TestCompletionWaiter(TestCase):
+    @patch('time.sleep')
+    def test_tasks_listed_once(self, mock_sleep):
+        client = Mock()
+        client.tasks.list.side_effect = [
+            {'nodes': {'node1': {'tasks': {'node1:1': {}, 'node1:2': {}}}}},
+            {'nodes': {'node1': {'tasks': {'node1:2': {}}}}},
+        ]
+        client.tasks.get.return_value = testvars.completed_task
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'task', task_id='node1:1')
+        waiter.add('b', 'task', task_id='node1:2')
+        self.assertEqual([('a', True)], waiter.wait())
+        self.assertEqual(2, client.tasks.list.call_count)
+        self.assertEqual(1, client.tasks.get.call_count)
+        self.assertEqual(testvars.completed_task, waiter.results['a'])
+        self.assertEqual(1, mock_sleep.call_count)
+        self.assertEqual(['b'], list(waiter.pending))
+    def test_health_checked_once(self):
+        client = Mock()
+        client.cluster.health.return_value = testvars.cluster_health
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'replicas')
+        waiter.add('b', 'allocation')
+        self.assertEqual([('a', True), ('b', True)], sorted(waiter))
+        self.assertEqual(1, client.cluster.health.call_count)
+    def test_snapshots_in_one_request(self):
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [
+            {'snapshot': 'one', 'state': 'SUCCESS'},
+            {'snapshot': 'two', 'state': 'PARTIAL'},
+        ]}
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'snapshot', snapshot='one', repository='repo')
+        waiter.add('b', 'snapshot', snapshot='two', repository='repo')
+        self.assertEqual([('a', True), ('b', True)], sorted(waiter.wait()))
+        self.assertEqual(
+            'one,two', client.snapshot.get.call_args[1]['snapshot'])
+    def test_relocations_in_one_request(self):
+        client = Mock()
+        client.cluster.state.return_value = {'routing_table': {'indices': {
+            'one': {'shards': {'0': [{'state': 'STARTED'}]}},
+            'two': {'shards': {'0': [{'state': 'RELOCATING'}]}},
+        }}}
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'relocate', index='one')
+        waiter.add('b', 'relocate', index='two', max_wait=0)
+        self.assertEqual([('a', True), ('b', False)], waiter.wait())
+        self.assertEqual(1, client.cluster.state.call_count)
+    def test_restore_not_yet_recovering(self):
+        client = Mock()
+        client.indices.recovery.return_value = {
+            'index-a': {'shards': [{'stage': 'INDEX'}]}}
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'restore', index_list=['index-a'])
+        waiter.add('b', 'restore', index_list=['index-b'], max_wait=0)
+        self.assertEqual([('b', False)], waiter.wait())
+    def test_relocation_index_missing(self):
+        client = Mock()
+        client.cluster.state.return_value = {'routing_table': {'indices': {
+            'one': {'shards': {'0': [{'state': 'RELOCATING'}]}}}}}
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'relocate', index='one')
+        waiter.add('b', 'relocate', index='two')
+        self.assertRaises(curator.CuratorException, waiter.wait)
+        self.assertEqual(['a'], list(waiter.pending))
+    def test_wait_for_error_in_owner(self):
+        import threading
+        client = Mock()
+        calls = []
+        def state(index=None, **kwargs):
+            calls.append(index)
+            started = 'STARTED' if len(calls) > 2 else 'RELOCATING'
+            tables = {}
+            for name in index.split(','):
+                if name != 'gone':
+                    tables[name] = {'shards': {'0': [{'state': started}]}}
+            return {'routing_table': {'indices': tables}}
+        client.cluster.state.side_effect = state
+        waiter = curator.CompletionWaiter(client, wait_interval=0.01)
+        waiter.add('a', 'relocate', index='one')
+        waiter.add('b', 'relocate', index='gone')
+        results = {}
+        def wait(key):
+            try:
+                results[key] = waiter.wait_for(key)
+            except curator.CuratorException as e:
+                results[key] = e
+        threads = [
+            threading.Thread(target=wait, args=(key,)) for key in ['a', 'b']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(results['a'])
+        self.assertIsInstance(results['b'], curator.CuratorException)
+        self.assertEqual({}, waiter.pending)
+    def test_wait_for_threads(self):
+        import threading
+        client = Mock()
+        client.cluster.state.return_value = {'routing_table': {'indices': {
+            'one': {'shards': {'0': [{'state': 'STARTED'}]}},
+            'two': {'shards': {'0': [{'state': 'STARTED'}]}},
+        }}}
+        waiter = curator.CompletionWaiter(client)
+        waiter.add('a', 'relocate', index='one')
+        waiter.add('b', 'relocate', index='two')
+        results = {}
+        def wait(key):
+            results[key] = waiter.wait_for(key)
+        threads = [
+            threading.Thread(target=wait, args=(key,)) for key in ['a', 'b']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({'a': True, 'b': True}, results)
+        self.assertEqual(1, client.cluster.state.call_count)
+    def test_own_max_wait(self):
+        client = Mock()
+        client.indices.recovery.return_value = testvars.unrecovered_output
+        waiter = curator.CompletionWaiter(client, wait_interval=0.01)
+        waiter.add('a', 'restore', index_list=['index-2015.01.01'])
+        waiter.add(
+            'b', 'restore', index_list=['index-2015.02.01'], max_wait=0.05)
+        self.assertEqual([('b', False)], waiter.wait())
+        self.assertEqual(['a'], list(waiter.pending))
+    @patch('time.sleep')
+    def test_backoff(self, mock_sleep):
+        client = Mock()
+        client.tasks.get.side_effect = [
+            testvars.incomplete_task, testvars.incomplete_task,
+            testvars.incomplete_task, testvars.incomplete_task,
+            testvars.completed_task,
+        ]
+        waiter = curator.CompletionWaiter(client, wait_interval=3)
+        waiter.add('a', 'task', task_id='node1:1')
+        self.assertEqual([('a', True)], waiter.wait())
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        for delay, longest in zip(delays, [1, 2, 3, 3]):
+            self.assertTrue(longest / 2.0 <= delay <= longest)
+    def test_bad_action(self):
+        waiter = curator.CompletionWaiter(Mock())
+        self.assertRaises(
+            curator.ConfigurationError, waiter.add, 'a', 'foo')
+
 class TestDateRange(TestCase):
     def test_bad_unit(self):
         self.assertRaises(curator.ConfigurationError,
@@ -426,6 +426,27 @@ clu_state_four = {
     }
 }
 
+cat_indices_two = [
+    {
+        u'index': u'index-2016.03.03', u'status': u'open',
+        u'creation.date': u'1456963200172', u'pri': u'5', u'rep': u'1',
+        u'docs.count': u'3187481', u'store.size': u'1115219663'
+    },
+    {
+        u'index': u'index-2016.03.04', u'status': u'open',
+        u'creation.date': u'1457049600812', u'pri': u'5', u'rep': u'1',
+        u'docs.count': u'3188772', u'store.size': u'1120891046'
+    },
+]
+cat_indices_2_closed = [
+    {
+        u'index': u'index-2016.03.03', u'status': u'close',
+        u'creation.date': None, u'pri': None, u'rep': None,
+        u'docs.count': None, u'store.size': None
+    },
+    cat_indices_two[1],
+]
+
 stats_one      = {
     u'indices': {
         named_index : {
@@ -600,6 +621,11 @@ shards         = { 'indices': { named_index: { 'shards': {
 fm_shards      = { 'indices': { named_index: { 'shards': {
         '0': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ],
         '1': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ] }}}}
+# The same totals, as index stats for the segments metric
+segments_one   = { 'indices': { named_index: {
+        'total': { 'segments': { 'count': 71 } } }}}
+fm_segments_one = { 'indices': { named_index: {
+        'total': { 'segments': { 'count': 4 } } }}}
 
 loginfo        =    {   "loglevel": "INFO",
                         "logfile": None,